@@ -115,6 +115,30 @@ DATABASES = {
 
 AUTH_USER_MODEL = "accounts.User"
 
+# The first hasher hashes new passwords; older hashes are replaced on the
+# user's next login (src/apps/accounts/hashers.py). With argon2-cffi
+# installed, move Argon2 to the top: it is the cheapest per login.
+PASSWORD_HASHERS = [
+    "src.apps.accounts.hashers.ScryptPasswordHasher",
+    "src.apps.accounts.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+]
+PASSWORD_HASHER_PARAMS = {
+    "scrypt": {"work_factor": 2 ** 14, "block_size": 8, "parallelism": 1},  # 16 MiB
+    "argon2": {"time_cost": 2, "memory_cost": 19 * 1024, "parallelism": 1},  # 19 MiB
+}
+
+# Also open a Django session on login. The API authenticates with JWTs
+# only, so by default login writes no session row.
+AUTH_SESSION_LOGIN = False
+
+# POST /api/accounts/register/bulk/ takes at most this many accounts, so it
+# finishes within a request; larger imports go through manage.py
+# register_users. Their passwords are hashed on this many threads.
+BULK_REGISTRATION_MAX_ACCOUNTS = 100
+BULK_REGISTRATION_HASH_WORKERS = 4
+
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
     {"NAME": "django.contrib.auth.password_validation.MinimumLengthValidator"},
@@ -144,6 +168,13 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# Uploaded logos, profile pictures and resumes are processed after the request
+# (src/apps/accounts/tasks.py). Threads per web process working the queue;
+# 0 leaves it to `manage.py process_media_tasks`.
+MEDIA_TASK_WORKERS = 2
+MEDIA_MAX_IMAGE_SIZE = 2048  # px; larger uploads are scaled down
+MEDIA_THUMBNAIL_SIZE = 256  # px, longest side of the WebP thumbnails
+
 
 # =============================
 # CORS
@@ -158,7 +189,7 @@ CORS_ALLOW_ALL_ORIGINS = True
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "src.apps.accounts.authentication.CachedJWTAuthentication",
     ],
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
@@ -174,8 +205,66 @@ SIMPLE_JWT = {
     "ROTATE_REFRESH_TOKENS": False,
     "BLACKLIST_AFTER_ROTATION": True,
     "AUTH_HEADER_TYPES": ("Bearer",),
+    "TOKEN_REFRESH_SERIALIZER": "src.apps.accounts.serializers.TokenRefreshSerializer",
+}
+
+# Authenticated users and their profiles are cached for this many seconds
+# (src/apps/accounts/authentication.py); 0 loads them on every request.
+AUTH_CACHE_ALIAS = "default"
+AUTH_USER_CACHE_TIMEOUT = 60
+# Longest a process goes without reloading the refresh token blacklist
+# (src/apps/accounts/revocation.py); a shared cache makes revocations
+# visible to every process at once. Prune expired tokens daily with
+# manage.py prune_tokens.
+TOKEN_REVOCATION_SYNC_INTERVAL = 5
+# Blacklist rows this recent are read again on every sync, so one whose
+# transaction commits after a higher id was already seen isn't missed
+TOKEN_REVOCATION_SYNC_WINDOW = 60
+
+
+# =============================
+# CACHES
+# =============================
+
+# Per-process memory by default. With several workers use a shared backend,
+# e.g. {"BACKEND": "django.core.cache.backends.redis.RedisCache",
+#       "LOCATION": "redis://127.0.0.1:6379/1"}, so cache invalidation
+# reaches all of them.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "job-portal",
+    },
 }
 
+JOB_CACHE_ALIAS = "default"  # CACHES entry used for job responses and facets
+JOB_RESPONSE_CACHE_TIMEOUT = 300  # seconds; 0 disables the job list/detail cache
+
+# Serve the job list, detail and facets from async views (src/apps/jobs/async_views.py).
+# Only worth it under an ASGI server, e.g. uvicorn config.asgi:application.
+JOB_ASYNC_VIEWS = False
+
+# Render the job list and detail from values_list() rows instead of model
+# instances and the serializer (src/apps/jobs/fastpath.py). Same JSON; uses
+# orjson when it is installed. Off by default; compare the two paths on your
+# data with manage.py bench_serialization before turning it on.
+JOB_FAST_SERIALIZATION = False
+
+
+# =============================
+# JOB SEARCH
+# =============================
+
+# Dotted path to a backend in src.apps.jobs.search; None picks one from the
+# database vendor (FTS5 on SQLite, tsvector + GIN on PostgreSQL).
+JOB_SEARCH_BACKEND = None
+JOB_SEARCH_CONFIG = "english"  # PostgreSQL text search configuration
+# Same for the applicant resume index (src.apps.jobs.resume_search)
+RESUME_SEARCH_BACKEND = None
+
+# Seconds to cache /api/jobs/facets/ counts per filter combination
+JOB_FACETS_CACHE_TIMEOUT = 60
+
 
 # =============================
 # drf-spectacular (Swagger)
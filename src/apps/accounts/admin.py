@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import User, Company, JobSeeker
+from .models import User, Company, JobSeeker, MediaTask
 from django.contrib.auth.admin import UserAdmin as DjangoUserAdmin
 
 @admin.register(User)
@@ -8,3 +8,8 @@ class UserAdmin(DjangoUserAdmin):
 
 admin.site.register(Company)
 admin.site.register(JobSeeker)
+
+@admin.register(MediaTask)
+class MediaTaskAdmin(admin.ModelAdmin):
+    list_display = ("id", "kind", "object_id", "status", "attempts", "created_at", "finished_at")
+    list_filter = ("status", "kind")
@@ -0,0 +1,84 @@
+"""
+JWT authentication that doesn't hit the database on every request.
+
+The stock ``JWTAuthentication`` loads the ``User`` for each request, and the
+role permissions then load the company or jobseeker profile with a second
+query. ``CachedJWTAuthentication`` loads both in one query (the profiles are
+``select_related``, so ``hasattr(user, 'company_profile')`` is answered
+from memory) and keeps the result in the ``AUTH_CACHE_ALIAS`` cache for
+``AUTH_USER_CACHE_TIMEOUT`` seconds. A warm request authenticates and
+passes its role checks with no queries at all.
+
+Saving or deleting a user or profile, and the media worker updating a
+profile, drop the entry (see ``signals.py``). As with the job response
+cache, a per-process cache only hears about changes made in that process;
+use a shared backend when running several workers, or the timeout bounds
+how long another worker keeps using a changed user.
+"""
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+PROFILE_FIELDS = ("company_profile", "jobseeker_profile")
+
+
+def get_cache():
+    return caches[getattr(settings, "AUTH_CACHE_ALIAS", "default")]
+
+
+def get_timeout():
+    return getattr(settings, "AUTH_USER_CACHE_TIMEOUT", 60)
+
+
+def user_key(user_id):
+    return f"auth:user:{user_id}"
+
+
+def invalidate_user(user_id):
+    get_cache().delete(user_key(user_id))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """``JWTAuthentication`` with the user and profile cached per user id."""
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        user = self.load_user(user_id)
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+
+        return user
+
+    def load_user(self, user_id):
+        timeout = get_timeout()
+        cache = get_cache()
+        key = user_key(user_id)
+        if timeout:
+            user = cache.get(key)
+            if user is not None:
+                return user
+
+        user = (
+            self.user_model.objects
+            .select_related(*PROFILE_FIELDS)
+            .filter(**{api_settings.USER_ID_FIELD: user_id})
+            .first()
+        )
+        if user is not None and timeout:
+            cache.set(key, user, timeout)
+        return user
@@ -0,0 +1,50 @@
+"""
+Password hashers with their cost taken from settings.
+
+Every login pays for one hash, so the hasher decides how many logins a CPU
+can serve. Django's default PBKDF2 (1,000,000 SHA-256 rounds) takes ~0.6 s
+of CPU; scrypt with Django's own parameters (``N=2**14, r=8, p=1``,
+16 MiB) about 80 ms, and Argon2id at OWASP's minimum (19 MiB, 2 passes)
+a small fraction, both while being memory-hard, which PBKDF2 isn't.
+scrypt's ``p`` multiplies the CPU per hash without adding memory
+hardness, so it stays at 1.
+
+The first entry of ``PASSWORD_HASHERS`` hashes new passwords. A stored hash
+made by another listed hasher, or with other parameters, still verifies,
+and ``ModelBackend`` replaces it with a fresh hash on the user's next
+successful login, so changing the strategy needs no migration.
+Parameters come from ``PASSWORD_HASHER_PARAMS[algorithm]``.
+"""
+from django.conf import settings
+from django.contrib.auth import hashers
+
+DEFAULT_PARAMS = {
+    "scrypt": {"work_factor": 2 ** 14, "block_size": 8, "parallelism": 1},
+    "argon2": {"time_cost": 2, "memory_cost": 19 * 1024, "parallelism": 1},
+}
+
+
+def tunable(name):
+    """A hasher attribute read from ``PASSWORD_HASHER_PARAMS`` on each use."""
+    def get(self):
+        params = getattr(settings, "PASSWORD_HASHER_PARAMS", {}).get(self.algorithm, {})
+        return params.get(name, DEFAULT_PARAMS[self.algorithm][name])
+    return property(get)
+
+
+class ScryptPasswordHasher(hashers.ScryptPasswordHasher):
+    work_factor = tunable("work_factor")
+    block_size = tunable("block_size")
+    parallelism = tunable("parallelism")
+
+    @property
+    def maxmem(self):
+        # scrypt needs 128 * N * r bytes; OpenSSL refuses more than 32 MiB unless told
+        return 2 * 128 * self.work_factor * self.block_size
+
+
+class Argon2PasswordHasher(hashers.Argon2PasswordHasher):
+    """Needs ``argon2-cffi``."""
+    time_cost = tunable("time_cost")
+    memory_cost = tunable("memory_cost")
+    parallelism = tunable("parallelism")
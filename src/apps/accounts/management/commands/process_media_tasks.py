@@ -0,0 +1,47 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from src.apps.accounts import tasks
+from src.apps.accounts.models import MediaTask
+
+
+class Command(BaseCommand):
+    help = (
+        "Process queued media tasks (image thumbnails and metadata stripping, resume text). "
+        "Runs until interrupted unless --once is given; any number of these can run at once."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=2, help="Threads claiming tasks")
+        parser.add_argument("--poll", type=float, default=2.0, help="Seconds to sleep when the queue is empty")
+        parser.add_argument("--once", action="store_true", help="Exit once the queue is empty")
+        parser.add_argument("--retry-failed", action="store_true", help="Requeue failed tasks first")
+
+    def handle(self, *args, **options):
+        if options["retry_failed"]:
+            requeued = MediaTask.objects.filter(status="failed").update(status="pending", attempts=0)
+            self.stdout.write(f"Requeued {requeued} failed tasks.")
+
+        def work():
+            done = 0
+            try:
+                while True:
+                    ran = tasks.run_pending()
+                    done += ran
+                    if options["once"]:
+                        return done
+                    if not ran:
+                        time.sleep(options["poll"])
+            finally:
+                connection.close()
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options["workers"]) as pool:
+            done = sum(pool.map(lambda _: work(), range(options["workers"])))
+        self.stdout.write(self.style.SUCCESS(f"Processed {done} tasks in {time.perf_counter() - start:.1f}s."))
+        failed = MediaTask.objects.filter(status="failed").count()
+        if failed:
+            self.stdout.write(self.style.WARNING(f"{failed} tasks have failed; their error is on the MediaTask row."))
@@ -0,0 +1,28 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from src.apps.accounts import revocation
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete expired refresh tokens and their blacklist entries in short batches. "
+        "Run it daily (cron, systemd timer), or leave it running with --every."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000, help="Tokens deleted per transaction")
+        parser.add_argument("--pause", type=float, default=0.1, help="Seconds to sleep between batches")
+        parser.add_argument("--every", type=float, help="Keep running, pruning every this many seconds")
+
+    def handle(self, *args, **options):
+        while True:
+            start = time.perf_counter()
+            deleted = revocation.prune_expired(options["batch_size"], options["pause"])
+            self.stdout.write(self.style.SUCCESS(
+                f"Deleted {deleted} expired tokens in {time.perf_counter() - start:.1f}s."
+            ))
+            if not options["every"]:
+                return
+            time.sleep(options["every"])
@@ -0,0 +1,40 @@
+import csv
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from src.apps.accounts.serializers import BulkUserRegistrationSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Register accounts, with their company or jobseeker profiles, from a CSV file (header "
+        "username,email,password,user_type) or a JSON list of such objects. All rows are created "
+        "in one transaction, or none if any row is invalid."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV or JSON file; '.json' is read as JSON, anything else as CSV")
+
+    def handle(self, *args, **options):
+        with open(options["path"], newline="", encoding="utf-8") as source:
+            if options["path"].endswith(".json"):
+                rows = json.load(source)
+            else:
+                rows = list(csv.DictReader(source))
+
+        start = time.perf_counter()
+        serializer = BulkUserRegistrationSerializer(data=rows, many=True)
+        if not serializer.is_valid():
+            errors = serializer.errors
+            if isinstance(errors, dict):
+                raise CommandError(json.dumps(errors))
+            # Row 1 is the first data row
+            raise CommandError("\n".join(
+                f"row {number}: {json.dumps(error)}" for number, error in enumerate(errors, 1) if error
+            ))
+        users = serializer.save()
+        self.stdout.write(self.style.SUCCESS(
+            f"Registered {len(users)} accounts in {time.perf_counter() - start:.1f}s."
+        ))
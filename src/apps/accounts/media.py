@@ -0,0 +1,200 @@
+"""
+Processing of uploaded profile media, run by the task queue in tasks.py.
+
+* Logos and profile pictures are re-encoded without their metadata (EXIF,
+  GPS, comments) and scaled down to ``MEDIA_MAX_IMAGE_SIZE``; the cleaned
+  file replaces the upload. A WebP thumbnail of at most
+  ``MEDIA_THUMBNAIL_SIZE`` pixels is written next to it.
+* Resumes get their text extracted into ``JobSeeker.resume_text``: plain
+  text and DOCX with the standard library, PDF when ``pypdf`` is installed.
+
+Results are written with a conditional UPDATE on the source file name, so
+a task that finishes after a newer upload throws its output away instead
+of pairing it with the wrong file.
+"""
+import io
+import os
+import re
+import zipfile
+from xml.etree import ElementTree
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.dispatch import Signal
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+from .models import Company, JobSeeker
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # optional; PDF resumes are then left without text
+    PdfReader = None
+
+# Formats kept for cleaned originals; anything else is stored as PNG
+IMAGE_FORMATS = {"JPEG": ".jpg", "PNG": ".png", "WEBP": ".webp", "GIF": ".gif"}
+MAX_RESUME_TEXT = 100_000
+WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+# Sent with ``kind`` and ``object_id`` when derived fields change: cleared
+# for a new upload, or written by the worker. Receivers keep indexes in step.
+media_updated = Signal()
+
+
+class UnsupportedFile(Exception):
+    """The upload can't be processed; retrying won't help."""
+
+
+def get_max_image_size():
+    return getattr(settings, "MEDIA_MAX_IMAGE_SIZE", 2048)
+
+
+def get_thumbnail_size():
+    return getattr(settings, "MEDIA_THUMBNAIL_SIZE", 256)
+
+
+# -- processors ---------------------------------------------------------------
+
+def clean_image(file):
+    """``(cleaned original, WebP thumbnail)`` as ``ContentFile``s for an uploaded image."""
+    try:
+        with file.open("rb"):
+            image = Image.open(file)
+            image.load()
+    except (OSError, SyntaxError, Image.DecompressionBombError) as exc:
+        raise UnsupportedFile(f"not a readable image: {exc}")
+
+    image_format = image.format if image.format in IMAGE_FORMATS else "PNG"
+    icc_profile = image.info.get("icc_profile")
+    # Apply the EXIF orientation before the EXIF block is dropped
+    image = ImageOps.exif_transpose(image)
+    if image.mode not in ("RGB", "RGBA", "L", "LA", "P"):
+        image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+    if image_format == "JPEG" and image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+
+    max_size = get_max_image_size()
+    image.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+    original = io.BytesIO()
+    # Pillow only writes EXIF, XMP and text chunks when asked to
+    options = {"icc_profile": icc_profile} if icc_profile else {}
+    if image_format == "JPEG":
+        options.update(quality=85, optimize=True)
+    image.save(original, image_format, **options)
+
+    thumbnail = image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB")
+    thumbnail_size = get_thumbnail_size()
+    thumbnail.thumbnail((thumbnail_size, thumbnail_size), Image.Resampling.LANCZOS)
+    small = io.BytesIO()
+    thumbnail.save(small, "WEBP", quality=80, method=4)
+
+    stem = os.path.splitext(os.path.basename(file.name))[0]
+    return (
+        ContentFile(original.getvalue(), name=stem + IMAGE_FORMATS[image_format]),
+        ContentFile(small.getvalue(), name=stem + ".webp"),
+    )
+
+
+def extract_text(file):
+    """The text of a resume, with whitespace collapsed."""
+    extension = os.path.splitext(file.name)[1].lower()
+    with file.open("rb"):
+        data = file.read()
+
+    if extension in (".txt", ".md", ".rtf"):
+        text = data.decode("utf-8", errors="replace")
+    elif extension == ".docx":
+        text = _docx_text(data)
+    elif extension == ".pdf":
+        if PdfReader is None:
+            raise UnsupportedFile("PDF text extraction needs pypdf")
+        try:
+            reader = PdfReader(io.BytesIO(data))
+            text = "\n".join(page.extract_text() or "" for page in reader.pages)
+        except Exception as exc:
+            raise UnsupportedFile(f"unreadable PDF: {exc}")
+    else:
+        raise UnsupportedFile(f"no text extractor for {extension or 'files without an extension'}")
+    return re.sub(r"\s+", " ", text).strip()[:MAX_RESUME_TEXT]
+
+
+def _docx_text(data):
+    try:
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            root = ElementTree.fromstring(archive.read("word/document.xml"))
+    except (zipfile.BadZipFile, KeyError, ElementTree.ParseError) as exc:
+        raise UnsupportedFile(f"unreadable DOCX: {exc}")
+    paragraphs = (
+        "".join(node.text or "" for node in paragraph.iter(f"{WORD_NS}t"))
+        for paragraph in root.iter(f"{WORD_NS}p")
+    )
+    return "\n".join(paragraphs)
+
+
+# -- tasks --------------------------------------------------------------------
+
+# kind: (model, uploaded field, derived field)
+KINDS = {
+    "company_logo": (Company, "logo", "logo_thumbnail"),
+    "profile_picture": (JobSeeker, "profile_picture", "profile_picture_thumbnail"),
+    "resume": (JobSeeker, "resume", "resume_text"),
+}
+
+
+def reset_derived(instance, data):
+    """
+    Clear what was derived from the files in ``data`` (validated serializer
+    data) before they replace the current ones, and return the task kinds
+    to queue once they are saved. Stale thumbnails are deleted after commit.
+    """
+    kinds = []
+    for kind, (model, source_field, derived_field) in KINDS.items():
+        if not isinstance(instance, model) or source_field not in data:
+            continue
+        derived = getattr(instance, derived_field)
+        if isinstance(derived, str):
+            setattr(instance, derived_field, "")
+        elif derived:
+            transaction.on_commit(lambda storage=derived.storage, name=derived.name: storage.delete(name))
+            setattr(instance, derived_field, None)
+        if derived:
+            transaction.on_commit(
+                lambda kind=kind, model=model: media_updated.send(sender=model, kind=kind, object_id=instance.pk)
+            )
+        if data[source_field]:
+            kinds.append(kind)
+    return kinds
+
+
+def process(kind, object_id):
+    """Run one task; False if there was nothing (left) to do."""
+    model, source_field, derived_field = KINDS[kind]
+    instance = model.objects.filter(pk=object_id).first()
+    source = getattr(instance, source_field, None)
+    if not source:
+        return False
+
+    source_name = source.name
+    if derived_field == "resume_text":
+        updates = {derived_field: extract_text(source)}
+        new_files, old_files = [], []
+    else:
+        original, thumbnail = clean_image(source)
+        derived = getattr(instance, derived_field)
+        old_files = [name for name in (source_name, derived.name) if name]
+        source.save(original.name, original, save=False)
+        derived.save(thumbnail.name, thumbnail, save=False)
+        updates = {source_field: source.name, derived_field: derived.name}
+        new_files = list(updates.values())
+
+    written = model.objects.filter(pk=object_id, **{source_field: source_name}).update(
+        updated_at=timezone.now(), **updates
+    )
+    # If a newer upload arrived meanwhile, its own task handles it
+    for name in old_files if written else new_files:
+        source.storage.delete(name)
+    if written:
+        media_updated.send(sender=model, kind=kind, object_id=object_id)
+    return bool(written)
@@ -0,0 +1,26 @@
+# Generated by Django 6.0 on 2026-10-18 17:20
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_company_company_info_company_company_size_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='company',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='jobseeker',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
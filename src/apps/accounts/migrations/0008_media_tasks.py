@@ -0,0 +1,45 @@
+# Generated by Django 6.0 on 2026-10-18 18:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_company_jobseeker_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='company',
+            name='logo_thumbnail',
+            field=models.ImageField(blank=True, null=True, upload_to='company_logos/thumbnails/'),
+        ),
+        migrations.AddField(
+            model_name='jobseeker',
+            name='profile_picture_thumbnail',
+            field=models.ImageField(blank=True, null=True, upload_to='profile_pics/thumbnails/'),
+        ),
+        migrations.AddField(
+            model_name='jobseeker',
+            name='resume_text',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.CreateModel(
+            name='MediaTask',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('company_logo', 'Company logo'), ('profile_picture', 'Profile picture'), ('resume', 'Resume')], max_length=20)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], default='pending', max_length=10)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('error', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'id'], name='mediatask_status_idx')],
+            },
+        ),
+    ]
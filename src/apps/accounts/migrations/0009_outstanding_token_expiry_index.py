@@ -0,0 +1,21 @@
+# Generated by Django 6.0 on 2026-10-18 19:10
+
+from django.db import migrations
+
+# simplejwt doesn't index expires_at; prune_tokens looks tokens up by it
+INDEX = "token_blacklist_outstandingtoken_expires_at_idx"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0008_media_tasks'),
+        ('token_blacklist', '0012_alter_outstandingtoken_user'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            f"CREATE INDEX IF NOT EXISTS {INDEX} ON token_blacklist_outstandingtoken (expires_at)",
+            f"DROP INDEX IF EXISTS {INDEX}",
+        ),
+    ]
@@ -2,7 +2,8 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser
 from django.conf import settings
-import uuid
+
+from .ids import new_company_id
 
 class User(AbstractUser):
     USER_TYPE_CHOICES = (
@@ -38,10 +39,13 @@ class Company(models.Model):
     company_info = models.JSONField(blank=True, null=True)   # free JSON for more structured meta
     # assets
     logo = models.ImageField(upload_to="company_logos/", blank=True, null=True)
+    # written by the media worker, see tasks.py
+    logo_thumbnail = models.ImageField(upload_to="company_logos/thumbnails/", blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def save(self, *args, **kwargs):
         if not self.company_id:
-            self.company_id = "CMP-" + uuid.uuid4().hex[:6].upper()
+            self.company_id = new_company_id()
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -64,6 +68,43 @@ class JobSeeker(models.Model):
     # assets
     profile_picture = models.ImageField(upload_to="profile_pics/", blank=True, null=True)
     resume = models.FileField(upload_to="resumes/", blank=True, null=True)
+    # written by the media worker, see tasks.py
+    profile_picture_thumbnail = models.ImageField(upload_to="profile_pics/thumbnails/", blank=True, null=True)
+    resume_text = models.TextField(blank=True, default="")
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.user.username
+
+
+class MediaTask(models.Model):
+    """An uploaded file waiting to be processed; the queue behind tasks.py."""
+    KIND_CHOICES = (
+        ('company_logo', 'Company logo'),
+        ('profile_picture', 'Profile picture'),
+        ('resume', 'Resume'),
+    )
+    STATUS_CHOICES = (
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    )
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    # Company pk for logos, JobSeeker pk otherwise
+    object_id = models.PositiveBigIntegerField()
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            # workers claim the oldest pending task
+            models.Index(fields=["status", "id"], name="mediatask_status_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} #{self.object_id} ({self.status})"
@@ -0,0 +1,179 @@
+"""
+Revoked refresh tokens: a constant-time "is this jti revoked?" check and
+batched pruning of expired tokens.
+
+simplejwt answers the revocation check with a join of ``BlacklistedToken``
+and ``OutstandingToken`` on every refresh, and nothing ever deletes from
+either table. Here each process keeps a Bloom filter of the jtis in the
+blacklist:
+
+* a jti not in the filter is not revoked, with no query at all;
+* a jti in the filter (revoked, or one of ~0.1% false positives) is
+  confirmed against the database, so the answer is always exact.
+
+Blacklisting a token bumps a generation number in the ``AUTH_CACHE_ALIAS``
+cache (see ``signals.py``); a process that sees a new generation loads the
+rows added since its last sync, by id. Ids are allocated before commit, so
+a row can become visible after higher ones: each sync reads again from the
+highest id blacklisted more than ``TOKEN_REVOCATION_SYNC_WINDOW`` seconds
+ago rather than from the highest id seen. Like the other caches, that is only
+immediate with a shared backend, so every process also syncs at least every
+``TOKEN_REVOCATION_SYNC_INTERVAL`` seconds. The filter is rebuilt from
+scratch once an hour, dropping pruned tokens, or when it outgrows its
+capacity.
+
+``prune_expired()`` deletes expired tokens in short transactions of
+``batch_size`` rows (``manage.py prune_tokens``), so the tables stay the
+size of the tokens that can still be used.
+"""
+import hashlib
+import math
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from .authentication import get_cache
+
+GENERATION_KEY = "auth:revoked:generation"
+REBUILD_AFTER = 3600  # seconds
+ERROR_RATE = 0.001
+
+
+def get_sync_interval():
+    return getattr(settings, "TOKEN_REVOCATION_SYNC_INTERVAL", 5)
+
+
+def get_sync_window():
+    return getattr(settings, "TOKEN_REVOCATION_SYNC_WINDOW", 60)
+
+
+def get_generation():
+    cache = get_cache()
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        # From the clock, like the job cache generation, so an evicted key never repeats
+        cache.add(GENERATION_KEY, time.time_ns(), timeout=None)
+        generation = cache.get(GENERATION_KEY)
+    return generation
+
+
+def bump_generation():
+    cache = get_cache()
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        cache.set(GENERATION_KEY, time.time_ns(), timeout=None)
+
+
+class BloomFilter:
+    def __init__(self, capacity, error_rate=ERROR_RATE):
+        self.capacity = max(capacity, 1024)
+        self.size = math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, key):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class RevocationFilter:
+    """The blacklisted jtis of this process, kept in step with the database."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.bloom = None
+        # Every blacklist row up to this id has been loaded
+        self.floor = 0
+        self.generation = None
+        self.synced_at = self.built_at = 0.0
+
+    def is_revoked(self, jti):
+        self.sync()
+        if jti not in self.bloom:
+            return False
+        return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+    def sync(self):
+        generation = get_generation()
+        now = time.monotonic()
+        if generation == self.generation and now - self.synced_at < get_sync_interval():
+            return
+        with self.lock:
+            if self.bloom is None or now - self.built_at > REBUILD_AFTER:
+                self.rebuild(now)
+            else:
+                self.load(self.bloom)
+                if self.bloom.count > self.bloom.capacity:
+                    self.rebuild(now)
+            self.generation, self.synced_at = generation, now
+
+    def rebuild(self, now):
+        bloom = BloomFilter(2 * BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now()).count())
+        self.floor = 0
+        self.load(bloom)
+        self.bloom, self.built_at = bloom, now
+
+    def load(self, bloom):
+        """
+        Add the blacklist rows after ``floor`` to ``bloom``; expired tokens
+        can't be used anyway. The floor only moves past rows older than the
+        sync window, so recent ones are read again until any lower id still
+        uncommitted has had time to appear.
+        """
+        now = timezone.now()
+        settled = now - timedelta(seconds=get_sync_window())
+        rows = (
+            BlacklistedToken.objects.filter(pk__gt=self.floor).order_by("pk")
+            .values_list("pk", "blacklisted_at", "token__jti", "token__expires_at")
+        )
+        for pk, blacklisted_at, jti, expires_at in rows.iterator():
+            if expires_at > now and jti not in bloom:
+                bloom.add(jti)
+            if blacklisted_at < settled:
+                self.floor = pk
+
+
+_filter = RevocationFilter()
+
+
+def is_revoked(jti):
+    return _filter.is_revoked(jti)
+
+
+def prune_expired(batch_size=5000, pause=0.0):
+    """
+    Delete expired outstanding tokens, and their blacklist entries, one
+    transaction of ``batch_size`` tokens at a time; returns the number of
+    tokens deleted. ``pause`` seconds between batches lets other writers in.
+    """
+    deleted = 0
+    now = timezone.now()
+    while True:
+        with transaction.atomic():
+            ids = list(OutstandingToken.objects.filter(expires_at__lte=now).values_list("pk", flat=True)[:batch_size])
+            if not ids:
+                break
+            # Cascades to their blacklist entries
+            OutstandingToken.objects.filter(pk__in=ids).delete()
+        deleted += len(ids)
+        if len(ids) < batch_size:
+            break
+        if pause:
+            time.sleep(pause)
+    return deleted
@@ -1,7 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from rest_framework import serializers
+from django.conf import settings
 from django.contrib.auth import authenticate
-from rest_framework_simplejwt.tokens import RefreshToken
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer as BaseTokenRefreshSerializer
+from .ids import new_company_id
 from .models import User, Company, JobSeeker
+from .tokens import RefreshToken
 
 # -------------------------
 # User Serializer
@@ -11,17 +18,40 @@ class UserSerializer(serializers.ModelSerializer):
         model = User
         fields = ['id', 'username', 'email', 'user_type']
 
+# -------------------------
+# Token Pair Serializer
+# -------------------------
+class TokenPairSerializer(serializers.Serializer):
+    refresh = serializers.CharField()
+    access = serializers.CharField()
+
+
+class TokenRefreshSerializer(BaseTokenRefreshSerializer):
+    # Revocation is checked against the in-memory filter first, see revocation.py
+    token_class = RefreshToken
+
+
+def token_pair(user):
+    """Mint a refresh/access pair for ``user``; views call this once per request."""
+    refresh = RefreshToken.for_user(user)
+    return {
+        'refresh': str(refresh),
+        'access': str(refresh.access_token),
+    }
+
 # -------------------------
 # Registration Serializer
 # -------------------------
 class UserRegistrationSerializer(serializers.ModelSerializer):
     password = serializers.CharField(write_only=True)
-    token = serializers.SerializerMethodField(read_only=True)
+    # Filled in by the view, which mints the only token pair of the request
+    token = TokenPairSerializer(read_only=True)
 
     class Meta:
         model = User
         fields = ['username', 'email', 'password', 'user_type', 'token']
 
+    @transaction.atomic
     def create(self, validated_data):
         # Create user
         user = User.objects.create_user(
@@ -31,7 +61,7 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
             user_type=validated_data['user_type'],
         )
 
-        # Automatically create profile
+        # Automatically create profile, in the same transaction
         if user.user_type == 'company':
             Company.objects.create(user=user, company_name=user.username)
         else:
@@ -39,11 +69,68 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
 
         return user
 
-    def get_token(self, obj) -> dict:
-        refresh = RefreshToken.for_user(obj)
-        return {
-            'refresh': str(refresh),
-            'access': str(refresh.access_token),
+# -------------------------
+# Bulk Registration Serializer
+# -------------------------
+class BulkRegistrationListSerializer(serializers.ListSerializer):
+    """
+    Registers a whole list in one transaction: passwords are hashed in a
+    thread pool, then users and profiles are inserted with ``bulk_create``.
+    Username and email uniqueness is checked with one query each instead of
+    two per row, and also within the list; errors come back per row.
+    """
+
+    def to_internal_value(self, data):
+        rows = super().to_internal_value(data)
+        for row in rows:
+            row['username'] = User.normalize_username(row['username'])
+            row['email'] = User.objects.normalize_email(row['email'])
+
+        errors = [{} for _ in rows]
+        for field, message in (('username', 'A user with that username already exists.'),
+                               ('email', 'user with this email already exists.')):
+            values = [row[field] for row in rows]
+            seen = set(User.objects.filter(**{f'{field}__in': values}).values_list(field, flat=True))
+            for error, value in zip(errors, values):
+                if value in seen:
+                    error[field] = [message]
+                seen.add(value)
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        return rows
+
+    def create(self, validated_data):
+        # scrypt releases the GIL, so hashing runs in parallel; on a bounded
+        # number of threads, as each hash holds 16 MiB
+        workers = getattr(settings, "BULK_REGISTRATION_HASH_WORKERS", 4)
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(validated_data)))) as pool:
+            passwords = list(pool.map(make_password, (row['password'] for row in validated_data)))
+
+        with transaction.atomic():
+            users = User.objects.bulk_create(
+                User(username=row['username'], email=row['email'], user_type=row['user_type'], password=password)
+                for row, password in zip(validated_data, passwords)
+            )
+            # bulk_create skips save(), which would fill in company_id
+            Company.objects.bulk_create(
+                Company(user=user, company_name=user.username, company_id=new_company_id())
+                for user in users if user.user_type == 'company'
+            )
+            JobSeeker.objects.bulk_create(
+                JobSeeker(user=user) for user in users if user.user_type != 'company'
+            )
+        return users
+
+
+class BulkUserRegistrationSerializer(UserRegistrationSerializer):
+    """One row of a bulk registration; uniqueness is checked by the list."""
+
+    class Meta(UserRegistrationSerializer.Meta):
+        fields = ['username', 'email', 'password', 'user_type']
+        list_serializer_class = BulkRegistrationListSerializer
+        extra_kwargs = {
+            'username': {'validators': [User.username_validator]},
+            'email': {'validators': []},
         }
 
 # -------------------------
@@ -52,7 +139,7 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
 class UserLoginSerializer(serializers.Serializer):
     username = serializers.CharField()
     password = serializers.CharField(write_only=True)
-    token = serializers.SerializerMethodField(read_only=True)
+    token = TokenPairSerializer(read_only=True)
     user_type = serializers.CharField(read_only=True)
 
     def validate(self, data):
@@ -66,13 +153,6 @@ class UserLoginSerializer(serializers.Serializer):
             'user_type': user.user_type,
         }
 
-    def get_token(self, obj) -> dict:
-        refresh = RefreshToken.for_user(obj['user'])
-        return {
-            'refresh': str(refresh),
-            'access': str(refresh.access_token),
-        }
-
 # -------------------------
 # Company Serializer
 # -------------------------
@@ -88,9 +168,10 @@ class CompanySerializer(serializers.ModelSerializer):
         fields = [
             "id", "company_id", "company_name", "tagline", "description", "website",
             "email", "phone", "location", "founded", "industry", "company_size",
-            "company_info", "logo", "user"
+            "company_info", "logo", "logo_thumbnail", "user"
         ]
-        read_only_fields = ["id", "company_id", "user"]
+        # logo_thumbnail is null until the media worker has made it
+        read_only_fields = ["id", "company_id", "logo_thumbnail", "user"]
 
 class JobSeekerSerializer(serializers.ModelSerializer):
     user = UserSerializer(read_only=True)
@@ -105,6 +186,6 @@ class JobSeekerSerializer(serializers.ModelSerializer):
         fields = [
             "id", "full_name", "title", "bio", "location",
             "skills", "experience", "education",
-            "profile_picture", "resume", "user"
+            "profile_picture", "profile_picture_thumbnail", "resume", "user"
         ]
-        read_only_fields = ["id", "user"]
\ No newline at end of file
+        read_only_fields = ["id", "profile_picture_thumbnail", "user"]
\ No newline at end of file
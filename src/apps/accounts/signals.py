@@ -0,0 +1,47 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from .authentication import invalidate_user
+from .media import media_updated
+from .models import User, Company, JobSeeker
+from . import revocation
+
+
+# ====================================
+#           AUTH USER CACHE
+# ====================================
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    invalidate_user(instance.pk)
+
+
+@receiver(post_save, sender=Company)
+@receiver(post_delete, sender=Company)
+@receiver(post_save, sender=JobSeeker)
+@receiver(post_delete, sender=JobSeeker)
+def invalidate_cached_profile(sender, instance, **kwargs):
+    # The profile is cached along with its user
+    invalidate_user(instance.user_id)
+
+
+@receiver(media_updated)
+def invalidate_cached_media(sender, kind, object_id, **kwargs):
+    # The media worker writes profiles with a plain UPDATE
+    user_id = sender.objects.filter(pk=object_id).values_list('user_id', flat=True).first()
+    if user_id is not None:
+        invalidate_user(user_id)
+
+
+# ====================================
+#           TOKEN REVOCATION
+# ====================================
+
+@receiver(post_save, sender=BlacklistedToken)
+def announce_revocation(sender, instance, created, **kwargs):
+    # Other processes reload the blacklist when the generation moves
+    if created:
+        transaction.on_commit(revocation.bump_generation)
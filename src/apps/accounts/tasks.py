@@ -0,0 +1,120 @@
+"""
+Database-backed queue for media processing (see media.py).
+
+Profile updates store the upload, add a ``MediaTask`` row and return; no
+image is decoded inside the request. Tasks are worked off by
+
+* a pool of ``MEDIA_TASK_WORKERS`` threads in each web process, woken when
+  the request's transaction commits, and/or
+* ``manage.py process_media_tasks``, a separate worker process that polls
+  the table (set ``MEDIA_TASK_WORKERS = 0`` to leave everything to it).
+
+Any number of workers can share the table: a task is claimed with a
+conditional UPDATE, so exactly one of them runs it, on SQLite and
+PostgreSQL alike. Failures are retried up to ``MAX_ATTEMPTS`` times, and
+tasks left ``running`` by a worker that died are requeued after
+``STALE_AFTER``.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from . import media
+from .models import MediaTask
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 3
+STALE_AFTER = timedelta(minutes=10)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_worker_count():
+    return getattr(settings, "MEDIA_TASK_WORKERS", 2)
+
+
+def enqueue(kinds, object_id):
+    """Queue ``kinds`` (see ``media.KINDS``) for one object and wake the pool on commit."""
+    if not kinds:
+        return []
+    tasks = MediaTask.objects.bulk_create(MediaTask(kind=kind, object_id=object_id) for kind in kinds)
+    transaction.on_commit(wake)
+    return tasks
+
+
+def claim():
+    """Mark the oldest pending task running and return it; None when the queue is empty."""
+    while True:
+        pk = MediaTask.objects.filter(status="pending").order_by("id").values_list("pk", flat=True).first()
+        if pk is None:
+            return None
+        claimed = MediaTask.objects.filter(pk=pk, status="pending").update(
+            status="running", started_at=timezone.now(), attempts=F("attempts") + 1,
+        )
+        if claimed:
+            return MediaTask.objects.get(pk=pk)
+        # Another worker got it first
+
+
+def run(task):
+    try:
+        media.process(task.kind, task.object_id)
+    except Exception as exc:
+        retry = task.attempts < MAX_ATTEMPTS and not isinstance(exc, media.UnsupportedFile)
+        logger.warning("Media task %s failed (attempt %s): %s", task.pk, task.attempts, exc,
+                       exc_info=not isinstance(exc, media.UnsupportedFile))
+        MediaTask.objects.filter(pk=task.pk).update(
+            status="pending" if retry else "failed", error=str(exc), finished_at=timezone.now(),
+        )
+        return False
+    MediaTask.objects.filter(pk=task.pk).update(status="done", error="", finished_at=timezone.now())
+    return True
+
+
+def requeue_stale():
+    return MediaTask.objects.filter(status="running", started_at__lt=timezone.now() - STALE_AFTER).update(
+        status="pending"
+    )
+
+
+def run_pending(limit=None):
+    """Work through the queue in this thread; returns the number of tasks run."""
+    requeue_stale()
+    count = 0
+    while limit is None or count < limit:
+        task = claim()
+        if task is None:
+            break
+        run(task)
+        count += 1
+    return count
+
+
+def wake():
+    """Have the in-process pool drain the queue (no-op with ``MEDIA_TASK_WORKERS = 0``)."""
+    global _pool
+    workers = get_worker_count()
+    if not workers:
+        return
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="media-task")
+    _pool.submit(_drain)
+
+
+def _drain():
+    try:
+        run_pending()
+    except Exception:
+        logger.exception("Media task worker stopped")
+    finally:
+        # Each pool thread has its own connection
+        connection.close()
@@ -1,3 +1,53 @@
-from django.test import TestCase
+import io
+import shutil
+import tempfile
 
-# Create your tests here.
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from PIL import Image
+from rest_framework.test import APIClient
+
+from .authentication import get_cache, user_key
+from .models import Company, JobSeeker, User
+
+
+class MediaReuploadTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings = override_settings(MEDIA_ROOT=media_root, MEDIA_TASK_WORKERS=0)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        self.company_user = User.objects.create_user(
+            username="logo-co", email="logo-co@example.com", password="password", user_type="company",
+        )
+        self.company = Company.objects.create(
+            user=self.company_user, company_name="Logo Co", logo_thumbnail="company_logos/thumbnails/old.webp",
+        )
+        # A jobseeker sharing the company's pk, whose cache entry must survive
+        self.seeker_user = User.objects.create_user(
+            username="logo-seeker", email="logo-seeker@example.com", password="password", user_type="jobseeker",
+        )
+        JobSeeker.objects.create(pk=self.company.pk, user=self.seeker_user)
+
+    def logo(self):
+        upload = io.BytesIO()
+        Image.new("RGB", (32, 32), (200, 80, 120)).save(upload, "PNG")
+        upload.seek(0)
+        upload.name = "logo.png"
+        return upload
+
+    def test_reupload_clears_company_users_cache(self):
+        cache = get_cache()
+        cache.set(user_key(self.company_user.pk), "cached company user")
+        cache.set(user_key(self.seeker_user.pk), "cached seeker user")
+
+        client = APIClient()
+        client.force_authenticate(self.company_user)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = client.patch(reverse("company-profile-update"), {"logo": self.logo()}, format="multipart")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(cache.get(user_key(self.company_user.pk)))
+        self.assertEqual(cache.get(user_key(self.seeker_user.pk)), "cached seeker user")
@@ -1,6 +1,7 @@
 from django.urls import path
 from .views import (
     UserRegistrationView,
+    BulkRegistrationView,
     UserLoginView,
     UserLogoutView,
     UserProfileView,
@@ -12,6 +13,7 @@ from .views import (
 
 urlpatterns = [
     path('register/', UserRegistrationView.as_view(), name='register'),
+    path('register/bulk/', BulkRegistrationView.as_view(), name='register-bulk'),
     path('login/', UserLoginView.as_view(), name='login'),
     path('logout/', UserLogoutView.as_view(), name='logout'),
     path('profile/', UserProfileView.as_view(), name='profile'),
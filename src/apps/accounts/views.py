@@ -1,20 +1,25 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status, permissions,generics
-from django.contrib.auth import login, logout
+from django.conf import settings
+from django.contrib.auth import login, logout, user_logged_in
+from django.db import transaction
 from drf_spectacular.utils import extend_schema
-from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 
 
 from .serializers import (
     UserRegistrationSerializer,
+    BulkUserRegistrationSerializer,
     UserLoginSerializer,
     UserSerializer,
     CompanySerializer,
     JobSeekerSerializer,
+    token_pair,
 )
 from .models import Company, JobSeeker
+from . import media, tasks
+from src.apps.jobs.conditional import ConditionalGetMixin
 
 # -----------------------------
 # USER REGISTER
@@ -30,14 +35,12 @@ class UserRegistrationView(APIView):
     def post(self, request):
         serializer = UserRegistrationSerializer(data=request.data)
         if serializer.is_valid():
-            user = serializer.save()
+            # User, profile and outstanding token are created together or not at all
+            with transaction.atomic():
+                user = serializer.save()
 
-            # JWT token
-            refresh = RefreshToken.for_user(user)
-            token_data = {
-                "refresh": str(refresh),
-                "access": str(refresh.access_token),
-            }
+                # JWT token
+                token_data = token_pair(user)
 
             # Set redirect URL based on user type
             redirect_url = "/company/dashboard" if user.user_type == "company" else "/jobseeker/dashboard"
@@ -54,6 +57,31 @@ class UserRegistrationView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+# -----------------------------
+# BULK REGISTER (ADMIN)
+# -----------------------------
+@extend_schema(
+    tags=["Auth"],
+    request=BulkUserRegistrationSerializer(many=True),
+    responses={201: UserSerializer(many=True)}
+)
+class BulkRegistrationView(APIView):
+    """
+    Register a list of accounts, with their profiles, in one transaction; all
+    or none. At most ``BULK_REGISTRATION_MAX_ACCOUNTS`` per request: use
+    ``manage.py register_users`` for larger imports.
+    """
+    serializer_class = BulkUserRegistrationSerializer
+    permission_classes = [permissions.IsAdminUser]
+
+    def post(self, request):
+        max_accounts = getattr(settings, "BULK_REGISTRATION_MAX_ACCOUNTS", 100)
+        serializer = BulkUserRegistrationSerializer(data=request.data, many=True, max_length=max_accounts)
+        serializer.is_valid(raise_exception=True)
+        users = serializer.save()
+        return Response(UserSerializer(users, many=True).data, status=status.HTTP_201_CREATED)
+
+
 # -----------------------------
 # USER LOGIN
 # -----------------------------
@@ -69,14 +97,14 @@ class UserLoginView(APIView):
         serializer = UserLoginSerializer(data=request.data)
         if serializer.is_valid():
             user = serializer.validated_data['user']
-            login(request, user)
+            if getattr(settings, "AUTH_SESSION_LOGIN", False):
+                login(request, user)
+            else:
+                # No session row; last_login is still recorded
+                user_logged_in.send(sender=user.__class__, request=request, user=user)
 
             # JWT token
-            refresh = RefreshToken.for_user(user)
-            token_data = {
-                "refresh": str(refresh),
-                "access": str(refresh.access_token),
-            }
+            token_data = token_pair(user)
 
             # Base response
             response_data = {
@@ -118,11 +146,22 @@ class UserLogoutView(APIView):
 # USER PROFILE
 # -----------------------------
 @extend_schema(tags=["Profile"])
-class UserProfileView(APIView):
+class UserProfileView(ConditionalGetMixin, APIView):
     serializer_class = UserSerializer
     permission_classes = [permissions.IsAuthenticated]
 
+    def get_conditional_state(self, request):
+        user = request.user
+        profile_name = 'company_profile' if user.user_type == 'company' else 'jobseeker_profile'
+        profile = getattr(user, profile_name, None)
+        if profile is None:
+            return None
+        return profile.updated_at, (user.username, user.email, user.user_type)
+
     def get(self, request):
+        return self.conditional_get(request, self.get_profile)
+
+    def get_profile(self, request):
         user_data = UserSerializer(request.user).data
 
         # Include related company/jobseeker profile
@@ -191,13 +230,18 @@ class CompanyProfileUpdateView(generics.UpdateAPIView):
     parser_classes = [MultiPartParser, FormParser, JSONParser]  # accept files + json
 
     def get_object(self):
-        return self.request.user.company_profile
+        # Not request.user.company_profile: that may come from the auth cache
+        return Company.objects.get(user=self.request.user)
 
     def patch(self, request, *args, **kwargs):
         obj = self.get_object()
         serializer = self.get_serializer(obj, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
-        serializer.save()
+        # Uploads are stored as sent; thumbnails and resume text follow from the task queue
+        with transaction.atomic():
+            kinds = media.reset_derived(obj, serializer.validated_data)
+            serializer.save()
+            tasks.enqueue(kinds, obj.pk)
         return Response({"message": "Company profile updated", "data": serializer.data}, status=status.HTTP_200_OK)
 @extend_schema(tags=["Profile"])
 class JobSeekerProfileUpdateView(generics.UpdateAPIView):
@@ -206,11 +250,15 @@ class JobSeekerProfileUpdateView(generics.UpdateAPIView):
     parser_classes = [MultiPartParser, FormParser, JSONParser]
 
     def get_object(self):
-        return self.request.user.jobseeker_profile
+        return JobSeeker.objects.get(user=self.request.user)
 
     def patch(self, request, *args, **kwargs):
         obj = self.get_object()
         serializer = self.get_serializer(obj, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
-        serializer.save()
+        # Uploads are stored as sent; thumbnails and resume text follow from the task queue
+        with transaction.atomic():
+            kinds = media.reset_derived(obj, serializer.validated_data)
+            serializer.save()
+            tasks.enqueue(kinds, obj.pk)
         return Response({"message": "Jobseeker profile updated", "data": serializer.data}, status=status.HTTP_200_OK)
\ No newline at end of file
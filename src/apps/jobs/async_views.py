@@ -0,0 +1,151 @@
+"""
+Async (ASGI) versions of the public job read endpoints.
+
+With ``JOB_ASYNC_VIEWS = True`` the job list, facets and detail routes are
+served by the views below instead of the DRF views in ``views.py``. Each
+one builds the matching DRF view for the request and reuses everything of
+it that does no I/O: filterset, ordering and search backends, query shape,
+pagination settings and serializer. The queries themselves go through
+Django's async ORM (``acount()``, ``aiterator()``, ``aaggregate()``,
+``aget()``), so a worker waiting on the database keeps serving other
+requests. Authentication, permissions and the cache generation lookups
+keep their sync code and run in a thread via ``sync_to_async``.
+
+Bodies, status codes and headers (``X-Cache``, ``ETag``) match the sync
+views, including the ``values_list()`` fast path of ``fastpath.py``; only
+JSON is rendered. Serve them with an ASGI server
+(``uvicorn config.asgi:application``): under WSGI, Django runs every async
+view in an event loop of its own, which is slower than the sync views.
+"""
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import Http404
+from django.utils.cache import get_conditional_response
+from django.views import View
+from django_filters.rest_framework import DjangoFilterBackend
+from django_filters.utils import translate_validation
+from rest_framework.response import Response
+
+from . import views
+from .cache import get_cache, get_timeout, record
+from .facets import afacet_counts, facet_cache_key
+from .filters import JobSearchFilter
+from .renderers import FastJSONRenderer
+
+
+class AsyncAPIView(View):
+    """
+    Answer GET for ``drf_view_class`` asynchronously.
+
+    ``dispatch`` mirrors ``APIView.dispatch``: the DRF request is
+    authenticated and checked in a thread, then ``handle()`` builds the
+    ``Response``. API exceptions are turned into error responses by the
+    DRF view, exactly as on the sync path.
+    """
+    drf_view_class = None
+    http_method_names = ['get', 'head', 'options']
+
+    async def get(self, request, *args, **kwargs):
+        view = self.drf_view_class(format_kwarg=None)
+        view.renderer_classes = [FastJSONRenderer]
+        view.args, view.kwargs = args, kwargs
+        view.request = drf_request = view.initialize_request(request, *args, **kwargs)
+        view.headers = view.default_response_headers
+        try:
+            await sync_to_async(view.initial)(drf_request, *args, **kwargs)
+            response = await self.handle(view, drf_request)
+        except Exception as exc:
+            response = view.handle_exception(exc)
+
+        response = view.finalize_response(drf_request, response, *args, **kwargs)
+        if isinstance(response, Response):
+            response.render()
+        return response
+
+    async def handle(self, view, request):
+        raise NotImplementedError
+
+    async def cached(self, view, request, handler):
+        """``ResponseCacheMixin.get()`` around the async ``handler``."""
+        timeout = get_timeout()
+        if not timeout:
+            return await handler(view, request)
+
+        cache = get_cache()
+        key = await sync_to_async(view.get_cache_key)(request)
+        data = await cache.aget(key)
+        if data is not None:
+            await sync_to_async(record)("hits")
+            response = Response(data)
+            response["X-Cache"] = "HIT"
+            return response
+
+        await sync_to_async(record)("misses")
+        response = await handler(view, request)
+        if response.status_code == 200:
+            await cache.aset(key, response.data, timeout)
+        response["X-Cache"] = "MISS"
+        return response
+
+
+class JobListView(AsyncAPIView):
+    drf_view_class = views.JobListView
+
+    async def handle(self, view, request):
+        return await self.cached(view, request, self.list)
+
+    async def list(self, view, request):
+        queryset = view.filter_queryset(view.get_queryset())
+        fast = view.fast_serialization()
+        if fast:
+            queryset = view.get_rows(queryset)
+        page = await view.paginator.apaginate_queryset(queryset, request, view)
+        data = view.render_rows(page) if fast else view.get_serializer(page, many=True).data
+        return view.paginator.get_paginated_response(data)
+
+
+class JobFacetsView(AsyncAPIView):
+    drf_view_class = views.JobFacetsView
+
+    async def handle(self, view, request):
+        queryset = view.get_queryset()
+        filterset = DjangoFilterBackend().get_filterset(request, queryset, view)
+        if not filterset.is_valid():
+            raise translate_validation(filterset.errors)
+
+        cache = get_cache()
+        query = request.query_params.get(JobSearchFilter.search_param, '')
+        key = await sync_to_async(facet_cache_key)(filterset, query)
+        facets = await cache.aget(key)
+        if facets is None:
+            facets = await afacet_counts(queryset, request.query_params, view.filterset_class)
+            await cache.aset(key, facets, getattr(settings, 'JOB_FACETS_CACHE_TIMEOUT', 60))
+        return Response({'facets': facets})
+
+
+class JobDetailView(AsyncAPIView):
+    drf_view_class = views.JobDetailView
+
+    async def handle(self, view, request):
+        state = await view.aget_conditional_state(request)
+        if state is None:
+            return await self.cached(view, request, self.retrieve)
+
+        validators = view.get_validators(request, state)
+        response = get_conditional_response(request, **validators)
+        if response is None:
+            response = await self.cached(view, request, self.retrieve)
+        return view.set_validators(response, validators)
+
+    async def retrieve(self, view, request):
+        queryset = view.filter_queryset(view.get_queryset())
+        fast = view.fast_serialization()
+        if fast:
+            queryset = view.get_rows(queryset)
+        lookup_url_kwarg = view.lookup_url_kwarg or view.lookup_field
+        try:
+            job = await queryset.aget(**{view.lookup_field: view.kwargs[lookup_url_kwarg]})
+        except queryset.model.DoesNotExist:
+            raise Http404
+        view.check_object_permissions(request, job)
+        return Response(view.render_rows(job, many=False) if fast else view.get_serializer(job).data)
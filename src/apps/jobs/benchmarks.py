@@ -0,0 +1,49 @@
+"""
+Helpers shared by the query-count and benchmark management commands.
+
+Everything here runs against a throwaway test database so the commands can
+be pointed at a developer checkout without touching ``db.sqlite3``.
+"""
+from contextlib import contextmanager
+
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+@contextmanager
+def scratch_database(verbosity=0, test_name=None):
+    """
+    Create and migrate a test database for the duration of the block.
+
+    ``test_name`` overrides ``TEST["NAME"]``, e.g. to put a SQLite test
+    database in a file so several threads can write to it.
+    """
+    setup_test_environment()
+    old_name = connection.settings_dict["NAME"]
+    test_settings = connection.settings_dict.setdefault("TEST", {})
+    old_test_name = test_settings.get("NAME")
+    if test_name:
+        test_settings["NAME"] = test_name
+    connection.creation.create_test_db(verbosity=verbosity, autoclobber=True)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=verbosity)
+        test_settings["NAME"] = old_test_name
+        teardown_test_environment()
+
+
+def auth_headers(user):
+    """Test-client kwargs carrying a bearer token for ``user``."""
+    access = RefreshToken.for_user(user).access_token
+    return {"HTTP_AUTHORIZATION": f"Bearer {access}"}
+
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not samples:
+        return 0.0
+    index = max(0, min(len(samples) - 1, round(pct / 100 * len(samples)) - 1))
+    return samples[index]
@@ -0,0 +1,152 @@
+"""
+Versioned response cache for the public job endpoints.
+
+Cached listings are keyed on a *generation* number plus the normalized
+request URL. Saving or deleting a ``Job`` or ``Company`` bumps the
+generation once the transaction commits (see ``signals.py``), so every
+listing cached before the change is simply never looked up again and
+expires on its own. Job detail bodies are keyed per pk and deleted
+outright when that job, or its company, changes.
+
+The backend is the ``JOB_CACHE_ALIAS`` entry of ``CACHES`` (locmem unless
+configured otherwise); point it at a shared cache such as Redis when
+running several workers so they see each other's invalidations.
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from rest_framework.response import Response
+
+GENERATION_KEY = "jobs:generation"
+STATS_KEYS = {"hits": "jobs:stats:hits", "misses": "jobs:stats:misses"}
+
+
+def get_cache():
+    return caches[getattr(settings, "JOB_CACHE_ALIAS", "default")]
+
+
+def get_timeout():
+    return getattr(settings, "JOB_RESPONSE_CACHE_TIMEOUT", 300)
+
+
+def get_generation():
+    cache = get_cache()
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        # Seeded from the clock, so a generation evicted from the cache is
+        # never reset to a number whose entries might still be around.
+        cache.add(GENERATION_KEY, time.time_ns(), timeout=None)
+        generation = cache.get(GENERATION_KEY)
+    return generation
+
+
+def bump_generation():
+    """Invalidate every cached listing."""
+    cache = get_cache()
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        cache.set(GENERATION_KEY, time.time_ns(), timeout=None)
+
+
+def detail_key(pk):
+    return f"jobs:detail:{pk}"
+
+
+def invalidate_jobs(job_ids):
+    """Drop cached detail bodies for ``job_ids`` and invalidate every listing."""
+    get_cache().delete_many([detail_key(pk) for pk in job_ids])
+    bump_generation()
+
+
+def listing_key(namespace, request):
+    """
+    Key for a listing request: the generation plus the absolute URL with its
+    query parameters sorted, so ``?a=1&b=2`` and ``?b=2&a=1`` share an entry.
+    Pagination links carry the host, so it is part of the key too.
+    """
+    params = sorted(
+        (name, value)
+        for name, values in request.query_params.lists()
+        for value in values
+        if value != ""
+    )
+    url = request.build_absolute_uri(request.path) + "?" + repr(params)
+    digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return f"jobs:{namespace}:{get_generation()}:{digest}"
+
+
+def record(outcome):
+    cache = get_cache()
+    key = STATS_KEYS[outcome]
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
+
+
+def get_stats():
+    cache = get_cache()
+    values = cache.get_many(STATS_KEYS.values())
+    return {outcome: values.get(key, 0) for outcome, key in STATS_KEYS.items()}
+
+
+def reset_stats():
+    get_cache().delete_many(STATS_KEYS.values())
+
+
+def get_summary():
+    """The generation and counters as served by ``/api/jobs/cache-stats/``."""
+    stats = get_stats()
+    lookups = stats["hits"] + stats["misses"]
+    return {
+        "generation": get_generation(),
+        **stats,
+        "hit_ratio": round(stats["hits"] / lookups, 4) if lookups else 0.0,
+    }
+
+
+def is_shared():
+    """Whether other processes see this cache; per-process counters only count their own process."""
+    return not isinstance(get_cache(), (LocMemCache, DummyCache))
+
+
+class ResponseCacheMixin:
+    """
+    Serve successful GET responses from the job cache.
+
+    The lookup happens in the handler, after authentication and permission
+    checks, and stores ``response.data`` so each hit is only re-rendered.
+    Responses carry ``X-Cache: HIT`` or ``MISS``. Subclasses return the key
+    from ``get_cache_key()``; setting ``JOB_RESPONSE_CACHE_TIMEOUT = 0``
+    turns the cache off.
+    """
+
+    def get_cache_key(self, request):
+        raise NotImplementedError
+
+    def get(self, request, *args, **kwargs):
+        timeout = get_timeout()
+        if not timeout:
+            return super().get(request, *args, **kwargs)
+
+        cache = get_cache()
+        key = self.get_cache_key(request)
+        data = cache.get(key)
+        if data is not None:
+            record("hits")
+            response = Response(data)
+            response["X-Cache"] = "HIT"
+            return response
+
+        record("misses")
+        response = super().get(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(key, response.data, timeout)
+        response["X-Cache"] = "MISS"
+        return response
@@ -0,0 +1,98 @@
+"""
+Canonical values for the small enumerations on ``Job``.
+
+``job_type``, ``experience_level`` and ``remote_policy`` used to be free
+text, so the same value shows up as "Full-time", "full time" or "FT". The
+``canonical_*`` helpers map those variants onto one stored value; they are
+used by the serializer, the filters and the data migration alike.
+"""
+import re
+
+JOB_TYPE_CHOICES = [
+    ("Full-time", "Full-time"),
+    ("Part-time", "Part-time"),
+    ("Contract", "Contract"),
+    ("Internship", "Internship"),
+    ("Temporary", "Temporary"),
+    ("Freelance", "Freelance"),
+]
+
+EXPERIENCE_LEVEL_CHOICES = [
+    ("Entry", "Entry"),
+    ("Junior", "Junior"),
+    ("Mid-level", "Mid-level"),
+    ("Senior", "Senior"),
+    ("Lead", "Lead"),
+    ("Executive", "Executive"),
+]
+
+REMOTE_POLICY_CHOICES = [
+    ("On-site", "On-site"),
+    ("Hybrid", "Hybrid"),
+    ("Remote", "Remote"),
+]
+
+JOB_TYPE_ALIASES = {
+    "fulltime": "Full-time", "ft": "Full-time", "permanent": "Full-time",
+    "parttime": "Part-time", "pt": "Part-time",
+    "contract": "Contract", "contractor": "Contract", "fixedterm": "Contract",
+    "internship": "Internship", "intern": "Internship", "trainee": "Internship",
+    "temporary": "Temporary", "temp": "Temporary", "seasonal": "Temporary",
+    "freelance": "Freelance", "freelancer": "Freelance", "gig": "Freelance",
+}
+
+EXPERIENCE_LEVEL_ALIASES = {
+    "entry": "Entry", "entrylevel": "Entry", "graduate": "Entry", "fresher": "Entry",
+    "junior": "Junior", "jr": "Junior",
+    "mid": "Mid-level", "midlevel": "Mid-level", "intermediate": "Mid-level", "midsenior": "Mid-level",
+    "senior": "Senior", "sr": "Senior",
+    "lead": "Lead", "principal": "Lead", "staff": "Lead",
+    "executive": "Executive", "director": "Executive", "head": "Executive",
+}
+
+# Remote policies are often descriptive ("Hybrid (3 days in office)"), so
+# they are matched on keywords, most specific first.
+REMOTE_POLICY_KEYWORDS = [
+    ("hybrid", "Hybrid"),
+    ("flexible", "Hybrid"),
+    ("remote", "Remote"),
+    ("wfh", "Remote"),
+    ("workfromhome", "Remote"),
+    ("onsite", "On-site"),
+    ("office", "On-site"),
+    ("inperson", "On-site"),
+]
+
+
+def _key(value):
+    return re.sub(r"[^a-z]", "", str(value).lower())
+
+
+def canonical_job_type(value):
+    """Return the canonical job type for ``value``, or None if unrecognised."""
+    if not value:
+        return None
+    return JOB_TYPE_ALIASES.get(_key(value))
+
+
+def canonical_experience_level(value):
+    if not value:
+        return None
+    key = _key(value)
+    if key in EXPERIENCE_LEVEL_ALIASES:
+        return EXPERIENCE_LEVEL_ALIASES[key]
+    # "Senior Engineer", "Mid level (3-5 years)"
+    for alias in sorted(EXPERIENCE_LEVEL_ALIASES, key=len, reverse=True):
+        if len(alias) > 2 and key.startswith(alias):
+            return EXPERIENCE_LEVEL_ALIASES[alias]
+    return None
+
+
+def canonical_remote_policy(value):
+    if not value:
+        return None
+    key = _key(value)
+    for keyword, canonical in REMOTE_POLICY_KEYWORDS:
+        if keyword in key:
+            return canonical
+    return None
@@ -0,0 +1,99 @@
+"""
+Conditional GET (ETag / Last-Modified) for polled endpoints.
+
+A view describes its current state with ``get_conditional_state()``: the
+latest ``updated_at`` among the rows it renders plus anything else that
+changes the body (row count, user fields). That costs one aggregate query.
+When the client's ``If-None-Match`` / ``If-Modified-Since`` still match,
+the view answers 304 before any serializer runs.
+"""
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+class ConditionalGetMixin:
+    """
+    Answer GETs with 304 Not Modified when nothing the body depends on has
+    changed. By default the state is taken from ``get_queryset()`` (narrowed
+    to the looked-up object on detail views): ``Max()`` of every field in
+    ``last_modified_fields`` and the row count, so deletions change the
+    ETag too.
+    """
+    last_modified_fields = ('updated_at',)
+
+    def _lookup_kwarg(self):
+        return getattr(self, 'lookup_url_kwarg', None) or getattr(self, 'lookup_field', None)
+
+    def get_conditional_queryset(self):
+        queryset = self.get_queryset()
+        if self._lookup_kwarg() in self.kwargs:
+            queryset = queryset.filter(**{self.lookup_field: self.kwargs[self._lookup_kwarg()]})
+        return queryset
+
+    def get_conditional_state(self, request):
+        """
+        Return ``(last_modified, version)`` for the response, or None to skip
+        conditional handling (e.g. when the object doesn't exist).
+        """
+        state = self.get_conditional_queryset().order_by().aggregate(**self._conditional_aggregates())
+        return self._conditional_state(state)
+
+    async def aget_conditional_state(self, request):
+        """``get_conditional_state()`` for async views (see ``async_views.py``)."""
+        state = await self.get_conditional_queryset().order_by().aaggregate(**self._conditional_aggregates())
+        return self._conditional_state(state)
+
+    def _conditional_aggregates(self):
+        aggregates = {f'max_{i}': Max(field) for i, field in enumerate(self.last_modified_fields)}
+        return {'rows': Count('pk'), **aggregates}
+
+    def _conditional_state(self, state):
+        if not state['rows'] and self._lookup_kwarg() in self.kwargs:
+            return None
+        stamps = [value for name, value in state.items() if name.startswith('max_') and value is not None]
+        return max(stamps, default=None), state['rows']
+
+    def get_etag(self, request, last_modified, version):
+        params = sorted(request.query_params.lists())
+        renderer = getattr(request, 'accepted_renderer', None)
+        parts = [
+            request.path, repr(params), getattr(renderer, 'format', ''),
+            str(request.user.pk), last_modified.isoformat() if last_modified else '', repr(version),
+        ]
+        # Weak: the same state can render to bytes that differ (e.g. key order)
+        return 'W/' + quote_etag(hashlib.sha1('|'.join(parts).encode('utf-8')).hexdigest())
+
+    def get(self, request, *args, **kwargs):
+        return self.conditional_get(request, super().get, *args, **kwargs)
+
+    def conditional_get(self, request, handler, *args, **kwargs):
+        """
+        Call ``handler`` unless the client's copy is current. Views that
+        define their own ``get()`` call this from it.
+        """
+        state = self.get_conditional_state(request)
+        if state is None:
+            return handler(request, *args, **kwargs)
+
+        validators = self.get_validators(request, state)
+        response = get_conditional_response(request, **validators)
+        if response is None:
+            response = handler(request, *args, **kwargs)
+        return self.set_validators(response, validators)
+
+    def get_validators(self, request, state):
+        last_modified, version = state
+        return {
+            'etag': self.get_etag(request, last_modified, version),
+            'last_modified': int(last_modified.timestamp()) if last_modified else None,
+        }
+
+    def set_validators(self, response, validators):
+        if response.status_code in (200, 304):
+            response['ETag'] = validators['etag']
+            if validators['last_modified'] is not None:
+                response['Last-Modified'] = http_date(validators['last_modified'])
+        return response
@@ -0,0 +1,117 @@
+"""
+Facet counts for the job search page.
+
+``facet_counts`` answers "how many matching jobs have each job_type,
+experience_level, remote_policy, location and urgent value" with a single
+UNION ALL of GROUP BY queries. Each facet is counted with every filter
+applied except its own, so while ``?job_type=Full-time`` is selected the
+job_type facet still shows what picking another type would return.
+"""
+import hashlib
+import json
+
+from django.db.models import CharField, Count, F, Value
+from django.db.models.functions import Cast
+
+from .cache import get_generation
+from .search import get_search_backend, parse_terms
+
+# facet -> the query parameters that filter on it
+FACETS = {
+    "job_type": ("job_type",),
+    "experience_level": ("experience_level",),
+    "remote_policy": ("remote_policy", "remote"),
+    "location": ("location",),
+    "urgent": ("urgent",),
+}
+
+# Free-text facets (location) only report their most common values
+FACET_LIMIT = 20
+
+
+def facet_cache_key(filterset, query):
+    """
+    Cache key for the facets of a validated ``filterset`` and search ``query``.
+
+    Built from the cleaned filter values, so parameter order, spelling
+    variants of enum values ("FT", "full time") and unrelated parameters
+    like ``page`` or ``ordering`` all share one entry. The cache generation
+    is part of the key, so any job or company change invalidates it.
+    """
+    items = []
+    for name, value in sorted(filterset.form.cleaned_data.items()):
+        if value in (None, "", []):
+            continue
+        canonicalize = getattr(filterset.filters[name], "canonicalize", None)
+        if canonicalize is not None:
+            value = sorted({canonical for canonical in map(canonicalize, value) if canonical})
+        items.append((name, value))
+    items.append(("search", parse_terms(query)))
+    digest = hashlib.sha1(json.dumps(items, default=str).encode("utf-8")).hexdigest()
+    return f"jobs:facets:{get_generation()}:{digest}"
+
+
+def facet_counts(queryset, params, filterset_class, search_param="search"):
+    """
+    Return ``{facet: [{"value": ..., "count": ...}, ...]}`` for the jobs in
+    ``queryset`` that match ``params`` (a QueryDict of list filters).
+
+    Choice and boolean facets list every value, zero counts included, in
+    declaration order; other facets list their top ``FACET_LIMIT`` values.
+    """
+    query = facet_query(queryset, params, filterset_class, search_param)
+    return collect_facets(queryset.model, query)
+
+
+async def afacet_counts(queryset, params, filterset_class, search_param="search"):
+    """``facet_counts()`` through the async ORM."""
+    query = facet_query(queryset, params, filterset_class, search_param)
+    return collect_facets(queryset.model, [row async for row in query])
+
+
+def facet_query(queryset, params, filterset_class, search_param="search"):
+    """The one UNION ALL query of ``(facet, value, count)`` rows behind ``facet_counts()``."""
+    query = params.get(search_param, "")
+    backend = get_search_backend() if query.strip() else None
+    model = queryset.model
+
+    branches = []
+    for facet, own_params in FACETS.items():
+        data = params.copy()
+        for name in own_params:
+            data.pop(name, None)
+        branch = filterset_class(data, queryset=queryset).qs
+        if backend is not None:
+            branch = backend.search(branch, query)
+        # Text columns are grouped as they are so an index on them can be used;
+        # the rest are cast so every branch of the UNION has the same columns.
+        value = F(facet) if isinstance(model._meta.get_field(facet), CharField) else Cast(facet, CharField())
+        branches.append(
+            branch.order_by()
+            .annotate(facet=Value(facet, output_field=CharField()), value=value)
+            .values("facet", "value")
+            .annotate(count=Count("pk"))
+        )
+
+    return branches[0].union(*branches[1:], all=True)
+
+
+def collect_facets(model, rows):
+    counts = {facet: {} for facet in FACETS}
+    for row in rows:
+        field = model._meta.get_field(row["facet"])
+        if row["value"] in (None, ""):
+            continue
+        counts[row["facet"]][field.to_python(row["value"])] = row["count"]
+
+    facets = {}
+    for facet, values in counts.items():
+        field = model._meta.get_field(facet)
+        if field.choices:
+            keys = [value for value, _ in field.flatchoices]
+        elif field.get_internal_type() == "BooleanField":
+            keys = [True, False]
+        else:
+            keys = sorted(values, key=lambda value: (-values[value], value))[:FACET_LIMIT]
+        facets[facet] = [{"value": key, "count": values.get(key, 0)} for key in keys]
+    return facets
@@ -0,0 +1,276 @@
+"""
+Serialization straight from ``values_list()`` rows for read-only endpoints.
+
+A ``ModelSerializer`` turns each row into a model instance, then walks its
+fields one by one: ``get_attribute()`` down every dotted source, a
+``to_representation()`` call per value and an ordered dict per row. For a
+page of 50 jobs that is most of the request.
+
+``compile_plan()`` does the walk once per serializer class and field
+selection instead. Each field becomes a ``values_list()`` lookup
+(``company.user.username`` -> ``company__user__username``) plus, where the
+value isn't already what DRF would output, a converter: ISO dates and
+times, and numeric decimals, are formatted directly, anything else by the
+field's own ``to_representation``. Strings, integers, booleans and JSON
+are copied as they come from the database. Rendering a row is then
+``dict(zip(...))`` and a handful of calls, with output identical to the
+serializer's.
+
+Only plain model-backed fields compile. ``SerializerMethodField``s, custom
+``to_representation()`` overrides and sources that aren't columns raise
+``ImproperlyConfigured`` when the plan is built, so a serializer that
+outgrows the fast path fails loudly rather than rendering something else.
+
+Views opt in with ``FastSerializationMixin``, and the deployment with
+``JOB_FAST_SERIALIZATION = True``; until then they render through the
+serializer.
+"""
+import datetime
+from functools import lru_cache, partial
+from operator import itemgetter
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db import models
+from django.shortcuts import get_object_or_404
+from rest_framework import ISO_8601, serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from .renderers import FastJSONRenderer
+
+# DRF field -> model fields whose database values it outputs unchanged
+PASSTHROUGH = [
+    (serializers.ChoiceField, None),  # see _converter()
+    (serializers.CharField, (models.CharField, models.TextField)),
+    (serializers.IntegerField, (models.IntegerField,)),
+    (serializers.FloatField, (models.FloatField,)),
+    (serializers.BooleanField, (models.BooleanField,)),
+    (serializers.JSONField, (models.JSONField,)),
+]
+
+
+class RowPlan:
+    """
+    How to render ``values_list(*columns)`` rows as the serializer would.
+
+    ``columns`` starts with the lookups of the rendered fields; callers may
+    append more (e.g. pagination keys), which are ignored. ``converters``
+    holds ``(name, bind)`` pairs: ``bind()`` returns the function applied
+    to non-null values, once per call so per-request state such as the
+    current time zone is looked up once per page rather than per value.
+    """
+
+    def __init__(self, names, columns, indexes, converters):
+        self.names = names
+        self.columns = columns
+        self.converters = converters
+        # Fields sharing a column read it from the same position
+        self.getter = None if indexes == list(range(len(names))) else itemgetter(*indexes)
+        if self.getter is not None and len(indexes) == 1:
+            self.getter = lambda row, index=indexes[0]: (row[index],)
+
+    def render(self, row):
+        return self.render_many([row])[0]
+
+    def render_many(self, rows):
+        names, getter = self.names, self.getter
+        converters = [(name, bind()) for name, bind in self.converters]
+        items = []
+        for row in rows:
+            item = dict(zip(names, row if getter is None else getter(row)))
+            for name, convert in converters:
+                value = item[name]
+                if value is not None:
+                    item[name] = convert(value)
+            items.append(item)
+        return items
+
+
+def compile_plan(serializer_class, field_names=None):
+    """The ``RowPlan`` for ``serializer_class`` limited to ``field_names`` (all when None)."""
+    return _compile(serializer_class, None if field_names is None else tuple(field_names))
+
+
+@lru_cache(maxsize=None)
+def _compile(serializer_class, field_names):
+    if serializer_class.to_representation is not serializers.Serializer.to_representation:
+        raise ImproperlyConfigured(f"{serializer_class.__name__} overrides to_representation()")
+    serializer = serializer_class(fields=field_names) if field_names is not None else serializer_class()
+    model = serializer_class.Meta.model
+
+    names, columns, indexes, converters, errors = [], [], [], [], []
+    for field in serializer._readable_fields:
+        try:
+            lookup, model_field = _resolve(model, field)
+        except ImproperlyConfigured as exc:
+            errors.append(f"{field.field_name}: {exc}")
+            continue
+        if lookup not in columns:
+            columns.append(lookup)
+        names.append(field.field_name)
+        indexes.append(columns.index(lookup))
+        convert = _converter(field, model_field)
+        if convert is not None:
+            converters.append((field.field_name, convert))
+
+    if errors:
+        raise ImproperlyConfigured(
+            f"{serializer_class.__name__} can't be rendered from rows: " + "; ".join(errors)
+        )
+    return RowPlan(names, columns, indexes, converters)
+
+
+def _resolve(model, field):
+    """``(values_list lookup, model field)`` for a serializer field."""
+    if isinstance(field, serializers.SerializerMethodField):
+        raise ImproperlyConfigured("method fields need the instance")
+    if type(field).get_attribute is not serializers.Field.get_attribute or field.source == "*":
+        raise ImproperlyConfigured("custom attribute lookup")
+
+    model_field = None
+    for attr in field.source_attrs:
+        if model_field is not None:
+            if not model_field.is_relation or model_field.many_to_many or model_field.one_to_many:
+                raise ImproperlyConfigured(f"{field.source} doesn't follow single-valued relations")
+            model = model_field.related_model
+        try:
+            model_field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            raise ImproperlyConfigured(f"{field.source} isn't a column")
+    if model_field is None or model_field.is_relation or not model_field.concrete:
+        raise ImproperlyConfigured(f"{field.source} isn't a column")
+    return "__".join(field.source_attrs), model_field
+
+
+def _converter(field, model_field):
+    """None when the database value is already the output, else a ``bind()`` (see ``RowPlan``)."""
+    for field_class, model_classes in PASSTHROUGH:
+        if not isinstance(field, field_class):
+            continue
+        if not _stock(field, field_class):
+            break
+        if field_class is serializers.ChoiceField:
+            # Stored choices map to themselves; anything else goes through DRF
+            identity = all(key == value for key, value in field.choice_strings_to_values.items())
+            if identity and isinstance(model_field, (models.CharField, models.TextField)):
+                return None
+        elif isinstance(model_field, model_classes):
+            return None
+        break
+
+    if _stock(field, serializers.DateTimeField) and isinstance(model_field, models.DateTimeField):
+        if _is_iso(field, api_settings.DATETIME_FORMAT):
+            return partial(_bind_datetime, field)
+    elif _stock(field, serializers.DateField) and type(model_field) is models.DateField:
+        if _is_iso(field, api_settings.DATE_FORMAT):
+            return lambda: datetime.date.isoformat
+    elif _stock(field, serializers.DecimalField) and isinstance(model_field, models.DecimalField):
+        # The quantized Decimal is rendered as a float; the stored value
+        # already has no more places than the field, so quantizing is a no-op
+        if not field.coerce_to_string and field.decimal_places is not None and (
+            model_field.decimal_places <= field.decimal_places and model_field.max_digits <= (field.max_digits or 0)
+        ):
+            return lambda: float
+    return lambda: field.to_representation
+
+
+def _stock(field, field_class):
+    """``field`` is a ``field_class`` rendering values with DRF's own code."""
+    return isinstance(field, field_class) and type(field).to_representation is field_class.to_representation
+
+
+def _is_iso(field, default):
+    output_format = getattr(field, "format", default)
+    return output_format is not None and output_format.lower() == ISO_8601
+
+
+def _bind_datetime(field):
+    """``DateTimeField.to_representation`` with the time zone resolved once."""
+    zone = field.timezone if hasattr(field, "timezone") else field.default_timezone()
+    if zone is None:
+        return field.to_representation
+
+    def convert(value):
+        if value.utcoffset() is None:
+            return field.to_representation(value)
+        try:
+            text = value.astimezone(zone).isoformat()
+        except OverflowError:
+            return field.to_representation(value)
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+    return convert
+
+
+def get_key_columns(view):
+    """Columns pagination reads from a row: the pk and any cursor ordering field."""
+    model = view.get_serializer_class().Meta.model
+    concrete = {field.name for field in model._meta.concrete_fields}
+    names = [model._meta.pk.name, *(getattr(view, "ordering_fields", None) or ())]
+    cursor_class = getattr(view.pagination_class, "cursor_pagination_class", None)
+    if cursor_class is not None:
+        names += [name.lstrip("-") for name in cursor_class.ordering]
+    return [name for name in dict.fromkeys(names) if name in concrete]
+
+
+class FastSerializationMixin:
+    """
+    Render GET responses of a list or detail view from ``values_list()``
+    rows through a compiled ``RowPlan``, and JSON with ``FastJSONRenderer``.
+
+    The rows are named tuples, so pagination cursors are built as usual.
+    Object permissions are checked against the row too: only opt in views
+    whose permission classes don't need the model instance. Honors the
+    field selection of ``SparseFieldsMixin``.
+    """
+
+    def fast_serialization(self):
+        return (
+            getattr(settings, "JOB_FAST_SERIALIZATION", False)
+            and self.request is not None
+            and self.request.method in ("GET", "HEAD")
+        )
+
+    def get_row_plan(self):
+        field_names = self.get_field_names() if hasattr(self, "get_field_names") else None
+        return compile_plan(self.get_serializer_class(), field_names)
+
+    def get_rows(self, queryset):
+        """``queryset`` as the rows ``get_row_plan()`` renders."""
+        plan = self.get_row_plan()
+        extra = [name for name in get_key_columns(self) if name not in plan.columns]
+        return queryset.values_list(*plan.columns, *extra, named=True)
+
+    def render_rows(self, rows, many=True):
+        plan = self.get_row_plan()
+        return plan.render_many(rows) if many else plan.render(rows)
+
+    def get_renderers(self):
+        renderers = super().get_renderers()
+        return [
+            FastJSONRenderer() if type(renderer) is JSONRenderer else renderer
+            for renderer in renderers
+        ]
+
+    def list(self, request, *args, **kwargs):
+        if not self.fast_serialization():
+            return super().list(request, *args, **kwargs)
+        rows = self.get_rows(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(self.render_rows(page))
+        return Response(self.render_rows(rows))
+
+    def retrieve(self, request, *args, **kwargs):
+        if not self.fast_serialization():
+            return super().retrieve(request, *args, **kwargs)
+        return Response(self.render_rows(self.get_row(), many=False))
+
+    def get_row(self):
+        """``get_object()`` for rows."""
+        queryset = self.filter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        row = get_object_or_404(self.get_rows(queryset), **{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        self.check_object_permissions(self.request, row)
+        return row
@@ -0,0 +1,28 @@
+"""
+Job feed format shared by the ``import_jobs`` and ``export_jobs`` commands.
+
+A feed is JSONL (one job object per line) or CSV with one column per
+field. In CSV, the JSON document fields (requirements, benefits, ...) are
+JSON text and empty cells mean "not given". Rows are keyed on
+``external_id``, the job's id in the company's own system, so re-importing
+a feed updates the jobs instead of duplicating them.
+"""
+from django.db.models import Q
+
+from src.apps.accounts.models import Company
+
+FEED_FIELDS = [
+    "external_id", "title", "description", "salary", "location", "job_type", "posted",
+    "requirements", "responsibilities", "benefits", "company_info", "saved", "urgent",
+    "application_deadline", "remote_policy", "experience_level", "education",
+]
+JSON_FIELDS = {"requirements", "responsibilities", "benefits", "company_info"}
+
+
+def get_company(value):
+    """The company whose ``company_id`` or user's username is ``value``."""
+    return Company.objects.get(Q(company_id=value) | Q(user__username=value))
+
+
+def feed_format(path, requested=None):
+    return requested or ("csv" if path.endswith(".csv") else "jsonl")
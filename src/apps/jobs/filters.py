@@ -1,13 +1,74 @@
 import django_filters
-from .models import Job
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import F, Q
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend, OrderingFilter
+from rest_framework.settings import api_settings
+from .choices import canonical_job_type, canonical_experience_level, canonical_remote_policy
+from .matching import normalize_skill, normalize_skills, with_skills
+from .models import Job, JobSkill
+from .search import get_search_backend
+
+class CanonicalChoiceInFilter(django_filters.BaseInFilter, django_filters.CharFilter):
+    """
+    Comma-separated exact match on an enum column (``?job_type=Full-time,Contract``).
+
+    Each value is canonicalised first, so ``full time`` or ``FT`` still hit
+    the index on the stored ``Full-time``.
+    """
+
+    def __init__(self, *args, canonicalize, **kwargs):
+        kwargs.setdefault('lookup_expr', 'in')
+        super().__init__(*args, **kwargs)
+        self.canonicalize = canonicalize
+
+    def filter(self, qs, value):
+        if not value:
+            return qs
+        values = sorted({canonical for canonical in map(self.canonicalize, value) if canonical})
+        if not values:
+            return qs.none()
+        if len(values) == 1:
+            return self.get_method(qs)(**{self.field_name: values[0]})
+        return self.get_method(qs)(**{f'{self.field_name}__in': values})
+
+
+class SkillFilter(django_filters.BaseInFilter, django_filters.CharFilter):
+    """
+    Comma-separated skills (``?skills=python,django``) matched through the
+    JobSkill index (see matching.py): jobs with every skill, or with any of
+    them when ``match_all`` is off.
+    """
+    canonicalize = staticmethod(normalize_skill)
+
+    def __init__(self, *args, match_all=True, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.match_all = match_all
+
+    def filter(self, qs, value):
+        if not value:
+            return qs
+        names = normalize_skills(value)
+        if not names:
+            return qs.none()
+        return qs.filter(pk__in=with_skills(JobSkill.objects, 'job', names, self.match_all))
+
 
 class JobFilter(django_filters.FilterSet):
-    min_salary = django_filters.CharFilter(field_name='salary', lookup_expr='icontains')
+    # A job matches when its salary range overlaps [min_salary, max_salary];
+    # open-ended ranges ("from $100k", "up to $80k") are unbounded on that side
+    min_salary = django_filters.NumberFilter(method='filter_min_salary')
+    max_salary = django_filters.NumberFilter(method='filter_max_salary')
+    salary_currency = django_filters.CharFilter(field_name='salary_currency', lookup_expr='iexact')
+    salary_period = django_filters.ChoiceFilter(field_name='salary_period', choices=Job.SALARY_PERIOD_CHOICES)
     location = django_filters.CharFilter(field_name='location', lookup_expr='icontains')
-    job_type = django_filters.CharFilter(field_name='job_type', lookup_expr='icontains')
-    experience_level = django_filters.CharFilter(field_name='experience_level', lookup_expr='icontains')
-    remote = django_filters.CharFilter(field_name='remote_policy', lookup_expr='icontains')
+    job_type = CanonicalChoiceInFilter(field_name='job_type', canonicalize=canonical_job_type)
+    experience_level = CanonicalChoiceInFilter(field_name='experience_level', canonicalize=canonical_experience_level)
+    remote_policy = CanonicalChoiceInFilter(field_name='remote_policy', canonicalize=canonical_remote_policy)
+    remote = CanonicalChoiceInFilter(field_name='remote_policy', canonicalize=canonical_remote_policy)
     urgent = django_filters.BooleanFilter(field_name='urgent')
+    skills = SkillFilter(help_text='Jobs requiring all of these skills, comma-separated')
+    skills_any = SkillFilter(match_all=False, help_text='Jobs requiring any of these skills, comma-separated')
     
     # Filter by date ranges
     posted_after = django_filters.DateFilter(field_name='posted', lookup_expr='gte')
@@ -20,4 +81,88 @@ class JobFilter(django_filters.FilterSet):
         fields = [
             'job_type', 'location', 'experience_level', 
             'education', 'urgent', 'remote_policy'
-        ]
\ No newline at end of file
+        ]
+
+    def filter_min_salary(self, queryset, name, value):
+        return queryset.filter(Q(salary_max__gte=value) | Q(salary_max__isnull=True, salary_min__isnull=False))
+
+    def filter_max_salary(self, queryset, name, value):
+        return queryset.filter(Q(salary_min__lte=value) | Q(salary_min__isnull=True, salary_max__isnull=False))
+
+
+class AliasedOrderingFilter(OrderingFilter):
+    """
+    OrderingFilter that maps public names onto columns via the view's
+    ``ordering_aliases`` (e.g. ``salary`` -> ``salary_min``) and always puts
+    NULLs last, matching the keyset pagination order.
+    """
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if not ordering:
+            return ordering
+        aliases = getattr(view, 'ordering_aliases', {})
+        return [
+            ('-' if field.startswith('-') else '') + aliases.get(field.lstrip('-'), field.lstrip('-'))
+            for field in ordering
+        ]
+
+    def filter_queryset(self, request, queryset, view):
+        ordering = self.get_ordering(request, queryset, view)
+        if not ordering:
+            return queryset
+        return queryset.order_by(*[self.nulls_last(queryset.model, field) for field in ordering])
+
+    @staticmethod
+    def nulls_last(model, field):
+        name = field.lstrip('-')
+        try:
+            nullable = model._meta.get_field(name).null
+        except FieldDoesNotExist:
+            nullable = False
+        # A plain ORDER BY on NOT NULL columns keeps it matchable to an index.
+        if not nullable:
+            return field
+        return F(name).desc(nulls_last=True) if field.startswith('-') else F(name).asc(nulls_last=True)
+
+
+class JobSearchFilter(BaseFilterBackend):
+    """
+    Full-text ``?search=`` backed by the configured search backend.
+
+    Results are ranked by relevance unless the client asks for an explicit
+    ``?ordering=``, so keep this after ``OrderingFilter`` in filter_backends.
+    Keyset pages can't follow the rank, so ranked search in cursor mode is
+    rejected.
+    """
+    search_param = api_settings.SEARCH_PARAM
+    ordering_param = api_settings.ORDERING_PARAM
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, '')
+        if not query.strip():
+            return queryset
+
+        queryset = get_search_backend().search(queryset, query)
+        if not request.query_params.get(self.ordering_param):
+            paginator = getattr(view, 'paginator', None)
+            if getattr(paginator, 'wants_cursor', None) and paginator.wants_cursor(request):
+                raise ValidationError({self.search_param: [
+                    'Results ranked by relevance are paged by number; '
+                    'with pagination=cursor give an ordering as well.'
+                ]})
+            queryset = queryset.order_by('search_rank', *getattr(view, 'ordering', []))
+        return queryset
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': self.search_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Full-text search over title, description, location and company name. '
+                               'Terms are prefix-matched and all must match. Results are best match '
+                               'first unless `ordering` is given, which `pagination=cursor` requires.',
+                'schema': {'type': 'string'},
+            },
+        ]
@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from src.apps.jobs.cache import invalidate_jobs
+from src.apps.jobs.models import Job
+from src.apps.jobs.salary import parse_salary
+
+SALARY_FIELDS = ["salary_min", "salary_max", "salary_currency", "salary_period"]
+
+
+class Command(BaseCommand):
+    help = "Parse Job.salary into the numeric salary columns, in primary-key batches"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--only-missing", action="store_true",
+                            help="Skip jobs whose salary_min/salary_max are already set")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        queryset = Job.objects.exclude(salary__isnull=True).exclude(salary="")
+        if options["only_missing"]:
+            queryset = queryset.filter(salary_min__isnull=True, salary_max__isnull=True)
+
+        last_pk = 0
+        processed = parsed = 0
+        while True:
+            rows = list(
+                queryset.filter(pk__gt=last_pk).order_by("pk").values_list("pk", "salary")[:batch_size]
+            )
+            if not rows:
+                break
+            last_pk = rows[-1][0]
+
+            jobs = []
+            for pk, salary in rows:
+                salary_range = parse_salary(salary)
+                if salary_range.salary_min is not None or salary_range.salary_max is not None:
+                    parsed += 1
+                jobs.append(Job(pk=pk, **salary_range._asdict()))
+
+            # bulk_update skips Job.save() and the search-index signals, which
+            # don't depend on salary anyway; cached responses do.
+            with transaction.atomic():
+                Job.objects.bulk_update(jobs, SALARY_FIELDS)
+            invalidate_jobs([pk for pk, _ in rows])
+            processed += len(rows)
+            self.stdout.write(f"Processed {processed} jobs (last id {last_pk})")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Backfill complete: {parsed} of {processed} salaries parsed into numeric ranges."
+        ))
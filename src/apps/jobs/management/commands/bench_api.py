@@ -0,0 +1,333 @@
+import io
+import itertools
+import json
+import platform
+import random
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import django
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count
+from django.test import Client, override_settings
+from django.test.client import BOUNDARY, MULTIPART_CONTENT, encode_multipart
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from PIL import Image
+
+from src.apps.accounts import urls as accounts_urls
+from src.apps.accounts.serializers import token_pair
+from src.apps.jobs import urls as jobs_urls
+from src.apps.jobs.benchmarks import auth_headers, percentile, scratch_database
+from src.apps.jobs.models import Job, Application
+from src.apps.jobs.synthetic import SYNTHETIC_PASSWORD, generate, make_job
+
+# Metrics compared by --compare; a rise beyond the threshold is a regression
+COMPARED_METRICS = ("p95_ms", "queries", "peak_alloc_kib")
+
+
+class Fixture:
+    """The users and rows the scenarios act on, picked from the generated dataset."""
+
+    def __init__(self, dataset, seed):
+        self.rng = random.Random(seed)
+        self.counter = itertools.count()
+        # Zipf rank 1: the company with the most jobs
+        self.company = dataset.companies[0]
+        self.company_user = dataset.company_users[0]
+        self.own_job = Job.objects.filter(company=self.company).order_by("-applicants_count").first()
+        self.viral_job = Job.objects.order_by("-applicants_count").first()
+        self.application = Application.objects.filter(job__company=self.company).first()
+        busiest = (
+            Application.objects.values("jobseeker").order_by()
+            .annotate(rows=Count("id")).order_by("-rows").values_list("jobseeker", flat=True).first()
+        )
+        self.seeker = next((s for s in dataset.jobseekers if s.pk == busiest), dataset.jobseekers[0])
+        self.seeker_user = self.seeker.user
+        self.admin_user = get_user_model().objects.create_user(
+            username="bench-admin", email="bench-admin@example.com", password=SYNTHETIC_PASSWORD,
+            user_type="company", is_staff=True,
+        )
+        self.headers = {}
+
+    def auth(self, who):
+        if who is None:
+            return {}
+        user = {"company": self.company_user, "admin": self.admin_user}.get(who, self.seeker_user)
+        if user.pk not in self.headers:
+            self.headers[user.pk] = auth_headers(user)
+        return self.headers[user.pk]
+
+    def refresh_token(self):
+        if not hasattr(self, "_refresh_token"):
+            self._refresh_token = token_pair(self.seeker_user)["refresh"]
+        return self._refresh_token
+
+    def unique(self):
+        return next(self.counter)
+
+    def fresh_job(self):
+        job = make_job(self.rng, self.company)
+        job.save()
+        return job
+
+    def photo(self):
+        """A camera-sized JPEG upload."""
+        upload = io.BytesIO()
+        Image.new("RGB", (2400, 1600), (self.rng.randrange(256), 80, 120)).save(upload, "JPEG", quality=90)
+        upload.seek(0)
+        upload.name = f"photo-{self.unique()}.jpg"
+        return upload
+
+
+def scenario(route, method="get", who=None, kwargs=None, body=None, params=None, label=None, multipart=False):
+    """
+    One benchmarked request. ``kwargs``, ``body`` and ``params`` may be
+    callables taking the ``Fixture``; they run before each request, untimed.
+    ``multipart`` sends the body as a form upload instead of JSON.
+    """
+    return {"route": route, "label": label or route, "method": method, "who": who,
+            "kwargs": kwargs, "body": body, "params": params, "multipart": multipart}
+
+
+SCENARIOS = [
+    # -- jobs -----------------------------------------------------------------
+    scenario("job-list"),
+    scenario("job-list", params={"fields": "full"}, label="job-list[full]"),
+    scenario("job-list", params={"search": "python developer"}, label="job-list[search]"),
+    scenario("job-list", params={"job_type": "Full-time", "ordering": "-salary"}, label="job-list[filter+order]"),
+    scenario("job-list", params={"pagination": "cursor"}, label="job-list[cursor]"),
+    scenario("job-list", params={"page": 50}, label="job-list[page=50]"),
+    scenario("job-list", params={"skills": "python,django"}, label="job-list[skills]"),
+    scenario("job-facets", params={"search": "python"}),
+    scenario("job-recommendations", who="seeker"),
+    scenario("job-cache-stats", who="admin"),
+    scenario("job-detail", who="seeker", kwargs=lambda fx: {"pk": fx.viral_job.pk}),
+    scenario("company-job-list", who="company"),
+    scenario("company-job-create", "post", who="company",
+             body={"title": "Benchmark posting", "description": "Created by bench_api",
+                   "salary": "$90k - $120k", "job_type": "Full-time"}),
+    scenario("company-job-detail", who="company", kwargs=lambda fx: {"pk": fx.own_job.pk}),
+    scenario("company-job-update", "patch", who="company", kwargs=lambda fx: {"pk": fx.own_job.pk},
+             body=lambda fx: {"title": f"Updated posting {fx.unique()}"}),
+    scenario("company-job-delete", "delete", who="company", kwargs=lambda fx: {"pk": fx.fresh_job().pk}),
+    scenario("talent-search", who="company", params={"skills": "python,django"}),
+    scenario("talent-search", who="company", params={"skills": "python,django,aws", "match": "any"},
+             label="talent-search[any]"),
+    scenario("apply-job", "post", who="seeker",
+             body=lambda fx: {"job": fx.fresh_job().pk, "cover_letter": "Benchmark application"}),
+    scenario("application-list", who="company"),
+    scenario("application-list", who="company", params=lambda fx: {"job": fx.viral_job.pk, "status": "Pending"},
+             label="application-list[viral job]"),
+    scenario("application-list", who="company", params=lambda fx: {"job": fx.own_job.pk, "ordering": "-match_score"},
+             label="application-list[best match]"),
+    scenario("applicant-search", who="company", params={"search": "django aws"}),
+    scenario("applicant-search", who="company", params=lambda fx: {"search": "python", "job": fx.viral_job.pk},
+             label="applicant-search[viral job]"),
+    scenario("application-export", who="company"),
+    scenario("application-export", who="company", params={"format": "csv"}, label="application-export[csv]"),
+    scenario("application-update", "patch", who="company", kwargs=lambda fx: {"pk": fx.application.pk},
+             body={"status": "Reviewed"}),
+    scenario("application-bulk-update", "post", who="company",
+             body=lambda fx: {"filter": {"job": fx.own_job.pk},
+                              "status": "Reviewed" if fx.unique() % 2 else "Rejected"}),
+    scenario("my-applications", who="seeker"),
+    # -- accounts -------------------------------------------------------------
+    scenario("register", "post",
+             body=lambda fx: {"username": f"bench-{fx.unique()}", "email": f"bench-{fx.unique()}@example.com",
+                              "password": SYNTHETIC_PASSWORD, "user_type": "jobseeker"}),
+    scenario("register-bulk", "post", who="admin",
+             body=lambda fx: [{"username": f"bulk-{n}", "email": f"bulk-{n}@example.com",
+                               "password": SYNTHETIC_PASSWORD, "user_type": ("jobseeker", "company")[n % 2]}
+                              for n in (fx.unique() for _ in range(5))]),
+    scenario("login", "post", body=lambda fx: {"username": fx.company_user.username, "password": SYNTHETIC_PASSWORD}),
+    scenario("token_refresh", "post", body=lambda fx: {"refresh": fx.refresh_token()}),
+    scenario("logout", "post", who="seeker"),
+    scenario("profile", who="company"),
+    scenario("company-profile", who="company"),
+    scenario("company-profile-update", "patch", who="company", body=lambda fx: {"tagline": f"Tagline {fx.unique()}"}),
+    scenario("company-profile-update", "patch", who="company", body=lambda fx: {"logo": fx.photo()},
+             label="company-profile-update[logo]", multipart=True),
+    scenario("jobseeker-profile", who="seeker"),
+    scenario("jobseeker-profile-update", "patch", who="seeker", body=lambda fx: {"bio": f"Bio {fx.unique()}"}),
+    scenario("jobseeker-profile-update", "patch", who="seeker", body=lambda fx: {"profile_picture": fx.photo()},
+             label="jobseeker-profile-update[picture]", multipart=True),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a synthetic dataset in a scratch database, drive every jobs/accounts route "
+        "through the test client and write latency percentiles, query counts and peak "
+        "allocations as a JSON report"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--companies", type=int, default=50)
+        parser.add_argument("--jobseekers", type=int, default=2000)
+        parser.add_argument("--jobs", type=int, default=5000)
+        parser.add_argument("--applications", type=int, default=20000)
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--requests", type=int, default=20, help="Timed requests per scenario")
+        parser.add_argument("--warmup", type=int, default=2)
+        parser.add_argument("--only", nargs="*", help="Run only scenarios with these labels")
+        parser.add_argument("--with-cache", action="store_true",
+                            help="Keep the job response and facet caches on (off by default so views are measured)")
+        parser.add_argument("--output", help="Write the JSON report here")
+        parser.add_argument("--compare", help="Earlier report to compare against")
+        parser.add_argument("--threshold", type=float, default=0.25,
+                            help="Relative increase counted as a regression (default 0.25)")
+
+    def handle(self, *args, **options):
+        uncovered = self.uncovered_routes()
+        for name in uncovered:
+            self.stderr.write(self.style.WARNING(f"No benchmark scenario for route '{name}'"))
+
+        scenarios = [s for s in SCENARIOS if not options["only"] or s["label"] in options["only"]]
+        cache_settings = {} if options["with_cache"] else {
+            "JOB_RESPONSE_CACHE_TIMEOUT": 0, "JOB_FACETS_CACHE_TIMEOUT": 0,
+        }
+        dataset_options = {key: options[key] for key in ("companies", "jobseekers", "jobs", "applications", "seed")}
+        # Uploads go to a throwaway directory and stay queued: the media
+        # worker's time isn't part of the request.
+        media_settings = {"MEDIA_ROOT": tempfile.mkdtemp(prefix="bench-api-media-"), "MEDIA_TASK_WORKERS": 0}
+
+        with scratch_database(), override_settings(**cache_settings, **media_settings):
+            start = time.perf_counter()
+            dataset = generate(**dataset_options)
+            self.stdout.write(f"Generated dataset in {time.perf_counter() - start:.1f}s")
+            fixture = Fixture(dataset, options["seed"])
+            routes = {}
+            for spec in scenarios:
+                routes[spec["label"]] = result = self.run_scenario(spec, fixture, options["requests"], options["warmup"])
+                self.stdout.write(
+                    f"{spec['label']:<30} {result['status']:>3} p50={result['p50_ms']:>7.1f}ms "
+                    f"p95={result['p95_ms']:>7.1f}ms p99={result['p99_ms']:>7.1f}ms "
+                    f"queries={result['queries']:>3} peak={result['peak_alloc_kib']:>8.1f}KiB"
+                )
+
+        report = {
+            "meta": {
+                "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "git_commit": self.git_commit(),
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "database": connection.vendor,
+                "dataset": dataset_options,
+                "requests": options["requests"],
+                "response_cache": options["with_cache"],
+            },
+            "routes": routes,
+            "uncovered": uncovered,
+        }
+        if options["output"]:
+            with open(options["output"], "w") as output:
+                json.dump(report, output, indent=2, sort_keys=True)
+            self.stdout.write(self.style.SUCCESS(f"Report written to {options['output']}"))
+
+        if options["compare"]:
+            self.compare(options["compare"], report, options["threshold"])
+
+    def uncovered_routes(self):
+        covered = {spec["route"] for spec in SCENARIOS}
+        names = [pattern.name for pattern in jobs_urls.urlpatterns + accounts_urls.urlpatterns]
+        return [name for name in names if name and name not in covered]
+
+    def build_request(self, spec, fixture):
+        """Resolve the scenario's callables into ``(path, payload, headers)``."""
+        def resolve(value):
+            return value(fixture) if callable(value) else value
+
+        path = reverse(spec["route"], kwargs=resolve(spec["kwargs"]))
+        payload = resolve(spec["params"]) if spec["method"] == "get" else resolve(spec["body"])
+        return path, payload or {}, fixture.auth(spec["who"])
+
+    def send(self, client, spec, path, payload, headers):
+        """The response, with a streamed body read to the end so its work is measured too."""
+        if spec["method"] == "get":
+            response = client.get(path, payload, **headers)
+        elif spec["multipart"]:
+            payload = encode_multipart(BOUNDARY, payload)
+            response = getattr(client, spec["method"])(path, payload, content_type=MULTIPART_CONTENT, **headers)
+        else:
+            response = getattr(client, spec["method"])(path, payload, content_type="application/json", **headers)
+        if response.streaming:
+            for _ in response.streaming_content:
+                pass
+            response.close()
+        return response
+
+    def run_scenario(self, spec, fixture, requests, warmup):
+        client = Client()
+        timings = []
+        status = None
+        for i in range(warmup + requests):
+            path, payload, headers = self.build_request(spec, fixture)
+            start = time.perf_counter()
+            response = self.send(client, spec, path, payload, headers)
+            elapsed = (time.perf_counter() - start) * 1000
+            status = response.status_code
+            if i >= warmup:
+                timings.append(elapsed)
+
+        # One more request, instrumented, for queries and allocations
+        path, payload, headers = self.build_request(spec, fixture)
+        tracemalloc.start()
+        try:
+            with CaptureQueriesContext(connection) as queries:
+                self.send(client, spec, path, payload, headers)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        timings.sort()
+        return {
+            "method": spec["method"].upper(),
+            "path": path,
+            "status": status,
+            "p50_ms": round(percentile(timings, 50), 2),
+            "p95_ms": round(percentile(timings, 95), 2),
+            "p99_ms": round(percentile(timings, 99), 2),
+            "mean_ms": round(sum(timings) / len(timings), 2) if timings else 0.0,
+            "queries": len(queries),
+            "peak_alloc_kib": round(peak / 1024, 1),
+        }
+
+    def git_commit(self):
+        try:
+            return subprocess.run(
+                ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    def compare(self, path, report, threshold):
+        with open(path) as baseline_file:
+            baseline = json.load(baseline_file)
+        self.stdout.write(f"\nCompared with {path} ({baseline['meta'].get('git_commit')}):")
+        if baseline["meta"].get("dataset") != report["meta"]["dataset"]:
+            self.stdout.write(self.style.WARNING("The baseline was generated with a different dataset."))
+        regressions = []
+        for label, result in report["routes"].items():
+            old = baseline["routes"].get(label)
+            if old is None:
+                self.stdout.write(f"{label:<30} new")
+                continue
+            changes = []
+            for metric in COMPARED_METRICS:
+                before, after = old[metric], result[metric]
+                change = (after - before) / before if before else (1.0 if after else 0.0)
+                changes.append(f"{metric} {before}->{after} ({change:+.0%})")
+                # Query counts are exact, so any increase counts
+                if (metric == "queries" and after > before) or (metric != "queries" and change > threshold):
+                    regressions.append(f"{label}: {metric} {before} -> {after}")
+            self.stdout.write(f"{label:<30} " + ", ".join(changes))
+
+        if regressions:
+            raise CommandError("Regressions:\n" + "\n".join(regressions))
+        self.stdout.write(self.style.SUCCESS("No regressions."))
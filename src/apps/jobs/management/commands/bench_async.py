@@ -0,0 +1,196 @@
+import asyncio
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client, override_settings
+from django.urls import clear_url_caches, path
+
+from src.apps.jobs import async_views, views
+from src.apps.jobs.benchmarks import auth_headers, percentile, scratch_database
+from src.apps.jobs.models import Job
+from src.apps.jobs.synthetic import generate
+
+# (label, route, query string, needs a jobseeker token)
+SCENARIOS = [
+    ("job-list", "jobs/", "", False),
+    ("job-list[search]", "jobs/", "search=python+developer", False),
+    ("job-list[filter+order]", "jobs/", "job_type=Full-time&ordering=-salary", False),
+    ("job-facets", "jobs/facets/", "", False),
+    ("job-detail", "jobs/{pk}/", "", True),
+]
+
+
+def urlconf():
+    """Both versions of each public read, side by side under /sync/ and /async/."""
+    urlpatterns = []
+    for prefix, module in (("sync", views), ("async", async_views)):
+        urlpatterns += [
+            path(f"{prefix}/jobs/", module.JobListView.as_view()),
+            path(f"{prefix}/jobs/facets/", module.JobFacetsView.as_view()),
+            path(f"{prefix}/jobs/<int:pk>/", module.JobDetailView.as_view()),
+        ]
+    module = ModuleType("bench_async_urls")
+    module.urlpatterns = urlpatterns
+    return module
+
+
+async def asgi_get(application, url, query, headers):
+    """One GET through the ASGI application, as an ASGI server would send it."""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": url, "raw_path": url.encode(), "query_string": query.encode(),
+        "root_path": "", "client": ("127.0.0.1", 0), "server": ("testserver", 80),
+        "headers": [(b"host", b"testserver")] + headers,
+    }
+    done = asyncio.Event()
+    response = {"body": b""}
+
+    async def receive():
+        if "sent" not in response:
+            response["sent"] = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # Django listens for a disconnect while the view runs
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+        elif message["type"] == "http.response.body":
+            response["body"] += message.get("body", b"")
+            if not message.get("more_body"):
+                done.set()
+
+    await application(scope, receive, send)
+    return response["status"], response["body"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare throughput of the sync (WSGI, one thread per request) and async (ASGI, one "
+        "event loop) versions of the public job reads at increasing concurrency"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--jobs", type=int, default=5000)
+        parser.add_argument("--companies", type=int, default=50)
+        parser.add_argument("--requests", type=int, default=1000, help="Requests per scenario and concurrency")
+        parser.add_argument("--concurrency", default="1,16,64,256",
+                            help="Comma-separated numbers of requests in flight")
+        parser.add_argument("--only", help="Run only the scenario with this label")
+        parser.add_argument("--with-cache", action="store_true", help="Leave the response caches on")
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        levels = [int(level) for level in options["concurrency"].split(",")]
+        scenarios = [s for s in SCENARIOS if not options["only"] or s[0] == options["only"]]
+        if not scenarios:
+            raise CommandError(f"Unknown scenario {options['only']!r}")
+
+        # Several threads read the database at once; keep it in a file
+        test_name = None
+        if connection.vendor == "sqlite":
+            handle, test_name = tempfile.mkstemp(prefix="bench-async-", suffix=".sqlite3")
+            os.close(handle)
+
+        cache_settings = {} if options["with_cache"] else {
+            "JOB_RESPONSE_CACHE_TIMEOUT": 0, "JOB_FACETS_CACHE_TIMEOUT": 0,
+        }
+        with scratch_database(test_name=test_name), override_settings(ROOT_URLCONF=urlconf(), **cache_settings):
+            clear_url_caches()
+            dataset = generate(companies=options["companies"], jobseekers=100, jobs=options["jobs"],
+                               applications=0, seed=options["seed"], prefix="bench")
+            job = Job.objects.order_by("-applicants_count", "pk").first()
+            token = auth_headers(dataset.jobseekers[0].user)["HTTP_AUTHORIZATION"]
+            application = get_asgi_application()
+
+            self.stdout.write(
+                f"{'scenario':<24} {'in flight':>9} {'WSGI req/s':>11} {'p95 ms':>8} "
+                f"{'ASGI req/s':>11} {'p95 ms':>8} {'ASGI/WSGI':>10}"
+            )
+            for label, route, query, authenticated in scenarios:
+                url = "/" + route.format(pk=job.pk)
+                headers = {"HTTP_AUTHORIZATION": token} if authenticated else {}
+                self.check_same_response(application, url, query, headers)
+                for level in levels:
+                    wsgi = self.run_wsgi(f"/sync{url}", query, headers, level, options["requests"])
+                    asgi = self.run_asgi(application, f"/async{url}", query, headers, level, options["requests"])
+                    self.stdout.write(
+                        f"{label:<24} {level:>9} {wsgi[0]:>11.0f} {wsgi[1]:>8.1f} "
+                        f"{asgi[0]:>11.0f} {asgi[1]:>8.1f} {asgi[0] / wsgi[0]:>9.2f}x"
+                    )
+        clear_url_caches()
+
+    def check_same_response(self, application, url, query, headers):
+        response = Client().get(f"/sync{url}", QUERY_STRING=query, **headers)
+        status, body = response.status_code, response.content
+        asgi_status, asgi_body = asyncio.run(
+            asgi_get(application, f"/async{url}", query, self.asgi_headers(headers))
+        )
+        connection.close()
+        # Pagination links carry the /sync/ or /async/ prefix
+        body = body.replace(b"/sync/", b"/async/")
+        if status != 200 or (status, json.loads(body)) != (asgi_status, json.loads(asgi_body)):
+            raise CommandError(f"{url}?{query}: sync and async responses differ ({status} vs {asgi_status})")
+
+    @staticmethod
+    def asgi_headers(headers):
+        return [(name[5:].lower().replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+
+    def run_wsgi(self, url, query, headers, level, requests):
+        def worker(count):
+            client, latencies = Client(), []
+            try:
+                for _ in range(count):
+                    start = time.perf_counter()
+                    response = client.get(url, QUERY_STRING=query, **headers)
+                    latencies.append(time.perf_counter() - start)
+                    if response.status_code != 200:
+                        raise CommandError(f"{url}: HTTP {response.status_code}")
+            finally:
+                connection.close()
+            return latencies
+
+        with ThreadPoolExecutor(max_workers=level) as pool:
+            start = time.perf_counter()
+            results = list(pool.map(worker, self.split(requests, level)))
+            elapsed = time.perf_counter() - start
+        return self.summarize(results, elapsed)
+
+    def run_asgi(self, application, url, query, headers, level, requests):
+        headers = self.asgi_headers(headers)
+
+        async def worker(count):
+            latencies = []
+            for _ in range(count):
+                start = time.perf_counter()
+                status, _ = await asgi_get(application, url, query, headers)
+                latencies.append(time.perf_counter() - start)
+                if status != 200:
+                    raise CommandError(f"{url}: HTTP {status}")
+            return latencies
+
+        async def burst():
+            return await asyncio.gather(*(worker(count) for count in self.split(requests, level)))
+
+        start = time.perf_counter()
+        results = asyncio.run(burst())
+        elapsed = time.perf_counter() - start
+        return self.summarize(results, elapsed)
+
+    @staticmethod
+    def split(requests, level):
+        """``requests`` spread over ``level`` clients, each sending its share back to back."""
+        return [requests // level + (1 if i < requests % level else 0) for i in range(level)]
+
+    @staticmethod
+    def summarize(results, elapsed):
+        latencies = sorted(latency * 1000 for worker in results for latency in worker)
+        return len(latencies) / elapsed, percentile(latencies, 95)
@@ -0,0 +1,135 @@
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import get_hasher, make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from src.apps.accounts.models import JobSeeker
+from src.apps.jobs.benchmarks import percentile, scratch_database
+
+PASSWORD = "correct horse battery staple"
+
+HASHERS = {
+    "pbkdf2": "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "scrypt": "src.apps.accounts.hashers.ScryptPasswordHasher",
+    "argon2": "src.apps.accounts.hashers.Argon2PasswordHasher",
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure login throughput (POST /api/accounts/login/) per password hasher, with and "
+        "without a Django session, at increasing concurrency"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=50)
+        parser.add_argument("--logins", type=int, default=40, help="Logins per hasher, session mode and concurrency")
+        parser.add_argument("--hashers", default="pbkdf2,scrypt,argon2",
+                            help=f"Comma-separated, from {', '.join(HASHERS)}")
+        parser.add_argument("--concurrency", default="1,4", help="Comma-separated numbers of logins in flight")
+
+    def handle(self, *args, **options):
+        names = options["hashers"].split(",")
+        unknown = set(names) - set(HASHERS)
+        if unknown:
+            raise CommandError(f"Unknown hashers: {', '.join(sorted(unknown))}")
+        levels = [int(level) for level in options["concurrency"].split(",")]
+
+        # Logins from several threads write last_login; keep the database in a file
+        test_name = None
+        if connection.vendor == "sqlite":
+            handle, test_name = tempfile.mkstemp(prefix="bench-login-", suffix=".sqlite3")
+            os.close(handle)
+
+        with scratch_database(test_name=test_name):
+            self.stdout.write(
+                f"{'hasher':<8} {'session':<8} {'in flight':>9} {'logins/s':>9} "
+                f"{'p50 ms':>8} {'p95 ms':>8} {'queries':>8}"
+            )
+            for name in names:
+                with override_settings(PASSWORD_HASHERS=self.hashers_preferring(name)):
+                    try:
+                        get_hasher().encode(PASSWORD, get_hasher().salt())
+                    except ValueError as exc:
+                        self.stdout.write(f"{name:<8} skipped: {exc}")
+                        continue
+                    usernames = self.create_users(name, options["users"])
+                    for session in (True, False):
+                        with override_settings(AUTH_SESSION_LOGIN=session):
+                            queries = self.count_queries(usernames[0])
+                            for level in levels:
+                                rate, p50, p95 = self.run(usernames, level, options["logins"])
+                                self.stdout.write(
+                                    f"{name:<8} {'yes' if session else 'no':<8} {level:>9} {rate:>9.1f} "
+                                    f"{p50:>8.1f} {p95:>8.1f} {queries:>8}"
+                                )
+            self.check_rehash(names[0])
+
+    @staticmethod
+    def hashers_preferring(name):
+        path = HASHERS[name]
+        return [path] + [hasher for hasher in settings.PASSWORD_HASHERS if hasher != path]
+
+    @staticmethod
+    def create_users(prefix, count):
+        User = get_user_model()
+        password = make_password(PASSWORD)
+        users = User.objects.bulk_create(
+            User(username=f"{prefix}-{i}", email=f"{prefix}-{i}@example.com", user_type="jobseeker",
+                 password=password)
+            for i in range(count)
+        )
+        JobSeeker.objects.bulk_create(JobSeeker(user=user) for user in users)
+        return [user.username for user in users]
+
+    @staticmethod
+    def login(client, username):
+        response = client.post(reverse("login"), {"username": username, "password": PASSWORD},
+                               content_type="application/json")
+        if response.status_code != 200:
+            raise CommandError(f"login as {username}: HTTP {response.status_code}")
+
+    def count_queries(self, username):
+        with CaptureQueriesContext(connection) as queries:
+            self.login(Client(), username)
+        return len(queries)
+
+    def run(self, usernames, level, logins):
+        def worker(offset):
+            client, latencies = Client(), []
+            try:
+                for i in range(offset, logins, level):
+                    start = time.perf_counter()
+                    self.login(client, usernames[i % len(usernames)])
+                    latencies.append(time.perf_counter() - start)
+            finally:
+                connection.close()
+            return latencies
+
+        with ThreadPoolExecutor(max_workers=level) as pool:
+            start = time.perf_counter()
+            results = list(pool.map(worker, range(level)))
+            elapsed = time.perf_counter() - start
+        latencies = sorted(latency * 1000 for worker in results for latency in worker)
+        return len(latencies) / elapsed, percentile(latencies, 50), percentile(latencies, 95)
+
+    def check_rehash(self, name):
+        """A login upgrades a hash made by another hasher to the preferred one."""
+        preferred = get_hasher().algorithm
+        username = f"{name}-0"
+        User = get_user_model()
+        stored = User.objects.get(username=username).password.split("$", 1)[0]
+        self.login(Client(), username)
+        upgraded = User.objects.get(username=username).password.split("$", 1)[0]
+        self.stdout.write(f"Rehash on login: {stored} -> {upgraded} (preferred: {preferred})")
+        if upgraded != preferred:
+            raise CommandError("The stored hash was not upgraded on login")
@@ -0,0 +1,80 @@
+import random
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+from src.apps.accounts.models import Company
+from src.apps.jobs.benchmarks import percentile, scratch_database
+from src.apps.jobs.models import Job
+from src.apps.jobs.search import LikeSearchBackend, get_search_backend
+from src.apps.jobs.synthetic import CITIES, LEVELS, ROLES, SKILLS
+
+QUERIES = ["python", "react developer", "senior kuber", "pokhara", "acme", "zzznotfound"]
+
+
+class Command(BaseCommand):
+    help = "Compare the full-text search backend with the old icontains SearchFilter on a synthetic corpus"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--jobs", type=int, default=500_000)
+        parser.add_argument("--companies", type=int, default=2_000)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        with scratch_database():
+            self.build_corpus(options["jobs"], options["companies"], random.Random(options["seed"]))
+            backend = get_search_backend()
+            start = time.perf_counter()
+            backend.rebuild()
+            self.stdout.write(f"Indexed {options['jobs']} jobs in {time.perf_counter() - start:.1f}s "
+                              f"({type(backend).__name__})")
+
+            self.stdout.write(f"{'query':<16} {'icontains p50/p95 ms':>22} {'fulltext p50/p95 ms':>22} {'hits':>8}")
+            for query in QUERIES:
+                old = self.measure(LikeSearchBackend(), query, options["repeat"])
+                new = self.measure(backend, query, options["repeat"])
+                self.stdout.write(
+                    f"{query:<16} {old[0]:>10.1f}/{old[1]:<11.1f} {new[0]:>10.1f}/{new[1]:<11.1f} {new[2]:>8}"
+                )
+
+    def build_corpus(self, total, companies, rng):
+        User = get_user_model()
+        users = User.objects.bulk_create(
+            User(username=f"bench-co-{i}", email=f"bench-co-{i}@example.com", user_type="company")
+            for i in range(companies)
+        )
+        company_objs = Company.objects.bulk_create(
+            Company(user=user, company_name=f"{rng.choice(['Acme', 'Globex', 'Initech', 'Umbrella'])} {i}",
+                    company_id=f"BENCH-{i}")
+            for i, user in enumerate(users)
+        )
+
+        batch = []
+        for i in range(total):
+            skill = rng.choice(SKILLS)
+            words = rng.sample(SKILLS, 4) + rng.sample(ROLES, 3)
+            batch.append(Job(
+                company=company_objs[rng.randrange(len(company_objs))],
+                title=f"{rng.choice(LEVELS)} {skill} {rng.choice(ROLES)}",
+                description=" ".join(f"We use {word} daily and value ownership." for word in words),
+                location=rng.choice(CITIES),
+            ))
+            if len(batch) == 5_000:
+                Job.objects.bulk_create(batch)
+                batch = []
+        Job.objects.bulk_create(batch)
+
+    def measure(self, backend, query, repeat):
+        """Time a page-1 request: COUNT(*) plus the first 10 ranked rows."""
+        timings = []
+        hits = 0
+        for _ in range(repeat):
+            start = time.perf_counter()
+            queryset = backend.search(Job.objects.all(), query).order_by("search_rank", "-created_at")
+            hits = queryset.count()
+            list(queryset.select_related("company")[:10])
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        return percentile(timings, 50), percentile(timings, 95), hits
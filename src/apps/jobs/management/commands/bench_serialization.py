@@ -0,0 +1,92 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from src.apps.jobs import renderers
+from src.apps.jobs.benchmarks import percentile, scratch_database
+from src.apps.jobs.fastpath import compile_plan
+from src.apps.jobs.models import Job
+from src.apps.jobs.querysets import shape_queryset
+from src.apps.jobs.renderers import FastJSONRenderer
+from src.apps.jobs.serializers import JobSerializer
+from src.apps.jobs.synthetic import generate
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare rendering a page of jobs through JobSerializer with the values_list() fast path "
+        "(src/apps/jobs/fastpath.py), checking that both produce the same bytes"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--jobs", type=int, default=500)
+        parser.add_argument("--page-size", type=int, default=50)
+        parser.add_argument("--iterations", type=int, default=200)
+
+    def handle(self, *args, **options):
+        page_size, iterations = options["page_size"], options["iterations"]
+        meta = JobSerializer.Meta
+        fieldsets = {
+            "card": [name for name in meta.fields if name in meta.card_fields],
+            "full": None,
+        }
+
+        with scratch_database():
+            generate(companies=20, jobseekers=0, jobs=options["jobs"], applications=0, prefix="bench")
+            self.stdout.write(
+                f"page_size={page_size}, {iterations} iterations, "
+                f"JSON encoder: {'orjson' if renderers.orjson is not None else 'stdlib'}"
+            )
+            self.stdout.write(
+                f"{'fieldset':<9} {'stage':<22} {'serializer ms':>14} {'fast ms':>8} {'speedup':>8}"
+            )
+            for label, fields in fieldsets.items():
+                slow = self.serializer_page(fields, page_size)
+                fast = self.fast_page(fields, page_size)
+                if slow() != fast():
+                    raise CommandError(f"{label}: the fast path renders a different body")
+                for stage, (slow_stage, fast_stage) in {
+                    "serialize": (self.serializer_page(fields, page_size, fetched=True),
+                                  self.fast_page(fields, page_size, fetched=True)),
+                    "query+serialize+render": (slow, fast),
+                }.items():
+                    slow_ms = self.time(slow_stage, iterations)
+                    fast_ms = self.time(fast_stage, iterations)
+                    self.stdout.write(
+                        f"{label:<9} {stage:<22} {slow_ms:>14.3f} {fast_ms:>8.3f} {slow_ms / fast_ms:>7.1f}x"
+                    )
+
+    @staticmethod
+    def ordered():
+        return Job.objects.order_by("-created_at", "id")
+
+    def serializer_page(self, fields, page_size, fetched=False):
+        """What ``JobListView`` did per page: instances, ``JobSerializer``, ``JSONRenderer``."""
+        queryset = shape_queryset(self.ordered(), JobSerializer, fields)
+        kwargs = {} if fields is None else {"fields": fields}
+        renderer = JSONRenderer()
+        if fetched:
+            rows = list(queryset[:page_size])
+            return lambda: JobSerializer(rows, many=True, **kwargs).data
+        return lambda: renderer.render(JobSerializer(list(queryset[:page_size]), many=True, **kwargs).data)
+
+    def fast_page(self, fields, page_size, fetched=False):
+        plan = compile_plan(JobSerializer, fields)
+        queryset = self.ordered().values_list(*plan.columns, named=True)
+        renderer = FastJSONRenderer()
+        if fetched:
+            rows = list(queryset[:page_size])
+            return lambda: plan.render_many(rows)
+        return lambda: renderer.render(plan.render_many(list(queryset[:page_size])))
+
+    @staticmethod
+    def time(func, iterations):
+        """Median milliseconds per call."""
+        func()
+        samples = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            func()
+            samples.append((time.perf_counter() - start) * 1000)
+        return percentile(sorted(samples), 50)
@@ -0,0 +1,89 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from src.apps.accounts.models import JobSeeker
+from src.apps.jobs import matching
+from src.apps.jobs.benchmarks import percentile, scratch_database
+from src.apps.jobs.models import Job, JobSkill
+from src.apps.jobs.synthetic import generate
+
+QUERIES = [["python"], ["python", "django"], ["react", "typescript", "aws"], ["rust", "haskell"]]
+PAGE_SIZE = 20
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare skill queries on the skill index with scanning the JSON skills/requirements "
+        "columns in Python, on a synthetic dataset"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--jobseekers", type=int, default=1_000_000)
+        parser.add_argument("--jobs", type=int, default=50_000)
+        parser.add_argument("--companies", type=int, default=200)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--scan-repeat", type=int, default=1, help="Runs of the (slow) JSON scan per query")
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        with scratch_database():
+            start = time.perf_counter()
+            generate(companies=options["companies"], jobseekers=options["jobseekers"], jobs=options["jobs"],
+                     applications=0, seed=options["seed"], prefix="bench")
+            self.stdout.write(f"Generated and indexed {options['jobseekers']} jobseekers and "
+                              f"{options['jobs']} jobs in {time.perf_counter() - start:.1f}s")
+
+            start = time.perf_counter()
+            matching.rebuild(("jobseekers",))
+            elapsed = time.perf_counter() - start
+            self.stdout.write(f"Backfill: {options['jobseekers'] / elapsed:.0f} jobseekers/s")
+
+            self.stdout.write(f"\n{'query':<32} {'JSON scan p50 ms':>17} {'index p50/p95 ms':>20} {'hits':>8}")
+            for names in QUERIES:
+                for match_all in (True, False):
+                    label = ("all " if match_all else "any ") + ",".join(names)
+                    self.compare(f"talent {label}", options,
+                                 lambda: self.talent_index(names, match_all),
+                                 lambda: self.scan(JobSeeker, "skills", matching.jobseeker_terms, names, match_all))
+                    self.compare(f"jobs   {label}", options,
+                                 lambda: self.jobs_index(names, match_all),
+                                 lambda: self.scan(Job, "requirements", self.requirement_terms, names, match_all))
+
+    def compare(self, label, options, indexed, scan):
+        old = self.measure(scan, options["scan_repeat"])
+        new = self.measure(indexed, options["repeat"])
+        self.stdout.write(f"{label:<32} {old[0]:>17.1f} {new[0]:>9.1f}/{new[1]:<10.1f} {new[2]:>8}")
+
+    def measure(self, query, repeat):
+        timings, hits = [], 0
+        for _ in range(repeat):
+            start = time.perf_counter()
+            hits = query()
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        return percentile(timings, 50), percentile(timings, 95), hits
+
+    # What TalentSearchView and ?skills= on the job list run: a count and one page
+    def talent_index(self, names, match_all):
+        queryset = matching.find_jobseekers(names, match_all)
+        count = queryset.count()
+        list(queryset.values_list("pk", flat=True)[:PAGE_SIZE])
+        return count
+
+    def jobs_index(self, names, match_all):
+        queryset = Job.objects.filter(pk__in=matching.with_skills(JobSkill.objects, "job", names, match_all))
+        count = queryset.count()
+        list(queryset.order_by("-created_at").values_list("pk", flat=True)[:PAGE_SIZE])
+        return count
+
+    # The alternative without the index: load every JSON blob and test it in Python
+    def scan(self, model, field, terms, names, match_all):
+        wanted = set(names)
+        test = wanted.issubset if match_all else wanted.intersection
+        rows = model.objects.values_list(field, flat=True).iterator(chunk_size=5000)
+        return sum(1 for value in rows if test(terms(value)))
+
+    @staticmethod
+    def requirement_terms(requirements):
+        return matching.job_terms("", requirements)[0]
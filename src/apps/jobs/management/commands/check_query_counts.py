@@ -0,0 +1,91 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from src.apps.accounts.models import Company, JobSeeker
+from src.apps.jobs.benchmarks import auth_headers, scratch_database
+from src.apps.jobs.models import Job, Application
+
+
+# (url name, who calls it, needs a job pk, query budget)
+# Views with conditional GET spend one extra aggregate query on their ETag.
+# Counts are for a warm auth cache: the caller and profile cost no queries.
+ENDPOINTS = [
+    ("job-list", None, False, 2),
+    ("job-detail", "jobseeker", True, 2),
+    ("company-job-list", "company", False, 3),
+    ("company-job-detail", "company", True, 1),
+    ("application-list", "company", False, 2),
+    ("my-applications", "jobseeker", False, 3),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Assert that every read endpoint runs a fixed number of queries, "
+        "independent of page size"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=60, help="Jobs/applications to create")
+
+    def handle(self, *args, **options):
+        # Measure the views themselves, not the response cache
+        with scratch_database(), override_settings(JOB_RESPONSE_CACHE_TIMEOUT=0):
+            users = self.create_fixture(options["rows"])
+            failures = self.check_endpoints(users)
+
+        if failures:
+            raise CommandError("\n".join(failures))
+        self.stdout.write(self.style.SUCCESS("All endpoints within their query budget."))
+
+    def create_fixture(self, rows):
+        User = get_user_model()
+        company_user = User.objects.create_user(
+            username="qc-company", email="qc-company@example.com",
+            password="password", user_type="company",
+        )
+        seeker_user = User.objects.create_user(
+            username="qc-seeker", email="qc-seeker@example.com",
+            password="password", user_type="jobseeker",
+        )
+        company = Company.objects.create(user=company_user, company_name="QC Corp")
+        seeker = JobSeeker.objects.create(user=seeker_user)
+
+        jobs = Job.objects.bulk_create(
+            Job(company=company, title=f"Job {i}", description="Query count fixture")
+            for i in range(rows)
+        )
+        Application.objects.bulk_create(
+            Application(job=job, jobseeker=seeker, cover_letter="Hello")
+            for job in jobs
+        )
+        return {"company": company_user, "jobseeker": seeker_user, "job": jobs[0]}
+
+    def check_endpoints(self, users):
+        client = Client()
+        failures = []
+        for name, caller, needs_pk, budget in ENDPOINTS:
+            url = reverse(name, kwargs={"pk": users["job"].pk} if needs_pk else None)
+            headers = auth_headers(users[caller]) if caller else {}
+
+            # Authenticates the caller once, as any earlier request would
+            client.get(url, **headers)
+            counts = []
+            for page_size in ("1", "50"):
+                with CaptureQueriesContext(connection) as queries:
+                    response = client.get(url, {"page_size": page_size}, **headers)
+                if response.status_code != 200:
+                    failures.append(f"{name}: HTTP {response.status_code}")
+                    break
+                counts.append(len(queries))
+            else:
+                self.stdout.write(f"{name:<22} queries={counts}")
+                if len(set(counts)) != 1:
+                    failures.append(f"{name}: query count grows with page size {counts}")
+                elif counts[0] > budget:
+                    failures.append(f"{name}: {counts[0]} queries, budget is {budget}")
+        return failures
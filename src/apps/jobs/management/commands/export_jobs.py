@@ -0,0 +1,58 @@
+import csv
+import json
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+
+from src.apps.accounts.models import Company
+from src.apps.jobs.feeds import FEED_FIELDS, JSON_FIELDS, feed_format, get_company
+from src.apps.jobs.models import Job
+
+
+class Command(BaseCommand):
+    help = "Stream jobs as JSONL or CSV in the import_jobs feed format (see feeds.py)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", nargs="?", default="-", help="Output file, or '-' for stdout (default)")
+        parser.add_argument("--company", help="Only this company's jobs (company_id or username)")
+        parser.add_argument("--format", choices=["jsonl", "csv"],
+                            help="Defaults to the file extension (.csv, otherwise JSONL)")
+        parser.add_argument("--chunk-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        file_format = feed_format(options["path"], options["format"])
+        queryset = Job.objects.order_by("pk")
+        if options["company"]:
+            try:
+                queryset = queryset.filter(company=get_company(options["company"]))
+            except Company.DoesNotExist:
+                raise CommandError(f"No company with company_id or username '{options['company']}'.")
+        rows = queryset.values(*FEED_FIELDS).iterator(chunk_size=options["chunk_size"])
+
+        stream = sys.stdout if options["path"] == "-" else open(options["path"], "w", newline="", encoding="utf-8")
+        try:
+            count = self.write_csv(stream, rows) if file_format == "csv" else self.write_jsonl(stream, rows)
+        finally:
+            if stream is not sys.stdout:
+                stream.close()
+        self.stderr.write(self.style.SUCCESS(f"Exported {count} jobs."))
+
+    def write_jsonl(self, stream, rows):
+        encoder = DjangoJSONEncoder(ensure_ascii=False, separators=(",", ":"))
+        count = 0
+        for count, row in enumerate(rows, start=1):
+            stream.write(encoder.encode(row))
+            stream.write("\n")
+        return count
+
+    def write_csv(self, stream, rows):
+        writer = csv.DictWriter(stream, fieldnames=FEED_FIELDS)
+        writer.writeheader()
+        count = 0
+        for count, row in enumerate(rows, start=1):
+            for name in JSON_FIELDS:
+                if row[name] is not None:
+                    row[name] = json.dumps(row[name], ensure_ascii=False)
+            writer.writerow(row)
+        return count
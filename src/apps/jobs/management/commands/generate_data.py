@@ -0,0 +1,34 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from src.apps.jobs.synthetic import SYNTHETIC_PASSWORD, generate
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk-insert a deterministic, skewed synthetic dataset (companies, jobseekers, "
+        "jobs, applications) into the configured database"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--companies", type=int, default=50)
+        parser.add_argument("--jobseekers", type=int, default=2000)
+        parser.add_argument("--jobs", type=int, default=5000)
+        parser.add_argument("--applications", type=int, default=20000)
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--prefix", default="synthetic",
+                            help="Username prefix; use a new one to add a second dataset")
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        dataset = generate(
+            companies=options["companies"], jobseekers=options["jobseekers"], jobs=options["jobs"],
+            applications=options["applications"], seed=options["seed"], prefix=options["prefix"],
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {len(dataset.companies)} companies, {len(dataset.jobseekers)} jobseekers and "
+            f"{len(dataset.jobs)} jobs with applications in {time.perf_counter() - start:.1f}s. "
+            f"Log in as {options['prefix']}-co-0 or {options['prefix']}-js-0 with password "
+            f"'{SYNTHETIC_PASSWORD}'."
+        ))
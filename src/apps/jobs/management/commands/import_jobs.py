@@ -0,0 +1,154 @@
+import csv
+import json
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.exceptions import ValidationError
+
+from src.apps.accounts.models import Company
+from src.apps.jobs import matching
+from src.apps.jobs.cache import invalidate_jobs
+from src.apps.jobs.feeds import JSON_FIELDS, feed_format, get_company
+from src.apps.jobs.models import Job
+from src.apps.jobs.search import get_search_backend
+from src.apps.jobs.serializers import JobImportSerializer
+
+# Columns an import may set; on conflict they all replace the stored values
+UPDATE_FIELDS = [
+    "title", "description", "salary", "salary_min", "salary_max", "salary_currency", "salary_period",
+    "location", "job_type", "posted", "requirements", "responsibilities", "benefits", "company_info",
+    "saved", "urgent", "application_deadline", "remote_policy", "experience_level", "education",
+    "updated_at",
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Upsert a company's job feed (see feeds.py) from JSONL or CSV, keyed on external_id. "
+        "Rows are validated with the JobSerializer rules and written in batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Feed file, or '-' for stdin")
+        parser.add_argument("--company", required=True,
+                            help="company_id (e.g. CMP-1A2B3C) or username of the owning company")
+        parser.add_argument("--format", choices=["jsonl", "csv"],
+                            help="Defaults to the file extension (.csv, otherwise JSONL)")
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--dry-run", action="store_true", help="Validate only, write nothing")
+
+    def handle(self, *args, **options):
+        try:
+            company = get_company(options["company"])
+        except Company.DoesNotExist:
+            raise CommandError(f"No company with company_id or username '{options['company']}'.")
+        file_format = feed_format(options["path"], options["format"])
+
+        stream = sys.stdin if options["path"] == "-" else open(options["path"], newline="", encoding="utf-8")
+        try:
+            rows = self.read_csv(stream) if file_format == "csv" else self.read_jsonl(stream)
+            self.import_rows(company, rows, options["batch_size"], options["dry_run"])
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+    # -- reading ------------------------------------------------------------
+
+    def read_jsonl(self, stream):
+        """Yield ``(line number, row, error)`` without loading the whole file."""
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as exc:
+                yield line_number, None, {"non_field_errors": [f"Invalid JSON: {exc}"]}
+                continue
+            if not isinstance(row, dict):
+                yield line_number, None, {"non_field_errors": ["Expected a JSON object."]}
+                continue
+            yield line_number, row, None
+
+    def read_csv(self, stream):
+        reader = csv.DictReader(stream)
+        for row in reader:
+            # Empty cells mean "not given"; JSON columns hold JSON text
+            parsed, error = {}, None
+            for name, value in row.items():
+                if name is None or value in (None, ""):
+                    continue
+                if name in JSON_FIELDS:
+                    try:
+                        value = json.loads(value)
+                    except ValueError:
+                        error = {name: ["Invalid JSON."]}
+                        break
+                parsed[name] = value
+            yield reader.line_num, parsed, error
+
+    # -- writing ------------------------------------------------------------
+
+    def import_rows(self, company, rows, batch_size, dry_run):
+        validator = JobImportSerializer()
+        batch = {}
+        processed = imported = failed = 0
+        start = time.perf_counter()
+
+        for line_number, row, error in rows:
+            processed += 1
+            if error is None:
+                try:
+                    data = validator.run_validation(row)
+                except ValidationError as exc:
+                    error = exc.detail
+            if error is not None:
+                failed += 1
+                self.report_error(line_number, error)
+                continue
+
+            job = Job(company=company, **data)
+            job.update_salary_range()
+            # A later row with the same external_id wins
+            batch[job.external_id] = job
+
+            if len(batch) >= batch_size:
+                imported += self.write_batch(company, list(batch.values()), dry_run)
+                batch = {}
+                self.report_progress(processed, imported, failed, start)
+
+        if batch:
+            imported += self.write_batch(company, list(batch.values()), dry_run)
+        self.report_progress(processed, imported, failed, start)
+
+        summary = f"{'Validated' if dry_run else 'Imported'} {imported} jobs for {company}, {failed} rows rejected."
+        self.stdout.write(self.style.WARNING(summary) if failed else self.style.SUCCESS(summary))
+
+    def write_batch(self, company, jobs, dry_run):
+        if dry_run:
+            return len(jobs)
+        with transaction.atomic():
+            Job.objects.bulk_create(
+                jobs,
+                update_conflicts=True,
+                unique_fields=["company", "external_id"],
+                update_fields=UPDATE_FIELDS,
+            )
+            job_ids = list(
+                Job.objects.filter(company=company, external_id__in=[job.external_id for job in jobs])
+                .values_list("pk", flat=True)
+            )
+            # bulk_create doesn't send the signals that keep these in sync
+            get_search_backend().index_jobs(job_ids)
+            matching.index_jobs(job_ids)
+        invalidate_jobs(job_ids)
+        return len(jobs)
+
+    def report_error(self, line_number, detail):
+        self.stderr.write(f"line {line_number}: {json.dumps(detail, default=str)}")
+
+    def report_progress(self, processed, imported, failed, start):
+        elapsed = time.perf_counter() - start
+        rate = processed / elapsed if elapsed else 0
+        self.stdout.write(f"{processed} rows read, {imported} imported, {failed} rejected ({rate:.0f} rows/s)")
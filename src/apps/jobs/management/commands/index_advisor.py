@@ -0,0 +1,151 @@
+import itertools
+import re
+from collections import Counter
+from urllib.parse import urlsplit
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from src.apps.accounts.models import Company
+from src.apps.jobs.views import JobListView, ApplicationListView
+
+# One sample value per filter, used when no recorded query log is given.
+JOB_FILTER_SAMPLES = {
+    "job_type": "Full-time",
+    "experience_level": "Senior",
+    "urgent": "true",
+    "posted_after": "2025-01-01",
+    "deadline_before": "2026-01-01",
+    "min_salary": "50000",
+    "max_salary": "150000",
+    "location": "Kathmandu",
+    "remote": "Remote",
+    "search": "python",
+    "ordering": "-salary",
+}
+APPLICATION_FILTER_SAMPLES = {
+    "job": "1",
+    "status": "Pending",
+    "ordering": "status",
+}
+
+# Parameters that shape the page rather than filter rows
+NON_FILTER_PARAMS = {"ordering", "page", "page_size", "cursor", "pagination", "with_count", "format"}
+
+# Plan lines that read a whole table (optionally in index order) / sort rows
+SCAN_PATTERNS = {
+    "sqlite": re.compile(r"\bSCAN (\w+)\b(?! VIRTUAL TABLE)( USING (?:COVERING )?INDEX \w+)?"),
+    "postgresql": re.compile(r"(?:Seq Scan on (\w+)|Index (?:Only )?Scan (?:Backward )?using \w+ on (\w+)(?![^\n]*\n\s+Index Cond))"),
+}
+SORT_PATTERNS = {
+    "sqlite": re.compile(r"USE TEMP B-TREE FOR (?:RIGHT PART OF )?ORDER BY"),
+    "postgresql": re.compile(r"\bSort\b"),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Replay a query-string mix through JobListView/ApplicationListView filtering, "
+        "EXPLAIN the page query and report filter combinations that still scan or sort the whole table"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "log", nargs="?",
+            help="File with one recorded request per line (path, URL or bare query string). "
+                 "Without it, every single filter and every pair of filters is tried.",
+        )
+        parser.add_argument("--endpoint", choices=["jobs", "applications"], default="jobs")
+        parser.add_argument("--database", default="default")
+        parser.add_argument("--show-plans", action="store_true")
+
+    def handle(self, *args, **options):
+        connection = connections[options["database"]]
+        if connection.vendor not in SCAN_PATTERNS:
+            raise CommandError(f"No plan patterns for database vendor '{connection.vendor}'.")
+
+        if options["log"]:
+            query_strings = Counter(self.read_log(options["log"]))
+        else:
+            samples = JOB_FILTER_SAMPLES if options["endpoint"] == "jobs" else APPLICATION_FILTER_SAMPLES
+            query_strings = Counter(self.combinations(samples))
+
+        view_class, user = self.get_view(options["endpoint"])
+        factory = APIRequestFactory()
+
+        problems = 0
+        for query_string, hits in query_strings.most_common():
+            queryset = self.build_queryset(view_class, user, factory, query_string)
+            plan = queryset.using(options["database"]).explain()
+            issues = self.analyse(connection.vendor, plan, query_string)
+
+            label = f"[{hits}x] ?{query_string or '(no filters)'}"
+            if issues:
+                problems += 1
+                self.stdout.write(self.style.WARNING(f"{label}: {'; '.join(issues)}"))
+            else:
+                self.stdout.write(f"{label}: ok")
+            if options["show_plans"]:
+                self.stdout.write(plan + "\n")
+
+        summary = f"{problems} of {len(query_strings)} query shapes fall back to a full scan or sort."
+        self.stdout.write(self.style.WARNING(summary) if problems else self.style.SUCCESS(summary))
+
+    def analyse(self, vendor, plan, query_string):
+        filtered = any(
+            name not in NON_FILTER_PARAMS
+            for name, _, _ in (part.partition("=") for part in query_string.split("&") if part)
+        )
+        issues = []
+        for match in SCAN_PATTERNS[vendor].finditer(plan):
+            if vendor == "sqlite":
+                table, index_walk = match.group(1), match.group(2)
+            else:
+                table, index_walk = match.group(1) or match.group(2), match.group(2)
+            if not index_walk:
+                issues.append(f"full scan of {table}")
+            elif filtered:
+                # Reading the table in index order is fine for an unfiltered
+                # LIMIT, but with filters every row is visited and tested.
+                issues.append(f"walks all of {table} in index order, filtering row by row")
+        if SORT_PATTERNS[vendor].search(plan):
+            issues.append("sorts all matching rows")
+        return issues
+
+    def read_log(self, path):
+        with open(path) as log:
+            for line in log:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                yield urlsplit(line).query if ("?" in line or "://" in line) else line
+
+    def combinations(self, samples):
+        params = [f"{name}={value}" for name, value in samples.items()]
+        yield ""
+        for size in (1, 2):
+            for combo in itertools.combinations(params, size):
+                yield "&".join(combo)
+
+    def get_view(self, endpoint):
+        if endpoint == "jobs":
+            return JobListView, AnonymousUser()
+        company = Company.objects.select_related("user").first()
+        if company is None:
+            raise CommandError("Need at least one company to replay application listings.")
+        return ApplicationListView, company.user
+
+    def build_queryset(self, view_class, user, factory, query_string):
+        """The queryset the view would paginate, filters and ordering applied."""
+        django_request = factory.get("/?" + query_string)
+        django_request.user = user
+        view = view_class()
+        view.setup(django_request)
+        view.request = Request(django_request)
+        view.request.user = user
+        view.format_kwarg = None
+        queryset = view.filter_queryset(view.get_queryset())
+        return queryset[:view.paginator.get_page_size(view.request) or 10]
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from src.apps.jobs.cache import get_summary, is_shared, reset_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Show hit/miss counters of the job list/detail response cache. Needs a shared cache "
+        "backend; with a per-process one ask the web process: GET /api/jobs/cache-stats/ as staff"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reset", action="store_true", help="Zero the counters after printing them")
+
+    def handle(self, *args, **options):
+        if not is_shared():
+            # This process's counters, not the web workers'
+            raise CommandError(
+                "JOB_CACHE_ALIAS is a per-process cache, so this command can't see the web workers' "
+                "counters. Use GET /api/jobs/cache-stats/ as a staff user, or a shared backend."
+            )
+        summary = get_summary()
+        self.stdout.write(
+            f"generation={summary['generation']} hits={summary['hits']} misses={summary['misses']} "
+            f"hit_ratio={summary['hit_ratio']:.1%}"
+        )
+        if options["reset"]:
+            reset_stats()
+            self.stdout.write(self.style.SUCCESS("Counters reset."))
@@ -0,0 +1,44 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from src.apps.jobs import matching
+from src.apps.jobs.models import Skill, JobSkill, JobSeekerSkill
+
+
+class Command(BaseCommand):
+    help = (
+        "Backfill the skill index (Skill, JobSkill, JobSeekerSkill; see matching.py) from "
+        "Job.requirements and JobSeeker.skills, in primary-key batches. Run after bulk writes "
+        "that bypass Job/JobSeeker.save(), and with --pending regularly (e.g. from cron) to link "
+        "new vocabulary entries to the rows indexed before them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--only", choices=["jobs", "jobseekers"], help="Rebuild one side only")
+        parser.add_argument("--batch-size", type=int, default=matching.BATCH_SIZE)
+        parser.add_argument("--pending", action="store_true",
+                            help="Only backfill the entries added since the last run")
+
+    def handle(self, *args, **options):
+        if options["pending"]:
+            start = time.perf_counter()
+            entries, jobs, jobseekers = matching.backfill_pending(options["batch_size"])
+            self.stdout.write(self.style.SUCCESS(
+                f"Backfilled {entries} new skills into {jobs} jobs and {jobseekers} jobseekers "
+                f"in {time.perf_counter() - start:.1f}s."
+            ))
+            return
+
+        kinds = (options["only"],) if options["only"] else ("jobs", "jobseekers")
+        start = time.perf_counter()
+
+        def progress(kind, done):
+            elapsed = time.perf_counter() - start
+            self.stdout.write(f"{kind}: {done} indexed ({elapsed:.1f}s)")
+
+        matching.rebuild(kinds, batch_size=options["batch_size"], progress=progress)
+        self.stdout.write(self.style.SUCCESS(
+            f"{Skill.objects.count()} skills, {JobSkill.objects.count()} job links and "
+            f"{JobSeekerSkill.objects.count()} jobseeker links in {time.perf_counter() - start:.1f}s."
+        ))
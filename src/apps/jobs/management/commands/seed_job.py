@@ -5,6 +5,7 @@ from datetime import date
 
 from src.apps.accounts.models import Company
 from src.apps.jobs.models import Job
+from src.apps.jobs.salary import parse_salary
 
 
 class Command(BaseCommand):
@@ -88,7 +89,7 @@ class Command(BaseCommand):
             "saved": False,
             "urgent": True,
             "application_deadline": date.fromisoformat("2025-12-31"),
-            "remote_policy": "Hybrid (3 days in office)",
+            "remote_policy": "Hybrid",
             "experience_level": "Senior",
             "education": "Bachelor's Degree",
         }
@@ -123,6 +124,7 @@ class Command(BaseCommand):
             Job.objects.filter(id=job.id).update(
                 description=job_data["description"],
                 salary=job_data["salary"],
+                **parse_salary(job_data["salary"])._asdict(),
                 location=job_data["location"],
                 job_type=job_data["job_type"],
                 posted=job_data["posted"],
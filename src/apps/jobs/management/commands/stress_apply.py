@@ -0,0 +1,117 @@
+import logging
+import os
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.urls import reverse
+
+from src.apps.accounts.models import Company, JobSeeker
+from src.apps.jobs.benchmarks import auth_headers, percentile, scratch_database
+from src.apps.jobs.models import Job, Application
+
+
+class Command(BaseCommand):
+    help = (
+        "Fire concurrent applies at one job and check that no application is "
+        "duplicated and no applicants_count increment is lost"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seekers", type=int, default=200, help="Distinct jobseekers applying")
+        parser.add_argument("--attempts", type=int, default=3, help="Applies sent per jobseeker")
+        parser.add_argument("--threads", type=int, default=16)
+
+    def handle(self, *args, **options):
+        # An in-memory SQLite test database can't take concurrent writers.
+        test_name = None
+        if connection.vendor == "sqlite":
+            handle, test_name = tempfile.mkstemp(prefix="stress-apply-", suffix=".sqlite3")
+            os.close(handle)
+
+        with scratch_database(test_name=test_name):
+            job, headers = self.create_fixture(options["seekers"])
+            results = self.run_burst(job, headers, options["attempts"], options["threads"])
+            failures = self.verify(job, results, options["seekers"], options["attempts"])
+
+        if failures:
+            raise CommandError("\n".join(failures))
+        self.stdout.write(self.style.SUCCESS("No duplicates and no lost counter updates."))
+
+    def create_fixture(self, seekers):
+        User = get_user_model()
+        company_user = User.objects.create_user(
+            username="stress-company", email="stress-company@example.com",
+            password="password", user_type="company",
+        )
+        company = Company.objects.create(user=company_user, company_name="Viral Corp")
+        job = Job.objects.create(company=company, title="Viral posting", description="Everyone applies")
+
+        users = User.objects.bulk_create(
+            User(username=f"stress-seeker-{i}", email=f"stress-seeker-{i}@example.com", user_type="jobseeker")
+            for i in range(seekers)
+        )
+        JobSeeker.objects.bulk_create(JobSeeker(user=user) for user in users)
+        return job, [auth_headers(user) for user in users]
+
+    def run_burst(self, job, headers, attempts, threads):
+        url = reverse("apply-job")
+
+        def apply(seeker_headers):
+            client = Client()
+            start = time.perf_counter()
+            try:
+                response = client.post(
+                    url, {"job": job.pk, "cover_letter": "Hello"},
+                    content_type="application/json", **seeker_headers,
+                )
+                return response.status_code, time.perf_counter() - start
+            finally:
+                connection.close()
+
+        # Interleave the seekers so the same one's retries race each other
+        requests = [seeker_headers for _ in range(attempts) for seeker_headers in headers]
+        # Rejected duplicates are expected; don't log a warning for each one
+        request_logger = logging.getLogger("django.request")
+        old_level = request_logger.level
+        request_logger.setLevel(logging.ERROR)
+        start = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                results = list(pool.map(apply, requests))
+        finally:
+            request_logger.setLevel(old_level)
+        elapsed = time.perf_counter() - start
+
+        latencies = sorted(latency * 1000 for _, latency in results)
+        self.stdout.write(
+            f"{len(results)} applies on {threads} threads in {elapsed:.2f}s "
+            f"({len(results) / elapsed:.0f}/s), p50 {percentile(latencies, 50):.1f} ms, "
+            f"p95 {percentile(latencies, 95):.1f} ms, p99 {percentile(latencies, 99):.1f} ms"
+        )
+        return results
+
+    def verify(self, job, results, seekers, attempts):
+        statuses = Counter(status for status, _ in results)
+        self.stdout.write("HTTP status counts: " + ", ".join(f"{s}={n}" for s, n in sorted(statuses.items())))
+
+        failures = []
+        if statuses[201] != seekers:
+            failures.append(f"{statuses[201]} applies succeeded, expected {seekers}")
+        if statuses[400] != seekers * (attempts - 1):
+            failures.append(f"{statuses[400]} duplicates rejected, expected {seekers * (attempts - 1)}")
+        if set(statuses) - {201, 400}:
+            failures.append(f"unexpected responses: {dict(statuses)}")
+
+        applications = Application.objects.filter(job=job).count()
+        job.refresh_from_db()
+        if applications != seekers:
+            failures.append(f"{applications} applications stored, expected {seekers}")
+        if job.applicants_count != applications:
+            failures.append(f"applicants_count is {job.applicants_count}, {applications} applications stored")
+        return failures
@@ -0,0 +1,358 @@
+"""
+Candidate-job match scoring.
+
+Skills are normalized into one shared vocabulary (``Skill``). Every job and
+jobseeker has a sparse skill vector, stored as ``JobSkill`` and
+``JobSeekerSkill`` rows:
+
+* a jobseeker's vector is the normalized ``JobSeeker.skills`` list;
+* a job's vector holds the short ``requirements`` entries ("Django") and
+  any vocabulary skill named in the longer ones ("3+ years of Python") or
+  in the title. Each weight is ``1 / number of skills``, so a job's weights
+  sum to 1.
+
+A match score is the dot product of the two vectors: the share of the job's
+skills that the seeker has, from 0 to 1. Scoring one seeker against every
+open job is one sparse matrix-vector product, which the database runs. It
+joins the seeker's skills onto ``JobSkill`` through the (skill, job) index
+and sums the weights per job. The cost grows with the postings of the
+seeker's skills, not with the size of the catalogue.
+
+The vocabulary only holds names jobs use. Indexing a job also stores its
+n-grams as ``JobTerm`` rows; a jobseeker skill becomes a vocabulary entry
+only if some job's terms contain it, found through the (term, job) index.
+Skills no job mentions are not stored, so free-text input can't grow the
+vocabulary.
+
+Vectors are recomputed per row when a ``Job`` or ``JobSeeker`` is saved
+(see ``signals.py``). Bulk writes call ``index_jobs``/``index_jobseekers``
+themselves, and ``rebuild()`` recomputes everything. A new entry is not
+linked to rows indexed before it existed until ``backfill_pending()``
+(``manage.py rebuild_match_index --pending``, e.g. from cron) runs: that
+re-indexes the jobs whose stored terms name it, and is never done inside
+a request.
+"""
+import re
+
+from django.db import transaction
+from django.db.models import Count, FloatField, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from src.apps.accounts.models import JobSeeker
+from .models import Job, Skill, JobSkill, JobSeekerSkill, JobTerm
+
+# Spellings folded into one vocabulary entry
+ALIASES = {
+    "js": "javascript",
+    "ts": "typescript",
+    "golang": "go",
+    "node.js": "node",
+    "nodejs": "node",
+    "react.js": "react",
+    "reactjs": "react",
+    "postgres": "postgresql",
+    "k8s": "kubernetes",
+    "amazon web services": "aws",
+    "drf": "django rest framework",
+}
+# Requirement entries of up to this many words are skill names themselves
+MAX_SKILL_WORDS = 3
+MAX_SKILL_LENGTH = Skill._meta.get_field("name").max_length
+# Keeps "c++", "c#" and "node.js" whole
+WORD_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+BATCH_SIZE = 2000
+# Names per ``term IN (...)`` lookup, under SQLite's variable limit
+TERM_BATCH_SIZE = 500
+
+
+def normalize_skill(value):
+    """The vocabulary form of a skill name, or None if there is nothing left."""
+    if not isinstance(value, str):
+        return None
+    words = [word.rstrip(".") for word in WORD_RE.findall(value.lower())]
+    name = " ".join(word for word in words if word)
+    if not name or len(name) > MAX_SKILL_LENGTH:
+        return None
+    return ALIASES.get(name, name)
+
+
+def _ngrams(text):
+    words = [word.rstrip(".") for word in WORD_RE.findall(text.lower())]
+    for size in range(1, MAX_SKILL_WORDS + 1):
+        for start in range(len(words) - size + 1):
+            name = " ".join(words[start:start + size])
+            yield ALIASES.get(name, name)
+
+
+def normalize_skills(values):
+    """Sorted, de-duplicated vocabulary names for a list of user-supplied skills."""
+    return sorted({name for name in map(normalize_skill, values) if name})
+
+
+def job_terms(title, requirements):
+    """``(declared, mentioned)`` skill names: entries that are skills, and n-grams to look up."""
+    declared, mentioned = set(), set(_ngrams(title or ""))
+    for entry in requirements if isinstance(requirements, list) else []:
+        if not isinstance(entry, str):
+            continue
+        name = normalize_skill(entry)
+        if name and len(name.split()) <= MAX_SKILL_WORDS:
+            declared.add(name)
+        mentioned.update(_ngrams(entry))
+    return declared, mentioned
+
+
+def jobseeker_terms(skills):
+    names = (normalize_skill(entry) for entry in skills if isinstance(entry, str)) if isinstance(skills, list) else ()
+    return {name for name in names if name}
+
+
+def mentioned_terms(names):
+    """The ``names`` that some job's title or requirements contain as whole words."""
+    names, found = sorted(names), set()
+    for start in range(0, len(names), TERM_BATCH_SIZE):
+        batch = names[start:start + TERM_BATCH_SIZE]
+        found.update(JobTerm.objects.filter(term__in=batch).values_list("term", flat=True).distinct())
+    return found
+
+
+def ensure_skills(names):
+    """Return ``({name: id}, new names)``, adding the names not in the vocabulary yet."""
+    names = set(names)
+    vocabulary = dict(Skill.objects.filter(name__in=names).values_list("name", "id"))
+    new = names - set(vocabulary)
+    if new:
+        Skill.objects.bulk_create([Skill(name=name) for name in new], ignore_conflicts=True)
+        vocabulary.update(Skill.objects.filter(name__in=new).values_list("name", "id"))
+    return vocabulary, new
+
+
+# -- indexing -----------------------------------------------------------------
+
+def index_jobs(job_ids, vocabulary=None):
+    """
+    Recompute the skill vectors of ``job_ids``. Pass the whole ``vocabulary``
+    ({name: id}) when indexing in bulk to skip the per-batch lookups.
+    """
+    job_ids = list(job_ids)
+    rows = list(Job.objects.filter(pk__in=job_ids).values_list("pk", "title", "requirements"))
+    terms = {pk: job_terms(title, requirements) for pk, title, requirements in rows}
+
+    if vocabulary is None:
+        declared = set().union(*(d for d, _ in terms.values()))
+        vocabulary, _ = ensure_skills(declared)
+        mentioned = set().union(*(m for _, m in terms.values())) - declared
+        vocabulary.update(Skill.objects.filter(name__in=mentioned).values_list("name", "id"))
+
+    links, job_terms_rows = [], []
+    for pk, (declared, mentioned) in terms.items():
+        skill_ids = {vocabulary[name] for name in declared | mentioned if name in vocabulary}
+        links += [JobSkill(job_id=pk, skill_id=skill_id, weight=1 / len(skill_ids)) for skill_id in skill_ids]
+        job_terms_rows += [
+            JobTerm(job_id=pk, term=name) for name in declared | mentioned if len(name) <= MAX_SKILL_LENGTH
+        ]
+    with transaction.atomic():
+        JobSkill.objects.filter(job_id__in=job_ids).delete()
+        JobSkill.objects.bulk_create(links, batch_size=BATCH_SIZE)
+        JobTerm.objects.filter(job_id__in=job_ids).delete()
+        JobTerm.objects.bulk_create(job_terms_rows, batch_size=BATCH_SIZE)
+
+
+def index_jobseekers(jobseeker_ids, vocabulary=None):
+    jobseeker_ids = list(jobseeker_ids)
+    terms = {
+        pk: jobseeker_terms(skills)
+        for pk, skills in JobSeeker.objects.filter(pk__in=jobseeker_ids).values_list("pk", "skills")
+    }
+    if vocabulary is None:
+        vocabulary = known_skills(set().union(*terms.values()))
+
+    links = [
+        JobSeekerSkill(jobseeker_id=pk, skill_id=vocabulary[name])
+        for pk, names in terms.items() for name in names if name in vocabulary
+    ]
+    with transaction.atomic():
+        JobSeekerSkill.objects.filter(jobseeker_id__in=jobseeker_ids).delete()
+        JobSeekerSkill.objects.bulk_create(links, batch_size=BATCH_SIZE)
+
+
+def known_skills(names):
+    """
+    ``{name: id}`` for the ``names`` in the vocabulary, adding those that a
+    job mentions but that aren't entries yet. The jobs aren't re-linked
+    here; the new entries wait for ``backfill_pending()``.
+    """
+    names, vocabulary = sorted(names), {}
+    for start in range(0, len(names), TERM_BATCH_SIZE):
+        batch = names[start:start + TERM_BATCH_SIZE]
+        vocabulary.update(Skill.objects.filter(name__in=batch).values_list("name", "id"))
+    mentioned = mentioned_terms(set(names) - set(vocabulary))
+    if mentioned:
+        vocabulary.update(ensure_skills(mentioned)[0])
+    return vocabulary
+
+
+def backfill_pending(batch_size=BATCH_SIZE):
+    """
+    Link the entries added since the last backfill to the rows indexed
+    before them: the jobs whose stored terms contain them, and the
+    jobseekers listing them. Returns ``(entries, jobs, jobseekers)`` done.
+    """
+    pending = dict(Skill.objects.filter(backfill_pending=True).values_list("name", "id"))
+    if not pending:
+        return 0, 0, 0
+
+    names = sorted(pending)
+    job_ids, seeker_ids = set(), set()
+    for start in range(0, len(names), TERM_BATCH_SIZE):
+        batch = names[start:start + TERM_BATCH_SIZE]
+        job_ids.update(JobTerm.objects.filter(term__in=batch).values_list("job_id", flat=True))
+        # icontains only narrows the scan; index_jobseekers matches whole names
+        listed = Q()
+        for name in batch:
+            listed |= Q(skills__icontains=name)
+        seeker_ids.update(JobSeeker.objects.filter(listed).values_list("pk", flat=True))
+
+    for ids, index in ((sorted(job_ids), index_jobs), (sorted(seeker_ids), index_jobseekers)):
+        for start in range(0, len(ids), batch_size):
+            index(ids[start:start + batch_size])
+    # Entries added meanwhile stay pending for the next run
+    _mark_backfilled(pending.values())
+    return len(pending), len(job_ids), len(seeker_ids)
+
+
+def rebuild(kinds=("jobs", "jobseekers"), batch_size=BATCH_SIZE, progress=None):
+    """
+    Recompute every job and/or jobseeker vector in primary-key batches.
+
+    The vocabulary is completed first and then shared by all batches, so a
+    batch costs one read, one delete and one bulk insert. Jobs go first, so
+    their stored terms decide which jobseeker skills count; the entries
+    those skills add are then backfilled into the jobs that mention them.
+    ``progress(kind, rows done)`` is called after each batch.
+    """
+    linked = []
+    if "jobs" in kinds:
+        declared = set()
+        for title, requirements in Job.objects.values_list("title", "requirements").iterator(chunk_size=batch_size):
+            declared |= job_terms(title, requirements)[0]
+        ensure_skills(declared)
+
+    for kind, model, index in (("jobs", Job, index_jobs), ("jobseekers", JobSeeker, index_jobseekers)):
+        if kind not in kinds:
+            continue
+        if kind == "jobseekers":
+            # After the jobs, so their stored terms decide which skills count
+            listed = set()
+            for skills in JobSeeker.objects.values_list("skills", flat=True).iterator(chunk_size=batch_size):
+                listed |= jobseeker_terms(skills)
+            known_skills(listed)
+        vocabulary = dict(Skill.objects.values_list("name", "id"))
+        if kind == "jobs":
+            linked = list(vocabulary.values())
+        last_pk = done = 0
+        while True:
+            ids = list(model.objects.filter(pk__gt=last_pk).order_by("pk").values_list("pk", flat=True)[:batch_size])
+            if not ids:
+                break
+            index(ids, vocabulary)
+            last_pk, done = ids[-1], done + len(ids)
+            if progress:
+                progress(kind, done)
+    if set(kinds) >= {"jobs", "jobseekers"}:
+        # Every job and jobseeker was indexed against these entries
+        _mark_backfilled(linked)
+        backfill_pending(batch_size)
+
+
+def _mark_backfilled(skill_ids):
+    skill_ids = sorted(skill_ids)
+    for start in range(0, len(skill_ids), TERM_BATCH_SIZE):
+        Skill.objects.filter(pk__in=skill_ids[start:start + TERM_BATCH_SIZE]).update(backfill_pending=False)
+
+
+# -- skill queries ------------------------------------------------------------
+
+def with_skills(links, owner, names, match_all=True):
+    """
+    Subquery of ``owner`` ids ("job" or "jobseeker") whose ``links``
+    (``JobSkill`` or ``JobSeekerSkill`` rows) cover every one of ``names``,
+    or any of them. Walks the (skill, owner) index; no JSON is read.
+    """
+    links = links.filter(skill__name__in=names).values(owner)
+    if match_all and len(names) > 1:
+        links = links.annotate(matched=Count("skill")).filter(matched=len(names)).values(owner)
+    return links
+
+
+def find_jobseekers(names, match_all=True):
+    """
+    Jobseekers with every one of ``names`` (or any of them), annotated with
+    ``matched_count`` and ordered best match first, then newest. Both walk
+    the (skill, jobseeker) index.
+    """
+    if match_all:
+        # Every row matches all names, so no per-row count is needed
+        return (
+            JobSeeker.objects.filter(pk__in=with_skills(JobSeekerSkill.objects, "jobseeker", names))
+            .annotate(matched_count=Value(len(names)))
+            .order_by("-pk")
+        )
+    return (
+        JobSeeker.objects.filter(skill_links__skill__name__in=names)
+        .annotate(matched_count=Count("skill_links"))
+        .order_by("-matched_count", "-pk")
+    )
+
+
+# -- scoring ------------------------------------------------------------------
+
+def open_jobs_q(prefix=""):
+    return Q(**{f"{prefix}application_deadline__isnull": True}) | Q(
+        **{f"{prefix}application_deadline__gte": timezone.localdate()}
+    )
+
+
+def recommend_jobs(jobseeker, limit):
+    """
+    ``[(job id, score)]`` for the open jobs that best match ``jobseeker``
+    and that they haven't applied to yet, best first.
+    """
+    return list(
+        JobSkill.objects
+        .filter(skill__jobseeker_links__jobseeker=jobseeker)
+        .filter(open_jobs_q("job__"))
+        .exclude(job__in=jobseeker.applications.values("job"))
+        .values("job")
+        .annotate(score=Sum("weight"))
+        .order_by("-score", "-job")
+        .values_list("job", "score")[:limit]
+    )
+
+
+def matched_skills(jobseeker, job_ids):
+    """``{job id: [skill name, ...]}``: the skills each job shares with ``jobseeker``."""
+    matched = {}
+    rows = (
+        JobSkill.objects
+        .filter(job__in=job_ids, skill__jobseeker_links__jobseeker=jobseeker)
+        .order_by("skill__name")
+        .values_list("job", "skill__name")
+    )
+    for job_id, name in rows:
+        matched.setdefault(job_id, []).append(name)
+    return matched
+
+
+def application_match_score():
+    """Annotation for ``Application`` querysets: the applicant's score for the job."""
+    scores = (
+        JobSkill.objects
+        .filter(job=OuterRef("job_id"), skill__jobseeker_links__jobseeker=OuterRef("jobseeker_id"))
+        .order_by()
+        .values("job")
+        .annotate(score=Sum("weight"))
+        .values("score")
+    )
+    return Coalesce(Subquery(scores, output_field=FloatField()), Value(0.0))
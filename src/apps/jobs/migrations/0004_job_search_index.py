@@ -0,0 +1,63 @@
+from django.conf import settings
+from django.db import migrations
+
+# The index as it was created here, spelled out rather than taken from
+# search.py, so later changes to the backends don't change this migration.
+# Other databases search with icontains and need no index.
+SQLITE_INSTALL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS jobs_job_fts USING fts5("
+    "title, description, location, company_name, "
+    "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')",
+    "DELETE FROM jobs_job_fts",
+    "INSERT INTO jobs_job_fts (rowid, title, description, location, company_name) "
+    "SELECT jobs_job.id, jobs_job.title, jobs_job.description, "
+    "COALESCE(jobs_job.location, ''), accounts_company.company_name "
+    "FROM jobs_job INNER JOIN accounts_company ON accounts_company.id = jobs_job.company_id",
+]
+SQLITE_UNINSTALL = ["DROP TABLE IF EXISTS jobs_job_fts"]
+
+POSTGRES_INSTALL = [
+    "CREATE TABLE IF NOT EXISTS jobs_job_search ("
+    "job_id bigint PRIMARY KEY REFERENCES jobs_job (id) ON DELETE CASCADE, "
+    "document tsvector NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS jobs_job_search_document_gin ON jobs_job_search USING gin (document)",
+    "INSERT INTO jobs_job_search (job_id, document) "
+    "SELECT jobs_job.id, "
+    "setweight(to_tsvector(%(config)s::regconfig, jobs_job.title), 'A') || "
+    "setweight(to_tsvector(%(config)s::regconfig, accounts_company.company_name), 'B') || "
+    "setweight(to_tsvector(%(config)s::regconfig, COALESCE(jobs_job.location, '')), 'B') || "
+    "setweight(to_tsvector(%(config)s::regconfig, jobs_job.description), 'C') "
+    "FROM jobs_job INNER JOIN accounts_company ON accounts_company.id = jobs_job.company_id "
+    "ON CONFLICT (job_id) DO UPDATE SET document = EXCLUDED.document",
+]
+POSTGRES_UNINSTALL = ["DROP TABLE IF EXISTS jobs_job_search"]
+
+STATEMENTS = {
+    'sqlite': (SQLITE_INSTALL, SQLITE_UNINSTALL),
+    'postgresql': (POSTGRES_INSTALL, POSTGRES_UNINSTALL),
+}
+
+
+def install_search_index(apps, schema_editor):
+    install, _ = STATEMENTS.get(schema_editor.connection.vendor, ([], []))
+    params = {'config': getattr(settings, 'JOB_SEARCH_CONFIG', 'english')}
+    for sql in install:
+        schema_editor.execute(sql, params if '%(' in sql else None)
+
+
+def uninstall_search_index(apps, schema_editor):
+    _, uninstall = STATEMENTS.get(schema_editor.connection.vendor, ([], []))
+    for sql in uninstall:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_company_company_info_company_company_size_and_more'),
+        ('jobs', '0003_job_applicants_count_job_application_deadline_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(install_search_index, uninstall_search_index),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 6.0 on 2026-10-18 16:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_company_company_info_company_company_size_and_more'),
+        ('jobs', '0004_job_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='salary_currency',
+            field=models.CharField(blank=True, max_length=3, null=True),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='salary_max',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='salary_min',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='salary_period',
+            field=models.CharField(blank=True, choices=[('hour', 'Hour'), ('day', 'Day'), ('week', 'Week'), ('month', 'Month'), ('year', 'Year')], max_length=10, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['salary_min'], name='job_salary_min_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['salary_max'], name='job_salary_max_idx'),
+        ),
+    ]
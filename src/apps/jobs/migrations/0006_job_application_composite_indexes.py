@@ -0,0 +1,58 @@
+# Generated by Django 6.0 on 2026-10-18 16:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_company_company_info_company_company_size_and_more'),
+        ('jobs', '0005_job_salary_range'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['job', 'status', '-applied_at'], name='app_job_status_applied_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['job', '-applied_at'], name='app_job_applied_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['jobseeker', '-applied_at'], name='app_seeker_applied_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['-applied_at', 'id'], name='app_applied_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['-created_at', 'id'], name='job_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['urgent', '-created_at'], name='job_urgent_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['job_type', '-created_at'], name='job_type_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['experience_level', '-created_at'], name='job_level_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['company', '-created_at'], name='job_company_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['posted'], name='job_posted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['application_deadline'], name='job_deadline_idx'),
+        ),
+    ]
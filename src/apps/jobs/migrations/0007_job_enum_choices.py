@@ -0,0 +1,152 @@
+# Generated by Django 6.0 on 2026-10-18 16:59
+
+import re
+
+from django.db import migrations, models
+
+# The mapping as of this migration, frozen: later edits to choices.py must
+# not change what it did to existing rows.
+JOB_TYPE_ALIASES = {
+    "fulltime": "Full-time", "ft": "Full-time", "permanent": "Full-time",
+    "parttime": "Part-time", "pt": "Part-time",
+    "contract": "Contract", "contractor": "Contract", "fixedterm": "Contract",
+    "internship": "Internship", "intern": "Internship", "trainee": "Internship",
+    "temporary": "Temporary", "temp": "Temporary", "seasonal": "Temporary",
+    "freelance": "Freelance", "freelancer": "Freelance", "gig": "Freelance",
+}
+EXPERIENCE_LEVEL_ALIASES = {
+    "entry": "Entry", "entrylevel": "Entry", "graduate": "Entry", "fresher": "Entry",
+    "junior": "Junior", "jr": "Junior",
+    "mid": "Mid-level", "midlevel": "Mid-level", "intermediate": "Mid-level", "midsenior": "Mid-level",
+    "senior": "Senior", "sr": "Senior",
+    "lead": "Lead", "principal": "Lead", "staff": "Lead",
+    "executive": "Executive", "director": "Executive", "head": "Executive",
+}
+REMOTE_POLICY_KEYWORDS = [
+    ("hybrid", "Hybrid"), ("flexible", "Hybrid"),
+    ("remote", "Remote"), ("wfh", "Remote"), ("workfromhome", "Remote"),
+    ("onsite", "On-site"), ("office", "On-site"), ("inperson", "On-site"),
+]
+
+
+def _key(value):
+    return re.sub(r"[^a-z]", "", str(value).lower())
+
+
+def canonical_job_type(value):
+    return JOB_TYPE_ALIASES.get(_key(value))
+
+
+def canonical_experience_level(value):
+    key = _key(value)
+    if key in EXPERIENCE_LEVEL_ALIASES:
+        return EXPERIENCE_LEVEL_ALIASES[key]
+    for alias in sorted(EXPERIENCE_LEVEL_ALIASES, key=len, reverse=True):
+        if len(alias) > 2 and key.startswith(alias):
+            return EXPERIENCE_LEVEL_ALIASES[alias]
+    return None
+
+
+def canonical_remote_policy(value):
+    key = _key(value)
+    for keyword, canonical in REMOTE_POLICY_KEYWORDS:
+        if keyword in key:
+            return canonical
+    return None
+
+
+CANONICALIZERS = {
+    'job_type': canonical_job_type,
+    'experience_level': canonical_experience_level,
+    'remote_policy': canonical_remote_policy,
+}
+
+
+def canonicalize_job_enums(apps, schema_editor):
+    """
+    Rewrite every stored variant to its canonical value, keeping the text it
+    replaced in ``legacy_enum_values``. Values the mapping doesn't recognise
+    stop the migration, listed, before anything is written: map them by
+    hand (or clear them) and run it again.
+    """
+    Job = apps.get_model('jobs', 'Job')
+    rewrites, unrecognised = {}, []
+    for field, canonical in CANONICALIZERS.items():
+        variants = (
+            Job.objects.exclude(**{f'{field}__isnull': True}).exclude(**{field: ''})
+            .values_list(field, flat=True).distinct()
+        )
+        for variant in variants:
+            value = canonical(variant)
+            if value is None:
+                count = Job.objects.filter(**{field: variant}).count()
+                unrecognised.append(f'{field}={variant!r} ({count} jobs)')
+            elif value != variant:
+                rewrites[(field, variant)] = value
+    if unrecognised:
+        raise RuntimeError(
+            'Unrecognised job enum values; map or clear them, then migrate again:\n  '
+            + '\n  '.join(unrecognised)
+        )
+
+    for (field, variant), value in rewrites.items():
+        for job in Job.objects.filter(**{field: variant}).only('pk', 'legacy_enum_values').iterator():
+            originals = dict(job.legacy_enum_values or {}, **{field: variant})
+            Job.objects.filter(pk=job.pk).update(**{field: value, 'legacy_enum_values': originals})
+    # Empty strings become NULL, the "not given" of the constrained columns
+    for field in CANONICALIZERS:
+        Job.objects.filter(**{field: ''}).update(**{field: None})
+
+
+def restore_job_enums(apps, schema_editor):
+    Job = apps.get_model('jobs', 'Job')
+    for job in Job.objects.exclude(legacy_enum_values__isnull=True).iterator():
+        Job.objects.filter(pk=job.pk).update(**job.legacy_enum_values)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_company_company_info_company_company_size_and_more'),
+        ('jobs', '0006_job_application_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='legacy_enum_values',
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(canonicalize_job_enums, restore_job_enums),
+        migrations.AlterField(
+            model_name='job',
+            name='experience_level',
+            field=models.CharField(blank=True, choices=[('Entry', 'Entry'), ('Junior', 'Junior'), ('Mid-level', 'Mid-level'), ('Senior', 'Senior'), ('Lead', 'Lead'), ('Executive', 'Executive')], max_length=100, null=True),
+        ),
+        migrations.AlterField(
+            model_name='job',
+            name='job_type',
+            field=models.CharField(blank=True, choices=[('Full-time', 'Full-time'), ('Part-time', 'Part-time'), ('Contract', 'Contract'), ('Internship', 'Internship'), ('Temporary', 'Temporary'), ('Freelance', 'Freelance')], max_length=50, null=True),
+        ),
+        migrations.AlterField(
+            model_name='job',
+            name='remote_policy',
+            field=models.CharField(blank=True, choices=[('On-site', 'On-site'), ('Hybrid', 'Hybrid'), ('Remote', 'Remote')], max_length=255, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['remote_policy', '-created_at'], name='job_remote_created_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='job',
+            constraint=models.CheckConstraint(condition=models.Q(('job_type__isnull', True), ('job_type__in', ['Full-time', 'Part-time', 'Contract', 'Internship', 'Temporary', 'Freelance']), _connector='OR'), name='job_type_valid'),
+        ),
+        migrations.AddConstraint(
+            model_name='job',
+            constraint=models.CheckConstraint(condition=models.Q(('experience_level__isnull', True), ('experience_level__in', ['Entry', 'Junior', 'Mid-level', 'Senior', 'Lead', 'Executive']), _connector='OR'), name='job_experience_level_valid'),
+        ),
+        migrations.AddConstraint(
+            model_name='job',
+            constraint=models.CheckConstraint(condition=models.Q(('remote_policy__isnull', True), ('remote_policy__in', ['On-site', 'Hybrid', 'Remote']), _connector='OR'), name='job_remote_policy_valid'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 6.0 on 2026-10-18 17:20
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def backfill_updated_at(apps, schema_editor):
+    # Existing rows haven't changed since they were created
+    Job = apps.get_model('jobs', 'Job')
+    Application = apps.get_model('jobs', 'Application')
+    Job.objects.update(updated_at=models.F('created_at'))
+    Application.objects.update(updated_at=models.F('applied_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0007_job_enum_choices'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_updated_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 6.0 on 2026-10-18 17:40
+
+from django.db import migrations, models
+from django.db.models import Count, Min, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def dedupe_and_recount(apps, schema_editor):
+    """Keep the first application per (job, jobseeker) and recount every job."""
+    Application = apps.get_model('jobs', 'Application')
+    Job = apps.get_model('jobs', 'Job')
+
+    duplicates = (
+        Application.objects.values('job_id', 'jobseeker_id')
+        .annotate(first_id=Min('id'), rows=Count('id'))
+        .filter(rows__gt=1)
+    )
+    for group in duplicates.iterator():
+        Application.objects.filter(
+            job_id=group['job_id'], jobseeker_id=group['jobseeker_id'],
+        ).exclude(id=group['first_id']).delete()
+
+    counts = (
+        Application.objects.filter(job_id=OuterRef('pk'))
+        .order_by().values('job_id').annotate(rows=Count('id')).values('rows')
+    )
+    Job.objects.update(applicants_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0008_updated_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(dedupe_and_recount, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='application',
+            constraint=models.UniqueConstraint(fields=('job', 'jobseeker'), name='app_unique_job_jobseeker'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0 on 2026-10-18 17:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_company_jobseeker_updated_at'),
+        ('jobs', '0009_application_unique_job_jobseeker'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='external_id',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name='job',
+            constraint=models.UniqueConstraint(fields=('company', 'external_id'), name='job_company_external_id'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 6.0 on 2026-10-18 18:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# The vectors of existing rows are built by ``manage.py rebuild_match_index``:
+# matching.py works with the current models, which a migration can't rely on.
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_company_jobseeker_updated_at'),
+        ('jobs', '0010_job_external_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='JobSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('weight', models.FloatField()),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_links', to='jobs.job')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_links', to='jobs.skill')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['skill', 'job'], name='jobskill_skill_job_idx')],
+                'constraints': [models.UniqueConstraint(fields=('job', 'skill'), name='jobskill_unique_job_skill')],
+            },
+        ),
+        migrations.CreateModel(
+            name='JobSeekerSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('jobseeker', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_links', to='accounts.jobseeker')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='jobseeker_links', to='jobs.skill')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['skill', 'jobseeker'], name='seekerskill_skill_seeker_idx')],
+                'constraints': [models.UniqueConstraint(fields=('jobseeker', 'skill'), name='seekerskill_unique_seeker_skill')],
+            },
+        ),
+    ]
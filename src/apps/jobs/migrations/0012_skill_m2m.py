@@ -0,0 +1,24 @@
+# Generated by Django 6.0 on 2026-10-18 18:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_company_jobseeker_updated_at'),
+        ('jobs', '0011_skill_vectors'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='skill',
+            name='jobs',
+            field=models.ManyToManyField(related_name='skill_set', through='jobs.JobSkill', to='jobs.job'),
+        ),
+        migrations.AddField(
+            model_name='skill',
+            name='jobseekers',
+            field=models.ManyToManyField(related_name='skill_set', through='jobs.JobSeekerSkill', to='accounts.jobseeker'),
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 6.0 on 2026-10-18 19:00
+
+from django.conf import settings
+from django.db import migrations
+
+# The index as it was created here, spelled out rather than taken from
+# resume_search.py, so later changes to the backends don't change this
+# migration. Other databases search with icontains and need no index.
+SQLITE_INSTALL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS accounts_jobseeker_resume_fts USING fts5("
+    "resume, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')",
+    "DELETE FROM accounts_jobseeker_resume_fts",
+    "INSERT INTO accounts_jobseeker_resume_fts (rowid, resume) "
+    "SELECT id, resume_text FROM accounts_jobseeker WHERE resume_text != ''",
+]
+SQLITE_UNINSTALL = ["DROP TABLE IF EXISTS accounts_jobseeker_resume_fts"]
+
+POSTGRES_INSTALL = [
+    "CREATE TABLE IF NOT EXISTS accounts_jobseeker_resume_search ("
+    "jobseeker_id bigint PRIMARY KEY REFERENCES accounts_jobseeker (id) ON DELETE CASCADE, "
+    "document tsvector NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS accounts_jobseeker_resume_search_document_gin "
+    "ON accounts_jobseeker_resume_search USING gin (document)",
+    "INSERT INTO accounts_jobseeker_resume_search (jobseeker_id, document) "
+    "SELECT id, to_tsvector(%(config)s::regconfig, resume_text) FROM accounts_jobseeker "
+    "WHERE resume_text != '' "
+    "ON CONFLICT (jobseeker_id) DO UPDATE SET document = EXCLUDED.document",
+]
+POSTGRES_UNINSTALL = ["DROP TABLE IF EXISTS accounts_jobseeker_resume_search"]
+
+STATEMENTS = {
+    'sqlite': (SQLITE_INSTALL, SQLITE_UNINSTALL),
+    'postgresql': (POSTGRES_INSTALL, POSTGRES_UNINSTALL),
+}
+
+
+def install_resume_index(apps, schema_editor):
+    install, _ = STATEMENTS.get(schema_editor.connection.vendor, ([], []))
+    params = {'config': getattr(settings, 'JOB_SEARCH_CONFIG', 'english')}
+    for sql in install:
+        schema_editor.execute(sql, params if '%(' in sql else None)
+
+
+def uninstall_resume_index(apps, schema_editor):
+    _, uninstall = STATEMENTS.get(schema_editor.connection.vendor, ([], []))
+    for sql in uninstall:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0008_media_tasks'),
+        ('jobs', '0012_skill_m2m'),
+    ]
+
+    operations = [
+        migrations.RunPython(install_resume_index, uninstall_resume_index),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 6.0 on 2026-10-18 19:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# JobTerm starts out empty: run ``manage.py rebuild_match_index`` after
+# migrating so jobseeker skills can be checked against the jobs' terms.
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0013_resume_search_index'),
+    ]
+
+    operations = [
+        # Existing entries were linked when they were added
+        migrations.AddField(
+            model_name='skill',
+            name='backfill_pending',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AlterField(
+            model_name='skill',
+            name='backfill_pending',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.CreateModel(
+            name='JobTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=100)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='term_links', to='jobs.job')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('term', 'job'), name='jobterm_unique_term_job')],
+            },
+        ),
+    ]
@@ -1,15 +1,29 @@
 from django.db import models
 from django.utils import timezone
 from src.apps.accounts.models import Company, JobSeeker
+from .choices import JOB_TYPE_CHOICES, EXPERIENCE_LEVEL_CHOICES, REMOTE_POLICY_CHOICES
+from .salary import SALARY_PERIOD_CHOICES, parse_salary
 
 
 class Job(models.Model):
+    JOB_TYPE_CHOICES = JOB_TYPE_CHOICES
+    EXPERIENCE_LEVEL_CHOICES = EXPERIENCE_LEVEL_CHOICES
+    REMOTE_POLICY_CHOICES = REMOTE_POLICY_CHOICES
+    SALARY_PERIOD_CHOICES = SALARY_PERIOD_CHOICES
+
     company = models.ForeignKey(Company, on_delete=models.CASCADE, related_name="jobs")
+    # the job's id in the company's own system, set by import_jobs
+    external_id = models.CharField(max_length=100, blank=True, null=True)
     title = models.CharField(max_length=255)
     description = models.TextField()
     salary = models.CharField(max_length=100, blank=True, null=True)
+    # parsed from `salary` on save, see salary.py
+    salary_min = models.DecimalField(max_digits=12, decimal_places=2, blank=True, null=True)
+    salary_max = models.DecimalField(max_digits=12, decimal_places=2, blank=True, null=True)
+    salary_currency = models.CharField(max_length=3, blank=True, null=True)
+    salary_period = models.CharField(max_length=10, choices=SALARY_PERIOD_CHOICES, blank=True, null=True)
     location = models.CharField(max_length=255, blank=True, null=True)
-    job_type = models.CharField(max_length=50, blank=True, null=True)
+    job_type = models.CharField(max_length=50, choices=JOB_TYPE_CHOICES, blank=True, null=True)
     posted = models.DateField(default=timezone.now)
     requirements = models.JSONField(blank=True, null=True)
     responsibilities = models.JSONField(blank=True, null=True)
@@ -19,10 +33,58 @@ class Job(models.Model):
     saved = models.BooleanField(default=False)
     urgent = models.BooleanField(default=False)
     application_deadline = models.DateField(blank=True, null=True)
-    remote_policy = models.CharField(max_length=255, blank=True, null=True)
-    experience_level = models.CharField(max_length=100, blank=True, null=True)
+    remote_policy = models.CharField(max_length=255, choices=REMOTE_POLICY_CHOICES, blank=True, null=True)
+    experience_level = models.CharField(max_length=100, choices=EXPERIENCE_LEVEL_CHOICES, blank=True, null=True)
     education = models.CharField(max_length=255, blank=True, null=True)
+    # {field: text} of free-text job_type / experience_level / remote_policy
+    # values that migration 0007 rewrote, e.g. "Hybrid (3 days in office)"
+    legacy_enum_values = models.JSONField(blank=True, null=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["salary_min"], name="job_salary_min_idx"),
+            models.Index(fields=["salary_max"], name="job_salary_max_idx"),
+            # default listing order and keyset pagination
+            models.Index(fields=["-created_at", "id"], name="job_created_idx"),
+            # equality filters, served in the default order
+            models.Index(fields=["urgent", "-created_at"], name="job_urgent_created_idx"),
+            models.Index(fields=["job_type", "-created_at"], name="job_type_created_idx"),
+            models.Index(fields=["experience_level", "-created_at"], name="job_level_created_idx"),
+            models.Index(fields=["remote_policy", "-created_at"], name="job_remote_created_idx"),
+            models.Index(fields=["company", "-created_at"], name="job_company_created_idx"),
+            # date range filters
+            models.Index(fields=["posted"], name="job_posted_idx"),
+            models.Index(fields=["application_deadline"], name="job_deadline_idx"),
+        ]
+        constraints = [
+            # upsert key for import_jobs; NULLs don't collide
+            models.UniqueConstraint(fields=["company", "external_id"], name="job_company_external_id"),
+            models.CheckConstraint(
+                condition=models.Q(job_type__isnull=True) | models.Q(job_type__in=[c[0] for c in JOB_TYPE_CHOICES]),
+                name="job_type_valid",
+            ),
+            models.CheckConstraint(
+                condition=models.Q(experience_level__isnull=True)
+                | models.Q(experience_level__in=[c[0] for c in EXPERIENCE_LEVEL_CHOICES]),
+                name="job_experience_level_valid",
+            ),
+            models.CheckConstraint(
+                condition=models.Q(remote_policy__isnull=True)
+                | models.Q(remote_policy__in=[c[0] for c in REMOTE_POLICY_CHOICES]),
+                name="job_remote_policy_valid",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.update_salary_range()
+        super().save(*args, **kwargs)
+
+    def update_salary_range(self):
+        """Refresh the numeric salary columns from the free-text `salary`."""
+        for field, value in parse_salary(self.salary)._asdict().items():
+            setattr(self, field, value)
 
     def __str__(self):
         return f"{self.title} @ {self.company.company_name}"
@@ -40,7 +102,81 @@ class Application(models.Model):
     cover_letter = models.TextField()
     applied_at = models.DateTimeField(auto_now_add=True)
     status = models.CharField(max_length=50, default="Pending")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # ApplicationListView: ?job=&status= in -applied_at order
+            models.Index(fields=["job", "status", "-applied_at"], name="app_job_status_applied_idx"),
+            models.Index(fields=["job", "-applied_at"], name="app_job_applied_idx"),
+            # MyApplicationsListView
+            models.Index(fields=["jobseeker", "-applied_at"], name="app_seeker_applied_idx"),
+            models.Index(fields=["-applied_at", "id"], name="app_applied_idx"),
+        ]
+        constraints = [
+            # One application per jobseeker and job; also the duplicate check
+            models.UniqueConstraint(fields=["job", "jobseeker"], name="app_unique_job_jobseeker"),
+        ]
 
     def __str__(self):
         # Updated: company username → job title
         return f"{self.job.company.user.username} → {self.job.title}"
+
+
+# ====================================
+#           SKILL VECTORS (matching.py)
+# ====================================
+
+class Skill(models.Model):
+    """One entry of the shared skill vocabulary, stored normalized ("python", "react")."""
+    name = models.CharField(max_length=100, unique=True)
+    # Jobs and jobseekers indexed before the entry existed aren't linked to it
+    # yet; ``rebuild_match_index --pending`` does that (see matching.py)
+    backfill_pending = models.BooleanField(default=True)
+    # job.skill_set / jobseeker.skill_set; the links are maintained by matching.py
+    jobs = models.ManyToManyField(Job, through="JobSkill", related_name="skill_set")
+    jobseekers = models.ManyToManyField(JobSeeker, through="JobSeekerSkill", related_name="skill_set")
+
+    def __str__(self):
+        return self.name
+
+
+class JobSkill(models.Model):
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="skill_links")
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name="job_links")
+    # 1 / the job's skill count, so a job's weights sum to 1
+    weight = models.FloatField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["job", "skill"], name="jobskill_unique_job_skill"),
+        ]
+        indexes = [
+            # scoring walks the postings of a seeker's skills
+            models.Index(fields=["skill", "job"], name="jobskill_skill_job_idx"),
+        ]
+
+
+class JobSeekerSkill(models.Model):
+    jobseeker = models.ForeignKey(JobSeeker, on_delete=models.CASCADE, related_name="skill_links")
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name="jobseeker_links")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["jobseeker", "skill"], name="seekerskill_unique_seeker_skill"),
+        ]
+        indexes = [
+            models.Index(fields=["skill", "jobseeker"], name="seekerskill_skill_seeker_idx"),
+        ]
+
+
+class JobTerm(models.Model):
+    """A skill-shaped term (word n-gram) in a job's title or requirements, vocabulary or not."""
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="term_links")
+    term = models.CharField(max_length=100)
+
+    class Meta:
+        constraints = [
+            # Also the index the "does any job mention it" lookups walk
+            models.UniqueConstraint(fields=["term", "job"], name="jobterm_unique_term_job"),
+        ]
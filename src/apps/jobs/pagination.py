@@ -1,12 +1,304 @@
-from rest_framework.pagination import PageNumberPagination
+import base64
+import json
+from collections import OrderedDict
 
-class JobPagination(PageNumberPagination):
+from asgiref.sync import sync_to_async
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import InvalidPage, Page
+from django.db.models import F, Q
+from rest_framework import exceptions
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Keyset pagination on ``(<ordering field>, id)``.
+
+    Unlike DRF's CursorPagination, which filters on the first ordering field
+    and skips ties with an OFFSET, the cursor here holds the full
+    ``(value, id)`` key of the boundary row, so every page, however deep, is a
+    single index range scan and duplicate values (e.g. equal salaries) can't
+    shift rows between pages. NULLs always sort last.
+
+    No COUNT(*) is run unless the client asks for ``?with_count=true``, and
+    even then it is capped at ``count_limit``.
+    """
+    page_size_query_param = 'page_size'
+    tiebreaker = 'id'
+    count_query_param = 'with_count'
+    count_limit = 10000
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        # Only the leading field takes part in the key; id keeps it unique.
+        field = ordering[0]
+        if field.lstrip('-') in (self.tiebreaker, 'pk'):
+            return (field.replace('pk', self.tiebreaker),)
+        try:
+            queryset.model._meta.get_field(field.lstrip('-'))
+        except FieldDoesNotExist:
+            # A computed ordering (e.g. match_score) has no column to resume from
+            raise exceptions.ValidationError({'ordering': [
+                f"'{field.lstrip('-')}' is computed per request; page it by number, not pagination=cursor."
+            ]})
+        return (field, self.tiebreaker)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.model = queryset.model
+        self.reverse, position = self.decode_cursor(request)
+
+        self.count = None
+        if request.query_params.get(self.count_query_param) in ('1', 'true', 'True'):
+            self.count = queryset[:self.count_limit].count()
+
+        queryset = queryset.order_by(*self.get_order_by(self.reverse))
+        if position is not None:
+            queryset = queryset.filter(self.get_position_filter(position, self.reverse))
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[:self.page_size]
+        if self.reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    # -- ordering -----------------------------------------------------------
+
+    def _key_fields(self):
+        """[(field name, descending, nullable)] for the key columns."""
+        fields = []
+        for order in self.ordering:
+            name = order.lstrip('-')
+            try:
+                nullable = self.model._meta.get_field(name).null
+            except FieldDoesNotExist:
+                nullable = False
+            fields.append((name, order.startswith('-'), nullable))
+        return fields
+
+    def get_order_by(self, reverse):
+        # NULLs go last going forward, so first when walking backwards.
+        nulls = {'nulls_first': True} if reverse else {'nulls_last': True}
+        order_by = []
+        for name, descending, nullable in self._key_fields():
+            if not nullable:
+                # Plain column ordering so the composite indexes can serve it.
+                order_by.append(name if descending == reverse else f'-{name}')
+                continue
+            expression = F(name)
+            order_by.append(expression.desc(**nulls) if descending != reverse else expression.asc(**nulls))
+        return order_by
+
+    def get_position_filter(self, position, reverse):
+        """Rows strictly after (or, when ``reverse``, before) ``position``."""
+        if len(self.ordering) == 1:
+            value, = position
+            lookup = 'lt' if self.ordering[0].startswith('-') != reverse else 'gt'
+            return Q(**{f'{self.tiebreaker}__{lookup}': value})
+
+        (name, descending, nullable), _ = self._key_fields()
+        value, pk = position
+        pk_lookup = 'lt' if reverse else 'gt'
+        tie = Q(**{f'{self.tiebreaker}__{pk_lookup}': pk})
+
+        if value is None:
+            if reverse:
+                return Q(**{f'{name}__isnull': False}) | (Q(**{f'{name}__isnull': True}) & tie)
+            return Q(**{f'{name}__isnull': True}) & tie
+
+        lookup = 'lt' if descending != reverse else 'gt'
+        condition = Q(**{f'{name}__{lookup}': value}) | (Q(**{name: value}) & tie)
+        if nullable and not reverse:
+            condition |= Q(**{f'{name}__isnull': True})
+        return condition
+
+    # -- cursors ------------------------------------------------------------
+
+    def _get_position_from_instance(self, instance, ordering):
+        position = []
+        for order in ordering:
+            value = getattr(instance, order.lstrip('-'))
+            position.append(value.isoformat() if hasattr(value, 'isoformat') else value)
+        return position
+
+    def encode_cursor(self, reverse, position):
+        payload = json.dumps({'r': int(reverse), 'p': position}, separators=(',', ':'), default=str)
+        encoded = base64.urlsafe_b64encode(payload.encode('ascii')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return False, None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')))
+            position = payload['p']
+            if len(position) != len(self.ordering):
+                raise ValueError
+            # Cursor values are JSON; turn them back into model values.
+            position = [
+                None if value is None else self.model._meta.get_field(order.lstrip('-')).to_python(value)
+                for order, value in zip(self.ordering, position)
+            ]
+            return bool(payload.get('r')), position
+        except (TypeError, ValueError, KeyError, UnicodeError, ValidationError, FieldDoesNotExist):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self.encode_cursor(False, self._get_position_from_instance(self.page[-1], self.ordering))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        return self.encode_cursor(True, self._get_position_from_instance(self.page[0], self.ordering))
+
+    def get_paginated_response(self, data):
+        fields = [('next', self.get_next_link()), ('previous', self.get_previous_link())]
+        if self.count is not None:
+            fields.insert(0, ('count', self.count))
+            fields.insert(1, ('count_is_exact', self.count < self.count_limit))
+        return Response(OrderedDict(fields + [('results', data)]))
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema['properties'] = {
+            'count': {'type': 'integer', 'example': 123},
+            'count_is_exact': {'type': 'boolean'},
+            **response_schema['properties'],
+        }
+        return response_schema
+
+    def get_schema_operation_parameters(self, view):
+        return super().get_schema_operation_parameters(view) + [
+            {
+                'name': self.count_query_param,
+                'required': False,
+                'in': 'query',
+                'description': f'Include a result count, capped at {self.count_limit}.',
+                'schema': {'type': 'boolean'},
+            },
+        ]
+
+
+class CursorModeMixin:
+    """
+    Page-number pagination that switches to ``cursor_pagination_class`` when
+    the client sends ``?cursor=`` or ``?pagination=cursor``.
+    """
+    cursor_pagination_class = None
+    mode_query_param = 'pagination'
+
+    def wants_cursor(self, request):
+        return bool(request.query_params.get(self.cursor_pagination_class.cursor_query_param)
+                    or request.query_params.get(self.mode_query_param) == 'cursor')
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_paginator = None
+        if self.wants_cursor(request):
+            self.cursor_paginator = self.cursor_pagination_class()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        ``paginate_queryset()`` for async views: the COUNT and the page go
+        through the async ORM. Cursor pages run the sync code in a thread.
+        """
+        if self.wants_cursor(request):
+            return await sync_to_async(self.paginate_queryset)(queryset, request, view)
+
+        self.cursor_paginator = None
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        paginator = self.django_paginator_class(queryset, page_size)
+        # Paginator.count is a cached property; fill it so it doesn't query
+        paginator.count = await queryset.acount()
+        page_number = self.get_page_number(request, paginator)
+        try:
+            number = paginator.validate_number(page_number)
+        except InvalidPage as exc:
+            raise NotFound(self.invalid_page_message.format(page_number=page_number, message=str(exc)))
+
+        bottom = (number - 1) * page_size
+        rows = [row async for row in queryset[bottom:bottom + page_size].aiterator()]
+        self.page = Page(rows, number, paginator)
+        self.request = request
+        return rows
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def to_html(self):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.to_html()
+        return super().to_html()
+
+    def get_schema_operation_parameters(self, view):
+        return super().get_schema_operation_parameters(view) + [
+            {
+                'name': self.mode_query_param,
+                'required': False,
+                'in': 'query',
+                'description': "Set to 'cursor' for keyset pagination (no COUNT, constant cost per page).",
+                'schema': {'type': 'string', 'enum': ['page', 'cursor']},
+            },
+        ] + self.cursor_pagination_class().get_schema_operation_parameters(view)
+
+
+class JobCursorPagination(KeysetPagination):
+    page_size = 10
+    max_page_size = 50
+    ordering = ('-created_at',)
+
+
+class ApplicationCursorPagination(KeysetPagination):
+    page_size = 20
+    max_page_size = 100
+    ordering = ('-applied_at',)
+
+
+class JobPagination(CursorModeMixin, PageNumberPagination):
     page_size = 10
     page_size_query_param = 'page_size'
     max_page_size = 50
+    cursor_pagination_class = JobCursorPagination
+
+
+class ApplicationPagination(CursorModeMixin, PageNumberPagination):
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_pagination_class = ApplicationCursorPagination
+
+
+class TalentPagination(PageNumberPagination):
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
 
 
-class ApplicationPagination(PageNumberPagination):
+class ApplicantSearchPagination(PageNumberPagination):
     page_size = 20
     page_size_query_param = 'page_size'
     max_page_size = 100
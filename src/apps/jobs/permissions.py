@@ -13,11 +13,11 @@ class IsJobSeekerUser(BasePermission):
 class IsJobOwner(BasePermission):
     """Allow object-level access only if job belongs to the authenticated company"""
     def has_object_permission(self, request, view, obj):
-        return hasattr(request.user, 'company_profile') and obj.company == request.user.company_profile
+        return hasattr(request.user, 'company_profile') and obj.company_id == request.user.company_profile.id
 
 class IsApplicationOwner(BasePermission):
     """Allow object-level access only if application belongs to the company's job"""
     def has_object_permission(self, request, view, obj):
         if hasattr(request.user, 'company_profile'):
-            return obj.job.company == request.user.company_profile
+            return obj.job.company_id == request.user.company_profile.id
         return False
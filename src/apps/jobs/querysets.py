@@ -0,0 +1,141 @@
+"""
+Query shapes declared by serializers.
+
+A serializer lists the related columns each of its fields reads in
+``Meta.related_fields``::
+
+    related_fields = {
+        "company_name": ["company__company_name"],
+    }
+
+``shape_queryset`` turns that declaration (plus the serializer's own model
+fields) into ``select_related()`` + ``only()``, so serializing a page costs
+one query no matter how many rows it holds.
+"""
+from rest_framework.exceptions import ValidationError
+
+
+def get_query_shape(serializer_class, field_names=None):
+    """Return ``(select_related, only)`` for the given serializer fields.
+
+    ``field_names`` defaults to ``Meta.fields``; pass a subset to load only
+    the columns those fields need.
+    """
+    meta = serializer_class.Meta
+    related_fields = getattr(meta, "related_fields", {})
+    concrete = {field.name for field in meta.model._meta.concrete_fields}
+    if field_names is None:
+        field_names = meta.fields
+
+    select_related = set()
+    only = {meta.model._meta.pk.name}
+    for name in field_names:
+        if name in concrete:
+            only.add(name)
+        for path in related_fields.get(name, ()):
+            parts = path.split("__")
+            # Every hop has to be loaded for the join to be traversed.
+            for depth in range(1, len(parts)):
+                only.add("__".join(parts[:depth]))
+            only.add(path)
+            if len(parts) > 1:
+                select_related.add("__".join(parts[:-1]))
+
+    # Drop relations that are a prefix of a deeper one; select_related
+    # follows the whole path anyway.
+    select_related = sorted(
+        path for path in select_related
+        if not any(other.startswith(path + "__") for other in select_related)
+    )
+    return select_related, sorted(only)
+
+
+def shape_queryset(queryset, serializer_class, field_names=None):
+    """Apply the serializer's declared query shape to ``queryset``."""
+    if not hasattr(serializer_class.Meta, "related_fields"):
+        return queryset
+    select_related, only = get_query_shape(serializer_class, field_names)
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    return queryset.only(*only)
+
+
+class QueryShapeMixin:
+    """Generic view mixin that shapes the queryset for ``serializer_class``.
+
+    Hooked into ``filter_queryset`` so it covers both ``list()`` and
+    ``get_object()`` without each view repeating the joins.
+    """
+
+    def get_field_names(self):
+        """The serializer fields this request renders; None for all of them."""
+        return None
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        return shape_queryset(queryset, self.get_serializer_class(), self.get_field_names())
+
+
+class SparseFieldsMixin(QueryShapeMixin):
+    """
+    Let GET requests pick the fields they need.
+
+    ``?fields=title,location`` renders only those fields, ``?omit=description``
+    all but those. Besides field names, ``fields`` takes the names of the
+    serializer's ``Meta.fieldsets`` (``card``, ``full``), and ``omit`` applies
+    on top of it. Without ``fields`` the view renders ``default_fieldset``,
+    or every field when that is None.
+
+    The selection narrows the query shape as well, so columns of fields
+    that aren't rendered are neither read from the database nor decoded.
+    The serializer has to accept a ``fields`` argument (``DynamicFieldsMixin``).
+    """
+    default_fieldset = None
+    fields_param = 'fields'
+    omit_param = 'omit'
+
+    def get_field_names(self):
+        if not hasattr(self, '_field_names'):
+            self._field_names = self.select_fields()
+        return self._field_names
+
+    def select_fields(self):
+        if self.request is None or self.request.method not in ('GET', 'HEAD'):
+            return None
+        meta = self.get_serializer_class().Meta
+        fieldsets = getattr(meta, 'fieldsets', {})
+        requested = _split(self.request.query_params.get(self.fields_param, ''))
+        omitted = _split(self.request.query_params.get(self.omit_param, ''))
+        if not requested and not omitted and self.default_fieldset is None:
+            return None
+
+        errors = {}
+        names = []
+        for name in requested or [self.default_fieldset or 'full']:
+            if name in fieldsets:
+                names += fieldsets[name]
+            elif name == 'full':
+                names += meta.fields
+            elif name in meta.fields:
+                names.append(name)
+            else:
+                errors.setdefault(self.fields_param, []).append(f'Unknown field "{name}".')
+        unknown = [name for name in omitted if name not in meta.fields]
+        if unknown:
+            errors[self.omit_param] = [f'Unknown field "{name}".' for name in unknown]
+        if errors:
+            raise ValidationError(errors)
+
+        selected = set(names) - set(omitted)
+        # In Meta.fields order, like a full response
+        return [name for name in meta.fields if name in selected]
+
+    def get_serializer(self, *args, **kwargs):
+        field_names = self.get_field_names()
+        if field_names is not None:
+            kwargs.setdefault('fields', field_names)
+        return super().get_serializer(*args, **kwargs)
+
+
+def _split(value):
+    return [name.strip() for name in value.split(',') if name.strip()]
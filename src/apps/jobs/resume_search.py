@@ -0,0 +1,250 @@
+"""
+Full-text search over applicants' resumes.
+
+The media worker extracts each uploaded resume into
+``JobSeeker.resume_text`` once (see ``accounts/media.py``) and then sends
+``media_updated``; ``signals.py`` copies the text into this index. No
+request reads or parses a resume file. As with the job index, the backend
+follows the database vendor unless ``RESUME_SEARCH_BACKEND`` names one:
+
+* SQLite     -> ``SQLiteResumeBackend`` (FTS5 table, bm25 ranking)
+* PostgreSQL -> ``PostgresResumeBackend`` (tsvector side table + GIN index)
+* otherwise  -> ``LikeResumeBackend`` (``icontains`` scan)
+
+``search()`` filters an ``Application`` queryset to applicants whose
+resume matches and annotates ``resume_rank`` (lower is better).
+``snippets()`` is run for the page of results only: highlighting is the
+expensive part, so it never runs over every match.
+"""
+import re
+
+from django.conf import settings
+from django.db import connection as default_connection
+from django.db.models import FloatField, Value
+from django.utils.html import escape
+from django.utils.module_loading import import_string
+
+from src.apps.accounts.models import JobSeeker
+from .search import parse_terms
+
+# Marks matched terms inside snippets; swapped for <mark> after escaping
+HIGHLIGHT = ("\x02", "\x03")
+SNIPPET_TOKENS = 24
+
+
+def render_snippet(snippet):
+    """The snippet as HTML: resume text escaped, matches in ``<mark>``."""
+    start, end = HIGHLIGHT
+    return escape(snippet).replace(start, "<mark>").replace(end, "</mark>")
+
+
+class LikeResumeBackend:
+    """``icontains`` on ``resume_text``, every term required."""
+
+    def __init__(self, connection=None):
+        self.connection = connection or default_connection
+
+    def install(self):
+        pass
+
+    def uninstall(self):
+        pass
+
+    def rebuild(self):
+        pass
+
+    def index_jobseekers(self, jobseeker_ids):
+        pass
+
+    def search(self, queryset, query):
+        for term in parse_terms(query):
+            queryset = queryset.filter(jobseeker__resume_text__icontains=term)
+        return queryset.annotate(resume_rank=Value(0.0, output_field=FloatField()))
+
+    def snippets(self, jobseeker_ids, query):
+        """``{jobseeker id: snippet}``, with ``HIGHLIGHT`` around each match."""
+        terms = parse_terms(query)
+        if not terms or not jobseeker_ids:
+            return {}
+        pattern = re.compile("|".join(re.escape(term) for term in terms), re.IGNORECASE)
+        snippets = {}
+        rows = JobSeeker.objects.filter(pk__in=jobseeker_ids).values_list("pk", "resume_text")
+        for pk, text in rows:
+            match = pattern.search(text)
+            if match is None:
+                continue
+            words = text[:match.start()].split()[-SNIPPET_TOKENS // 2:]
+            before = " ".join(words)
+            after = " ".join(text[match.start():].split()[:SNIPPET_TOKENS // 2])
+            window = (before + " " if before else "") + after
+            snippets[pk] = pattern.sub(lambda hit: HIGHLIGHT[0] + hit.group(0) + HIGHLIGHT[1], window)
+        return snippets
+
+
+class SQLiteResumeBackend(LikeResumeBackend):
+    """FTS5 table keyed by jobseeker id, holding the extracted resume text."""
+
+    table = "accounts_jobseeker_resume_fts"
+
+    def install(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.table} USING fts5("
+                "resume, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+            )
+
+    def uninstall(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {self.table}")
+
+    def _insert(self, where, params):
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {self.table} (rowid, resume) "
+                f"SELECT id, resume_text FROM accounts_jobseeker WHERE resume_text != '' AND {where}",
+                params,
+            )
+
+    def rebuild(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table}")
+        self._insert("1 = 1", [])
+
+    def index_jobseekers(self, jobseeker_ids):
+        jobseeker_ids = list(jobseeker_ids)
+        if not jobseeker_ids:
+            return
+        placeholders = ", ".join(["%s"] * len(jobseeker_ids))
+        # By id, so deleted jobseekers and emptied resumes drop out too
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table} WHERE rowid IN ({placeholders})", jobseeker_ids)
+        self._insert(f"id IN ({placeholders})", jobseeker_ids)
+
+    def match_expression(self, terms):
+        return " ".join(f'"{term}"*' for term in terms)
+
+    def search(self, queryset, query):
+        terms = parse_terms(query)
+        if not terms:
+            return queryset
+        return queryset.extra(
+            tables=[self.table],
+            where=[f"{self.table}.rowid = jobs_application.jobseeker_id", f"{self.table} MATCH %s"],
+            params=[self.match_expression(terms)],
+            select={"resume_rank": f"bm25({self.table})"},
+        )
+
+    def snippets(self, jobseeker_ids, query):
+        terms = parse_terms(query)
+        jobseeker_ids = list(jobseeker_ids)
+        if not terms or not jobseeker_ids:
+            return {}
+        placeholders = ", ".join(["%s"] * len(jobseeker_ids))
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT rowid, snippet({self.table}, 0, %s, %s, '…', %s) FROM {self.table} "
+                f"WHERE {self.table} MATCH %s AND rowid IN ({placeholders})",
+                [*HIGHLIGHT, SNIPPET_TOKENS, self.match_expression(terms), *jobseeker_ids],
+            )
+            return dict(cursor.fetchall())
+
+
+class PostgresResumeBackend(LikeResumeBackend):
+    """``tsvector`` side table with a GIN index; ranked with ts_rank, highlighted with ts_headline."""
+
+    table = "accounts_jobseeker_resume_search"
+
+    @property
+    def config(self):
+        return getattr(settings, "JOB_SEARCH_CONFIG", "english")
+
+    def install(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                "jobseeker_id bigint PRIMARY KEY REFERENCES accounts_jobseeker (id) ON DELETE CASCADE, "
+                "document tsvector NOT NULL)"
+            )
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.table}_document_gin "
+                f"ON {self.table} USING gin (document)"
+            )
+
+    def uninstall(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {self.table}")
+
+    def _reindex(self, where, params):
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {self.table} WHERE jobseeker_id IN "
+                f"(SELECT id FROM accounts_jobseeker WHERE resume_text = '' AND {where})",
+                params,
+            )
+            cursor.execute(
+                f"INSERT INTO {self.table} (jobseeker_id, document) "
+                "SELECT id, to_tsvector(%s::regconfig, resume_text) FROM accounts_jobseeker "
+                f"WHERE resume_text != '' AND {where} "
+                "ON CONFLICT (jobseeker_id) DO UPDATE SET document = EXCLUDED.document",
+                [self.config] + list(params),
+            )
+
+    def rebuild(self):
+        self._reindex("TRUE", [])
+
+    def index_jobseekers(self, jobseeker_ids):
+        jobseeker_ids = list(jobseeker_ids)
+        if jobseeker_ids:
+            self._reindex("id = ANY(%s)", [jobseeker_ids])
+
+    def tsquery(self, terms):
+        return " & ".join(f"{term}:*" for term in terms)
+
+    def search(self, queryset, query):
+        terms = parse_terms(query)
+        if not terms:
+            return queryset
+        tsquery = self.tsquery(terms)
+        return queryset.extra(
+            tables=[self.table],
+            where=[
+                f"{self.table}.jobseeker_id = jobs_application.jobseeker_id",
+                f"{self.table}.document @@ to_tsquery(%s::regconfig, %s)",
+            ],
+            params=[self.config, tsquery],
+            select={"resume_rank": f"-ts_rank({self.table}.document, to_tsquery(%s::regconfig, %s))"},
+            select_params=[self.config, tsquery],
+        )
+
+    def snippets(self, jobseeker_ids, query):
+        terms = parse_terms(query)
+        jobseeker_ids = list(jobseeker_ids)
+        if not terms or not jobseeker_ids:
+            return {}
+        options = (
+            f"StartSel={HIGHLIGHT[0]}, StopSel={HIGHLIGHT[1]}, MaxWords={SNIPPET_TOKENS}, "
+            "MinWords=8, MaxFragments=2, FragmentDelimiter=\" … \""
+        )
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT id, ts_headline(%s::regconfig, resume_text, to_tsquery(%s::regconfig, %s), %s) "
+                "FROM accounts_jobseeker WHERE id = ANY(%s)",
+                [self.config, self.config, self.tsquery(terms), options, jobseeker_ids],
+            )
+            return dict(cursor.fetchall())
+
+
+VENDOR_BACKENDS = {
+    "sqlite": SQLiteResumeBackend,
+    "postgresql": PostgresResumeBackend,
+}
+
+
+def get_resume_backend(connection=None):
+    connection = connection or default_connection
+    backend_path = getattr(settings, "RESUME_SEARCH_BACKEND", None)
+    if backend_path:
+        backend_class = import_string(backend_path)
+    else:
+        backend_class = VENDOR_BACKENDS.get(connection.vendor, LikeResumeBackend)
+    return backend_class(connection)
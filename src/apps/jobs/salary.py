@@ -0,0 +1,115 @@
+"""
+Parse the free-text ``Job.salary`` into numeric columns.
+
+    >>> parse_salary("$120,000 - $150,000")
+    SalaryRange(salary_min=Decimal('120000'), salary_max=Decimal('150000'), salary_currency='USD', salary_period=None)
+    >>> parse_salary("NPR 50k-80k per month")
+    SalaryRange(salary_min=Decimal('50000'), salary_max=Decimal('80000'), salary_currency='NPR', salary_period='month')
+
+Only numbers next to a currency marker or a k/m suffix are amounts (or
+the bare other end of such a range, "50-80k"). Anything that can't be read leaves the columns empty, so unparseable rows
+simply drop out of numeric salary filters instead of matching wrongly.
+"""
+import re
+from collections import namedtuple
+from decimal import Decimal, InvalidOperation
+
+SalaryRange = namedtuple("SalaryRange", "salary_min salary_max salary_currency salary_period")
+
+EMPTY = SalaryRange(None, None, None, None)
+
+SALARY_PERIOD_CHOICES = [
+    ("hour", "Hour"),
+    ("day", "Day"),
+    ("week", "Week"),
+    ("month", "Month"),
+    ("year", "Year"),
+]
+
+# An explicit code wins over a symbol: "AUD $120,000" is AUD
+CURRENCY_CODES = ["USD", "EUR", "GBP", "INR", "NPR", "AUD", "CAD", "JPY"]
+CURRENCY_PATTERNS = [
+    *[(code, re.compile(rf"\b{code.lower()}\b")) for code in CURRENCY_CODES],
+    ("AUD", re.compile(r"\ba(u)?\$")),
+    ("CAD", re.compile(r"\bc\$")),
+    ("USD", re.compile(r"\$")),
+    ("EUR", re.compile(r"€")),
+    ("GBP", re.compile(r"£")),
+    ("INR", re.compile(r"₹")),
+    ("NPR", re.compile(r"\brs\.?(?=\s|\d)")),
+    ("JPY", re.compile(r"¥")),
+]
+
+PERIOD_PATTERNS = [
+    ("hour", re.compile(r"(/\s*h(ou)?r\b|\bper\s+hour\b|\bhourly\b|\ban?\s+hour\b)")),
+    ("day", re.compile(r"(/\s*day\b|\bper\s+day\b|\bdaily\b|\ba\s+day\b)")),
+    ("week", re.compile(r"(/\s*w(ee)?k\b|\bper\s+week\b|\bweekly\b|\ba\s+week\b)")),
+    ("month", re.compile(r"(/\s*mo(nth)?\b|\bper\s+month\b|\bmonthly\b|\ba\s+month\b|\bp\.?m\.?$)")),
+    ("year", re.compile(r"(/\s*y(ea)?r\b|\bper\s+(year|annum)\b|\bannual(ly)?\b|\byearly\b|\bp\.?a\.?$|\ba\s+year\b)")),
+]
+
+# A number is only an amount next to a currency marker or a k/m suffix, so
+# "3 years experience, $90k" doesn't read as 3 - 90,000
+_CODES = "|".join(code.lower() for code in CURRENCY_CODES)
+AMOUNT_RE = re.compile(
+    rf"(?P<prefix>(?:[$€£₹¥]|\b(?:{_CODES}|rs\.?))\s*)?"
+    r"(?P<number>\d[\d,]*(?:\.\d+)?)\s*(?P<suffix>[km])?\b"
+    rf"(?P<code>\s*(?:{_CODES})\b)?"
+)
+RANGE_SEPARATOR_RE = re.compile(r"\s*(-|–|—|to)\s*")
+MULTIPLIERS = {"k": Decimal(1000), "m": Decimal(1000000)}
+MAX_AMOUNT = Decimal("9999999999")
+
+
+def _amounts(text):
+    """
+    The marked amounts in ``text``. An unmarked number joined by a range
+    separator to a marked one counts too, taking its suffix: "50-80k" is
+    50,000 - 80,000.
+    """
+    found = []
+    for match in AMOUNT_RE.finditer(text):
+        try:
+            value = Decimal(match["number"].replace(",", ""))
+        except InvalidOperation:
+            continue
+        marked = bool(match["prefix"] or match["suffix"] or match["code"])
+        found.append([match, value, match["suffix"], marked])
+
+    for left, right in zip(found, found[1:]):
+        if left[3] == right[3] or not RANGE_SEPARATOR_RE.fullmatch(text, left[0].end(), right[0].start()):
+            continue
+        marked, unmarked = (left, right) if left[3] else (right, left)
+        unmarked[2], unmarked[3] = marked[2], True
+
+    amounts = []
+    for _, value, suffix, marked in found:
+        value *= MULTIPLIERS.get(suffix, 1)
+        if marked and 0 < value <= MAX_AMOUNT:
+            amounts.append(value)
+    return amounts
+
+
+def parse_salary(text):
+    """Return a ``SalaryRange`` for a salary string; fields are None when unknown."""
+    if not text:
+        return EMPTY
+    lowered = text.strip().lower()
+
+    amounts = _amounts(lowered)
+    if not amounts:
+        return EMPTY
+
+    currency = next((code for code, pattern in CURRENCY_PATTERNS if pattern.search(lowered)), None)
+    period = next((name for name, pattern in PERIOD_PATTERNS if pattern.search(lowered)), None)
+
+    if len(amounts) >= 2:
+        low, high = sorted(amounts[:2])
+    elif re.search(r"\b(up\s*to|max(imum)?|under)\b", lowered):
+        low, high = None, amounts[0]
+    elif re.search(r"(\+|\b(from|min(imum)?|starting|at\s+least)\b)", lowered):
+        low, high = amounts[0], None
+    else:
+        low = high = amounts[0]
+
+    return SalaryRange(low, high, currency, period)
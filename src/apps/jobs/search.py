@@ -0,0 +1,238 @@
+"""
+Full-text search over jobs.
+
+The search index is a side table keyed by job id that holds the job's
+title, description, location and company name. It is kept in sync by the
+signals in ``signals.py``. Which backend is used comes from the
+``JOB_SEARCH_BACKEND`` setting; by default it follows the database vendor:
+
+* SQLite     -> ``SQLiteFTSBackend`` (FTS5 virtual table, bm25 ranking)
+* PostgreSQL -> ``PostgresSearchBackend`` (tsvector column + GIN index)
+* otherwise  -> ``LikeSearchBackend`` (the old ``icontains`` scan)
+
+Every backend filters a ``Job`` queryset and annotates it with
+``search_rank``, where lower means more relevant.
+"""
+import re
+
+from django.conf import settings
+from django.db import connection as default_connection
+from django.db.models import FloatField, Q, Value
+from django.utils.module_loading import import_string
+
+MAX_TERMS = 8
+TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def parse_terms(query):
+    """Split a user query into lower-cased word terms."""
+    return TERM_RE.findall((query or "").lower())[:MAX_TERMS]
+
+
+class LikeSearchBackend:
+    """``icontains`` over each field, every term required (SearchFilter semantics)."""
+
+    search_fields = ["title", "description", "location", "company__company_name"]
+
+    def __init__(self, connection=None):
+        self.connection = connection or default_connection
+
+    def install(self):
+        pass
+
+    def uninstall(self):
+        pass
+
+    def rebuild(self):
+        pass
+
+    def index_jobs(self, job_ids):
+        pass
+
+    def index_company(self, company_id):
+        pass
+
+    def remove_jobs(self, job_ids):
+        pass
+
+    def search(self, queryset, query):
+        terms = parse_terms(query)
+        if not terms:
+            return queryset
+        for term in terms:
+            condition = Q()
+            for field in self.search_fields:
+                condition |= Q(**{f"{field}__icontains": term})
+            queryset = queryset.filter(condition)
+        return queryset.annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+
+class SQLiteFTSBackend(LikeSearchBackend):
+    """FTS5 virtual table with a prefix index; ranked with weighted bm25."""
+
+    table = "jobs_job_fts"
+    # bm25 column weights: title, description, location, company_name
+    weights = (10.0, 1.0, 2.0, 5.0)
+
+    def install(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.table} USING fts5("
+                "title, description, location, company_name, "
+                "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+            )
+
+    def uninstall(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {self.table}")
+
+    def _reindex(self, where, params):
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {self.table} WHERE rowid IN "
+                f"(SELECT jobs_job.id FROM jobs_job WHERE {where})",
+                params,
+            )
+            cursor.execute(
+                f"INSERT INTO {self.table} (rowid, title, description, location, company_name) "
+                "SELECT jobs_job.id, jobs_job.title, jobs_job.description, "
+                "COALESCE(jobs_job.location, ''), accounts_company.company_name "
+                "FROM jobs_job INNER JOIN accounts_company "
+                "ON accounts_company.id = jobs_job.company_id "
+                f"WHERE {where}",
+                params,
+            )
+
+    def rebuild(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table}")
+        self._reindex("1 = 1", [])
+
+    def index_jobs(self, job_ids):
+        job_ids = list(job_ids)
+        if job_ids:
+            placeholders = ", ".join(["%s"] * len(job_ids))
+            self._reindex(f"jobs_job.id IN ({placeholders})", job_ids)
+
+    def index_company(self, company_id):
+        self._reindex("jobs_job.company_id = %s", [company_id])
+
+    def remove_jobs(self, job_ids):
+        job_ids = list(job_ids)
+        if job_ids:
+            placeholders = ", ".join(["%s"] * len(job_ids))
+            with self.connection.cursor() as cursor:
+                cursor.execute(
+                    f"DELETE FROM {self.table} WHERE rowid IN ({placeholders})", job_ids
+                )
+
+    def match_expression(self, terms):
+        # Quoted terms can't be parsed as FTS5 operators; '*' asks for a prefix match.
+        return " ".join(f'"{term}"*' for term in terms)
+
+    def search(self, queryset, query):
+        terms = parse_terms(query)
+        if not terms:
+            return queryset
+        weights = ", ".join(str(weight) for weight in self.weights)
+        # A join, not a correlated subquery: bm25() is then computed once per
+        # hit during the single MATCH scan.
+        return queryset.extra(
+            tables=[self.table],
+            where=[f"{self.table}.rowid = jobs_job.id", f"{self.table} MATCH %s"],
+            params=[self.match_expression(terms)],
+            select={"search_rank": f"bm25({self.table}, {weights})"},
+        )
+
+
+class PostgresSearchBackend(LikeSearchBackend):
+    """Weighted ``tsvector`` side table with a GIN index; ranked with ts_rank."""
+
+    table = "jobs_job_search"
+
+    @property
+    def config(self):
+        return getattr(settings, "JOB_SEARCH_CONFIG", "english")
+
+    def install(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                "job_id bigint PRIMARY KEY REFERENCES jobs_job (id) ON DELETE CASCADE, "
+                "document tsvector NOT NULL)"
+            )
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.table}_document_gin "
+                f"ON {self.table} USING gin (document)"
+            )
+
+    def uninstall(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {self.table}")
+
+    def _reindex(self, where, params):
+        vector = (
+            "setweight(to_tsvector(%s::regconfig, jobs_job.title), 'A') || "
+            "setweight(to_tsvector(%s::regconfig, accounts_company.company_name), 'B') || "
+            "setweight(to_tsvector(%s::regconfig, COALESCE(jobs_job.location, '')), 'B') || "
+            "setweight(to_tsvector(%s::regconfig, jobs_job.description), 'C')"
+        )
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {self.table} (job_id, document) "
+                f"SELECT jobs_job.id, {vector} "
+                "FROM jobs_job INNER JOIN accounts_company "
+                "ON accounts_company.id = jobs_job.company_id "
+                f"WHERE {where} "
+                "ON CONFLICT (job_id) DO UPDATE SET document = EXCLUDED.document",
+                [self.config] * 4 + list(params),
+            )
+
+    def rebuild(self):
+        self._reindex("TRUE", [])
+
+    def index_jobs(self, job_ids):
+        job_ids = list(job_ids)
+        if job_ids:
+            self._reindex("jobs_job.id = ANY(%s)", [job_ids])
+
+    def index_company(self, company_id):
+        self._reindex("jobs_job.company_id = %s", [company_id])
+
+    def remove_jobs(self, job_ids):
+        job_ids = list(job_ids)
+        if job_ids:
+            with self.connection.cursor() as cursor:
+                cursor.execute(f"DELETE FROM {self.table} WHERE job_id = ANY(%s)", [job_ids])
+
+    def search(self, queryset, query):
+        terms = parse_terms(query)
+        if not terms:
+            return queryset
+        tsquery = " & ".join(f"{term}:*" for term in terms)
+        return queryset.extra(
+            tables=[self.table],
+            where=[
+                f"{self.table}.job_id = jobs_job.id",
+                f"{self.table}.document @@ to_tsquery(%s::regconfig, %s)",
+            ],
+            params=[self.config, tsquery],
+            select={"search_rank": f"-ts_rank({self.table}.document, to_tsquery(%s::regconfig, %s))"},
+            select_params=[self.config, tsquery],
+        )
+
+
+VENDOR_BACKENDS = {
+    "sqlite": SQLiteFTSBackend,
+    "postgresql": PostgresSearchBackend,
+}
+
+
+def get_search_backend(connection=None):
+    connection = connection or default_connection
+    backend_path = getattr(settings, "JOB_SEARCH_BACKEND", None)
+    if backend_path:
+        backend_class = import_string(backend_path)
+    else:
+        backend_class = VENDOR_BACKENDS.get(connection.vendor, LikeSearchBackend)
+    return backend_class(connection)
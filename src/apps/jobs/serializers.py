@@ -1,19 +1,74 @@
 from rest_framework import serializers
+from .choices import canonical_job_type, canonical_experience_level, canonical_remote_policy
+from src.apps.accounts.models import JobSeeker
 from .models import Job, Application
+from .resume_search import render_snippet
 
-class JobSerializer(serializers.ModelSerializer):
+
+class CanonicalChoiceField(serializers.ChoiceField):
+    """ChoiceField that accepts common variants ("full time", "FT") of a choice."""
+
+    def __init__(self, canonicalize, **kwargs):
+        self.canonicalize = canonicalize
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        if data in ('', None):
+            return None
+        return super().to_internal_value(self.canonicalize(data) or data)
+
+
+class IsoDateField(serializers.DateField):
+    """
+    Read-only ISO date. Unlike DateField it also renders the datetime that
+    ``Job.posted`` holds until a new job is reloaded (its default is ``timezone.now``).
+    """
+
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return value.isoformat() if value else None
+
+
+class DynamicFieldsMixin:
+    """Take a ``fields`` argument naming the fields to keep (see ``SparseFieldsMixin``)."""
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+class JobSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     company_name = serializers.CharField(source='company.company_name', read_only=True)
     company_username = serializers.CharField(source='company.user.username', read_only=True)
     company_id = serializers.CharField(source="company.company_id", read_only=True)
 
-    posted = serializers.SerializerMethodField()
-    application_deadline = serializers.SerializerMethodField()
+    job_type = CanonicalChoiceField(
+        canonical_job_type, choices=Job.JOB_TYPE_CHOICES, required=False, allow_null=True, allow_blank=True
+    )
+    experience_level = CanonicalChoiceField(
+        canonical_experience_level, choices=Job.EXPERIENCE_LEVEL_CHOICES, required=False, allow_null=True, allow_blank=True
+    )
+    remote_policy = CanonicalChoiceField(
+        canonical_remote_policy, choices=Job.REMOTE_POLICY_CHOICES, required=False, allow_null=True, allow_blank=True
+    )
+
+    salary_min = serializers.DecimalField(max_digits=12, decimal_places=2, coerce_to_string=False, read_only=True)
+    salary_max = serializers.DecimalField(max_digits=12, decimal_places=2, coerce_to_string=False, read_only=True)
+
+    posted = IsoDateField()
+    application_deadline = IsoDateField()
 
 
     class Meta:
         model = Job
         fields = [
-            'id', 'title', 'description', 'salary', 'location', 
+            'id', 'title', 'description', 'salary', 'salary_min', 'salary_max',
+            'salary_currency', 'salary_period', 'location',
             'job_type', 'posted', 'requirements', 'responsibilities', 
             'benefits', 'company_info', 'applicants_count', 'saved', 
             'urgent', 'application_deadline', 'remote_policy', 
@@ -21,19 +76,44 @@ class JobSerializer(serializers.ModelSerializer):
             'company_name', 'company_username','company_id'
         ]
         read_only_fields = [
-            'id', 'company', 'posted', 'applicants_count', 
-            'created_at', 'company_name', 'company_username', 'company_id'
+            'id', 'company', 'posted', 'applicants_count', 'salary_min', 'salary_max',
+            'salary_currency', 'salary_period', 'created_at', 'company_name', 'company_username', 'company_id'
         ]
+        related_fields = {
+            'company_name': ['company__company_name'],
+            'company_username': ['company__user__username'],
+            'company_id': ['company__company_id'],
+        }
+        # What a job card in a list shows: no description or JSON blobs
+        card_fields = [
+            'id', 'title', 'salary', 'salary_min', 'salary_max', 'salary_currency', 'salary_period',
+            'location', 'job_type', 'posted', 'applicants_count', 'urgent', 'application_deadline',
+            'remote_policy', 'experience_level', 'created_at', 'company_name', 'company_id',
+        ]
+        fieldsets = {'card': card_fields}
+
 
-    def get_posted(self, obj):
-        if obj.posted:
-            return obj.posted.isoformat()
-        return None
+class JobImportSerializer(JobSerializer):
+    """
+    JobSerializer rules for rows of an import_jobs feed: the feed's
+    ``external_id`` is required and the posting dates are writable.
+    """
+    external_id = serializers.CharField(max_length=100)
+    posted = serializers.DateField(required=False)
+    application_deadline = serializers.DateField(required=False, allow_null=True)
 
-    def get_application_deadline(self, obj):
-        if obj.application_deadline:
-            return obj.application_deadline.isoformat()
-        return None
+    class Meta(JobSerializer.Meta):
+        fields = ['external_id'] + JobSerializer.Meta.fields
+
+
+class JobMatchSerializer(JobSerializer):
+    """A recommended job with its match score (see matching.py)."""
+    match_score = serializers.FloatField(read_only=True)
+    matched_skills = serializers.ListField(child=serializers.CharField(), read_only=True)
+
+    class Meta(JobSerializer.Meta):
+        fields = JobSerializer.Meta.fields + ['match_score', 'matched_skills']
+        fieldsets = {'card': JobSerializer.Meta.card_fields + ['match_score', 'matched_skills']}
 
 
 class ApplicationSerializer(serializers.ModelSerializer):
@@ -41,20 +121,73 @@ class ApplicationSerializer(serializers.ModelSerializer):
     jobseeker_name = serializers.CharField(source='jobseeker.user.get_full_name', read_only=True)
     jobseeker_username = serializers.CharField(source='jobseeker.user.username', read_only=True)
     company_name = serializers.CharField(source='job.company.company_name', read_only=True)
+    # Only present when the list is ordered by it
+    match_score = serializers.FloatField(read_only=True)
 
     class Meta:
         model = Application
         fields = [
             'id', 'job', 'jobseeker', 'cover_letter', 'applied_at', 'status',
-            'job_title', 'jobseeker_name', 'jobseeker_username', 'company_name'
+            'job_title', 'jobseeker_name', 'jobseeker_username', 'company_name', 'match_score'
         ]
         read_only_fields = [
             'id', 'jobseeker', 'applied_at', 'job_title', 'jobseeker_name', 
             'jobseeker_username', 'company_name'
         ]
+        related_fields = {
+            'job_title': ['job__title'],
+            'jobseeker_name': ['jobseeker__user__first_name', 'jobseeker__user__last_name'],
+            'jobseeker_username': ['jobseeker__user__username'],
+            'company_name': ['job__company__company_name'],
+        }
+
+
+class ApplicantSearchSerializer(ApplicationSerializer):
+    """An application whose applicant's resume matched a keyword search."""
+    resume_rank = serializers.FloatField(read_only=True)
+    snippet = serializers.SerializerMethodField()
+
+    class Meta(ApplicationSerializer.Meta):
+        fields = ApplicationSerializer.Meta.fields + ['resume_rank', 'snippet']
+
+    def get_snippet(self, obj) -> str:
+        # HTML: the resume text is escaped, the matched terms wrapped in <mark>
+        return render_snippet(getattr(obj, 'resume_snippet', ''))
 
 
 class ApplicationStatusUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Application
         fields = ['status']
+
+
+class ApplicationBulkStatusSerializer(serializers.Serializer):
+    """Set ``status`` on the applications in ``ids``, or on those matching ``filter``."""
+    MAX_APPLICATIONS = 1000
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), required=False,
+        allow_empty=False, max_length=MAX_APPLICATIONS,
+    )
+    filter = serializers.DictField(
+        required=False, allow_empty=False, help_text="Same filters as the application list, e.g. {\"job\": 12, \"status\": \"Pending\"}",
+    )
+    status = serializers.ChoiceField(choices=Application.STATUS_CHOICES)
+
+    def validate(self, data):
+        if ('ids' in data) == ('filter' in data):
+            raise serializers.ValidationError("Give either 'ids' or 'filter'.")
+        return data
+
+
+class TalentSerializer(serializers.ModelSerializer):
+    """A jobseeker found by the company talent search."""
+    username = serializers.CharField(source='user.username', read_only=True)
+    matched_count = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = JobSeeker
+        fields = ['id', 'username', 'full_name', 'title', 'location', 'skills', 'matched_count']
+        related_fields = {
+            'username': ['user__username'],
+        }
@@ -0,0 +1,93 @@
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from src.apps.accounts.media import media_updated
+from src.apps.accounts.models import Company, JobSeeker
+from .models import Job
+from .cache import invalidate_jobs
+from .search import get_search_backend
+from .resume_search import get_resume_backend
+from . import matching
+
+
+# ====================================
+#           SEARCH INDEX SYNC
+# ====================================
+
+@receiver(post_save, sender=Job)
+def index_job(sender, instance, raw=False, **kwargs):
+    if not raw:
+        get_search_backend().index_jobs([instance.pk])
+
+
+@receiver(post_delete, sender=Job)
+def unindex_job(sender, instance, **kwargs):
+    get_search_backend().remove_jobs([instance.pk])
+
+
+@receiver(pre_save, sender=Company)
+def note_company_rename(sender, instance, raw=False, update_fields=None, **kwargs):
+    # company_name is part of every job document; logo or tagline edits leave them alone
+    instance._renamed = False
+    if not raw and instance.pk is not None and _touches(update_fields, {'company_name'}):
+        stored = Company.objects.filter(pk=instance.pk).values_list('company_name', flat=True).first()
+        instance._renamed = stored is not None and stored != instance.company_name
+
+
+@receiver(post_save, sender=Company)
+def reindex_company_jobs(sender, instance, raw=False, **kwargs):
+    if not raw and getattr(instance, '_renamed', False):
+        get_search_backend().index_company(instance.pk)
+
+
+@receiver(media_updated)
+def index_resume(sender, kind, object_id, **kwargs):
+    # resume_text is only ever written by the media worker (or cleared for a new upload)
+    if kind == 'resume':
+        get_resume_backend().index_jobseekers([object_id])
+
+
+@receiver(post_delete, sender=JobSeeker)
+def unindex_resume(sender, instance, **kwargs):
+    get_resume_backend().index_jobseekers([instance.pk])
+
+
+# ====================================
+#           RESPONSE CACHE
+# ====================================
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def invalidate_job_cache(sender, instance, **kwargs):
+    # After commit: a read before it would cache the old row under the new generation
+    job_ids = [instance.pk]
+    transaction.on_commit(lambda: invalidate_jobs(job_ids))
+
+
+@receiver(post_save, sender=Company)
+@receiver(post_delete, sender=Company)
+def invalidate_company_job_cache(sender, instance, **kwargs):
+    # Job bodies embed the company's name and id
+    job_ids = list(Job.objects.filter(company_id=instance.pk).values_list('pk', flat=True))
+    transaction.on_commit(lambda: invalidate_jobs(job_ids))
+
+
+# ====================================
+#           SKILL VECTORS
+# ====================================
+
+def _touches(update_fields, fields):
+    return update_fields is None or bool(set(update_fields) & fields)
+
+
+@receiver(post_save, sender=Job)
+def index_job_skills(sender, instance, raw=False, update_fields=None, **kwargs):
+    if not raw and _touches(update_fields, {'title', 'requirements'}):
+        matching.index_jobs([instance.pk])
+
+
+@receiver(post_save, sender=JobSeeker)
+def index_jobseeker_skills(sender, instance, raw=False, update_fields=None, **kwargs):
+    if not raw and _touches(update_fields, {'skills'}):
+        matching.index_jobseekers([instance.pk])
@@ -0,0 +1,183 @@
+"""
+Deterministic synthetic data for benchmarks and local load testing.
+
+``generate()`` writes companies, jobseekers, jobs and applications with
+bulk inserts. The same ``seed`` always produces the same rows. Sizes are
+skewed like production: company sizes and job popularity follow a Zipf
+distribution, so a handful of companies own most of the jobs and a few
+"viral" jobs receive most of the applications.
+
+Every generated user's password is ``SYNTHETIC_PASSWORD``.
+"""
+import random
+from collections import namedtuple
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from src.apps.accounts.models import Company, JobSeeker
+from . import matching
+from .cache import bump_generation
+from .choices import EXPERIENCE_LEVEL_CHOICES, JOB_TYPE_CHOICES, REMOTE_POLICY_CHOICES
+from .models import Job, Application
+from .resume_search import get_resume_backend
+from .search import get_search_backend
+
+SYNTHETIC_PASSWORD = "password"
+BATCH_SIZE = 5000
+
+ROLES = [
+    "Developer", "Engineer", "Designer", "Manager", "Analyst", "Architect",
+    "Consultant", "Administrator", "Scientist", "Specialist", "Writer", "Tester",
+]
+SKILLS = [
+    "React", "Python", "Django", "Java", "Kotlin", "Go", "Rust", "TypeScript",
+    "Node", "AWS", "Kubernetes", "Postgres", "Data", "Security", "Mobile", "DevOps",
+]
+LEVELS = ["Junior", "Mid-level", "Senior", "Lead", "Principal"]
+CITIES = [
+    "Kathmandu", "Pokhara", "Lalitpur", "Bhaktapur", "Biratnagar", "Remote",
+    "San Francisco", "Berlin", "London", "Bangalore", "Singapore", "Toronto",
+]
+COMPANY_NAMES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark", "Wayne", "Tyrell"]
+SALARY_FORMATS = [
+    "${low}k - ${high}k", "NPR {low},000 - {high},000 per month", "€{low}k-{high}k", "Up to ${high}k", "",
+]
+STATUSES = ["Pending", "Pending", "Pending", "Reviewed", "Accepted", "Rejected"]
+
+Dataset = namedtuple("Dataset", "company_users seeker_users companies jobseekers jobs")
+
+
+def zipf_weights(n, exponent):
+    return [1 / (rank ** exponent) for rank in range(1, n + 1)]
+
+
+def _bulk_create(model, objects):
+    created = []
+    for start in range(0, len(objects), BATCH_SIZE):
+        created += model.objects.bulk_create(objects[start:start + BATCH_SIZE])
+    return created
+
+
+def generate(companies=50, jobseekers=2000, jobs=5000, applications=20000, seed=42,
+             prefix="synthetic"):
+    """
+    Bulk-insert a skewed dataset and return a ``Dataset`` of the created
+    users, profiles and jobs, in creation order. Usernames start with
+    ``prefix`` so several datasets can live in one database.
+    """
+    rng = random.Random(seed)
+    User = get_user_model()
+    password = make_password(SYNTHETIC_PASSWORD)
+
+    with transaction.atomic():
+        company_users = _bulk_create(User, [
+            User(username=f"{prefix}-co-{i}", email=f"{prefix}-co-{i}@example.com",
+                 user_type="company", password=password)
+            for i in range(companies)
+        ])
+        company_objs = _bulk_create(Company, [
+            Company(user=user, company_name=f"{rng.choice(COMPANY_NAMES)} {i}",
+                    company_id=f"{prefix.upper()}-{i:06d}", location=rng.choice(CITIES))
+            for i, user in enumerate(company_users)
+        ])
+        seeker_users = _bulk_create(User, [
+            User(username=f"{prefix}-js-{i}", email=f"{prefix}-js-{i}@example.com",
+                 user_type="jobseeker", password=password, first_name="Seeker", last_name=str(i))
+            for i in range(jobseekers)
+        ])
+        seeker_objs = _bulk_create(JobSeeker, [
+            make_jobseeker(user, title=f"{rng.choice(LEVELS)} {rng.choice(ROLES)}",
+                           location=rng.choice(CITIES), skills=rng.sample(SKILLS, rng.randint(2, 6)))
+            for user in seeker_users
+        ])
+
+        owners = []
+        if company_objs:
+            owners = rng.choices(company_objs, weights=zipf_weights(len(company_objs), 1.1), k=jobs)
+        job_objs = _bulk_create(Job, [make_job(rng, company) for company in owners])
+
+        if job_objs and seeker_objs:
+            _bulk_create(Application, make_applications(rng, job_objs, seeker_objs, applications))
+            # applicants_count is normally maintained by ApplicationCreateView
+            counts = (
+                Application.objects.filter(job_id=OuterRef("pk"))
+                .order_by().values("job_id").annotate(rows=Count("id")).values("rows")
+            )
+            Job.objects.filter(company__in=company_objs).update(
+                applicants_count=Coalesce(Subquery(counts), 0)
+            )
+
+        get_search_backend().rebuild()
+        get_resume_backend().rebuild()
+        matching.rebuild()
+    bump_generation()
+
+    return Dataset(company_users, seeker_users, company_objs, seeker_objs, job_objs)
+
+
+def make_jobseeker(user, title, location, skills):
+    # resume_text as the media worker would have extracted it; no extra
+    # random draws, so existing seeds keep producing the same rows
+    resume = (
+        f"{title} based in {location}. Skills: {', '.join(skills)}. "
+        + " ".join(f"Shipped production {skill} work across several teams." for skill in skills)
+    )
+    return JobSeeker(user=user, title=title, location=location, skills=skills, resume_text=resume)
+
+
+def make_job(rng, company):
+    skill, role, level = rng.choice(SKILLS), rng.choice(ROLES), rng.choice(LEVELS)
+    words = rng.sample(SKILLS, 4) + rng.sample(ROLES, 3)
+    low = rng.randrange(30, 150, 5)
+    posted = date(2025, 1, 1) + timedelta(days=rng.randrange(365))
+    job = Job(
+        company=company,
+        title=f"{level} {skill} {role}",
+        description=" ".join(f"We use {word} daily and value ownership." for word in words),
+        salary=rng.choice(SALARY_FORMATS).format(low=low, high=low + rng.randrange(10, 80, 5)),
+        location=rng.choice(CITIES),
+        job_type=rng.choice(JOB_TYPE_CHOICES)[0],
+        experience_level=rng.choice(EXPERIENCE_LEVEL_CHOICES)[0],
+        remote_policy=rng.choice(REMOTE_POLICY_CHOICES)[0],
+        requirements=[f"{rng.randint(1, 8)}+ years of {skill}"] + rng.sample(SKILLS, 3),
+        urgent=rng.random() < 0.1,
+        posted=posted,
+        # Fixed dates keep the data reproducible; open-ended jobs stay open
+        application_deadline=None if rng.random() < 0.3 else posted + timedelta(days=rng.randrange(14, 90)),
+    )
+    job.update_salary_range()
+    return job
+
+
+def make_applications(rng, jobs, seekers, total):
+    """Unique (job, jobseeker) pairs; job popularity and seeker activity are Zipf-skewed."""
+    total = min(total, len(jobs) * len(seekers))
+    # Shuffled so the viral jobs aren't simply the oldest ones
+    popular_jobs = rng.sample(jobs, len(jobs))
+    active_seekers = rng.sample(seekers, len(seekers))
+    job_weights = zipf_weights(len(jobs), 1.0)
+    seeker_weights = zipf_weights(len(seekers), 0.6)
+
+    pairs = set()
+    applications = []
+    # Near saturation most draws are repeats; settle for fewer rows then
+    for _ in range(50):
+        wanted = total - len(applications)
+        if not wanted:
+            break
+        for job, seeker in zip(
+            rng.choices(popular_jobs, weights=job_weights, k=wanted),
+            rng.choices(active_seekers, weights=seeker_weights, k=wanted),
+        ):
+            if (job.pk, seeker.pk) in pairs:
+                continue
+            pairs.add((job.pk, seeker.pk))
+            applications.append(Application(
+                job=job, jobseeker=seeker, cover_letter="Synthetic application", status=rng.choice(STATUSES),
+            ))
+    return applications
@@ -1,3 +1,109 @@
-from django.test import TestCase
+import logging
+from concurrent.futures import ThreadPoolExecutor
 
-# Create your tests here.
+from django.db import connection
+from django.test import Client, TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+
+from src.apps.accounts.models import Company, JobSeeker, User
+from .benchmarks import auth_headers
+from .management.commands.check_query_counts import ENDPOINTS
+from .models import Job, Application
+
+
+@override_settings(JOB_RESPONSE_CACHE_TIMEOUT=0)
+class QueryCountTests(TestCase):
+    """Every read endpoint runs its budgeted number of queries, whatever the page size."""
+
+    rows = 60
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.company_user = User.objects.create_user(
+            username="qc-company", email="qc-company@example.com", password="password", user_type="company",
+        )
+        cls.seeker_user = User.objects.create_user(
+            username="qc-seeker", email="qc-seeker@example.com", password="password", user_type="jobseeker",
+        )
+        company = Company.objects.create(user=cls.company_user, company_name="QC Corp")
+        seeker = JobSeeker.objects.create(user=cls.seeker_user)
+        jobs = Job.objects.bulk_create(
+            Job(company=company, title=f"Job {i}", description="Query count fixture") for i in range(cls.rows)
+        )
+        Application.objects.bulk_create(
+            Application(job=job, jobseeker=seeker, cover_letter="Hello") for job in jobs
+        )
+        cls.job = jobs[0]
+
+    def test_endpoints(self):
+        callers = {"company": self.company_user, "jobseeker": self.seeker_user}
+        for name, caller, needs_pk, budget in ENDPOINTS:
+            url = reverse(name, kwargs={"pk": self.job.pk} if needs_pk else None)
+            headers = auth_headers(callers[caller]) if caller else {}
+            # Authenticates the caller once, as any earlier request would
+            self.client.get(url, **headers)
+            for page_size in ("1", "50"):
+                with self.subTest(endpoint=name, page_size=page_size), self.assertNumQueries(budget):
+                    response = self.client.get(url, {"page_size": page_size}, **headers)
+                    self.assertEqual(response.status_code, 200)
+
+
+class ApplyTests(TransactionTestCase):
+    """Applies are atomic: one application per jobseeker and an exact applicants_count."""
+
+    seekers = 8
+    attempts = 3
+
+    def setUp(self):
+        company_user = User.objects.create_user(
+            username="apply-company", email="apply-company@example.com", password="password", user_type="company",
+        )
+        company = Company.objects.create(user=company_user, company_name="Viral Corp")
+        self.job = Job.objects.create(company=company, title="Viral posting", description="Everyone applies")
+        users = [
+            User.objects.create_user(
+                username=f"apply-seeker-{i}", email=f"apply-seeker-{i}@example.com",
+                password="password", user_type="jobseeker",
+            )
+            for i in range(self.seekers)
+        ]
+        for user in users:
+            JobSeeker.objects.create(user=user)
+        self.headers = [auth_headers(user) for user in users]
+        # Rejected duplicates are expected; don't log a warning for each one
+        request_logger = logging.getLogger("django.request")
+        self.addCleanup(request_logger.setLevel, request_logger.level)
+        request_logger.setLevel(logging.ERROR)
+
+    def apply(self, headers):
+        return Client().post(
+            reverse("apply-job"), {"job": self.job.pk, "cover_letter": "Hello"},
+            content_type="application/json", **headers,
+        )
+
+    def assert_counts(self, statuses):
+        self.assertEqual(statuses.count(201), self.seekers)
+        self.assertEqual(statuses.count(400), len(statuses) - self.seekers)
+        self.assertEqual(Application.objects.filter(job=self.job).count(), self.seekers)
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.applicants_count, self.seekers)
+
+    def test_duplicate_apply_is_rejected(self):
+        statuses = [self.apply(headers).status_code for _ in range(self.attempts) for headers in self.headers]
+        self.assert_counts(statuses)
+
+    def test_concurrent_applies(self):
+        if connection.vendor == "sqlite" and connection.is_in_memory_db():
+            self.skipTest("an in-memory SQLite database can't take concurrent writers")
+
+        def apply(headers):
+            try:
+                return self.apply(headers).status_code
+            finally:
+                connection.close()
+
+        # Interleave the seekers so the same one's retries race each other
+        requests = [headers for _ in range(self.attempts) for headers in self.headers]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            statuses = list(pool.map(apply, requests))
+        self.assert_counts(statuses)
@@ -1,21 +1,39 @@
+from django.conf import settings
 from django.urls import path
+from . import async_views
 from .views import (
     JobListView,
+    JobFacetsView,
+    JobCacheStatsView,
     JobDetailView,
+    RecommendedJobsView,
     CompanyJobListView,
     CompanyJobCreateView,
     CompanyJobDetailView,
     CompanyJobUpdateView,
     CompanyJobDeleteView,
+    TalentSearchView,
     ApplicationCreateView,
     ApplicationListView,
+    ApplicantSearchView,
+    ApplicationExportView,
     ApplicationUpdateView,
+    ApplicationBulkStatusView,
     MyApplicationsListView,
 )
 
+if getattr(settings, "JOB_ASYNC_VIEWS", False):
+    # Serve the public reads from their async versions (see async_views.py)
+    JobListView = async_views.JobListView
+    JobFacetsView = async_views.JobFacetsView
+    JobDetailView = async_views.JobDetailView
+
 urlpatterns = [
     # Public / jobseeker endpoints
     path("", JobListView.as_view(), name="job-list"),
+    path("facets/", JobFacetsView.as_view(), name="job-facets"),
+    path("cache-stats/", JobCacheStatsView.as_view(), name="job-cache-stats"),
+    path("recommended/", RecommendedJobsView.as_view(), name="job-recommendations"),
     path("<int:pk>/", JobDetailView.as_view(), name="job-detail"),
 
     # Company endpoints
@@ -24,10 +42,14 @@ urlpatterns = [
     path("company/<int:pk>/", CompanyJobDetailView.as_view(), name="company-job-detail"),
     path("company/<int:pk>/update/", CompanyJobUpdateView.as_view(), name="company-job-update"),
     path("company/<int:pk>/delete/", CompanyJobDeleteView.as_view(), name="company-job-delete"),
+    path("talent/", TalentSearchView.as_view(), name="talent-search"),
 
     # Applications
     path("apply/", ApplicationCreateView.as_view(), name="apply-job"),
     path("applications/", ApplicationListView.as_view(), name="application-list"),
+    path("applications/search/", ApplicantSearchView.as_view(), name="applicant-search"),
+    path("applications/export/", ApplicationExportView.as_view(), name="application-export"),
     path("applications/<int:pk>/update/", ApplicationUpdateView.as_view(), name="application-update"),
+    path("applications/bulk-update/", ApplicationBulkStatusView.as_view(), name="application-bulk-update"),
     path("my-applications/", MyApplicationsListView.as_view(), name="my-applications"),
 ]
@@ -1,13 +1,45 @@
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 from rest_framework import generics, status, filters
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
-from drf_spectacular.utils import extend_schema
+from django_filters.utils import translate_validation
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 from .models import Job, Application
-from .serializers import JobSerializer, ApplicationSerializer, ApplicationStatusUpdateSerializer
+from .serializers import (
+    JobSerializer, JobMatchSerializer, ApplicationSerializer, ApplicationStatusUpdateSerializer,
+    ApplicationBulkStatusSerializer, ApplicantSearchSerializer, TalentSerializer,
+)
 from .permissions import IsCompanyUser, IsJobSeekerUser, IsJobOwner, IsApplicationOwner
-from .pagination import JobPagination, ApplicationPagination
-from .filters import JobFilter
+from .pagination import JobPagination, ApplicationPagination, ApplicantSearchPagination, TalentPagination
+from .filters import JobFilter, JobSearchFilter, AliasedOrderingFilter
+from .querysets import QueryShapeMixin, SparseFieldsMixin
+from .fastpath import FastSerializationMixin
+from .facets import facet_cache_key, facet_counts
+from .conditional import ConditionalGetMixin
+from .cache import (
+    ResponseCacheMixin, detail_key, get_cache, get_summary, invalidate_jobs, listing_key, reset_stats,
+)
+from .renderers import CSVRenderer, NDJSONRenderer
+from .resume_search import get_resume_backend
+from .search import parse_terms
+from .matching import (
+    application_match_score, find_jobseekers, matched_skills, normalize_skills, recommend_jobs,
+)
+
+FIELDS_PARAMETERS = [
+    OpenApiParameter('fields', str, description=(
+        'Comma-separated fields to return, or a fieldset: "card" (the list default: no description '
+        'or JSON blobs) or "full"'
+    )),
+    OpenApiParameter('omit', str, description='Comma-separated fields to leave out'),
+]
 
 # ====================================
 #           JOBS (Public / All)
@@ -17,36 +49,106 @@ from .filters import JobFilter
     tags=["Jobs"],
     summary="List all jobs",
     description="Jobseekers can view all job posts across companies.",
+    parameters=FIELDS_PARAMETERS,
     responses={200: JobSerializer}
 )
-class JobListView(generics.ListAPIView):
+class JobListView(ResponseCacheMixin, FastSerializationMixin, SparseFieldsMixin, generics.ListAPIView):
     serializer_class = JobSerializer
+    default_fieldset = 'card'
     pagination_class = JobPagination
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, AliasedOrderingFilter, JobSearchFilter]
     filterset_class = JobFilter
-    search_fields = ['title', 'description', 'location', 'company__company_name']
-    ordering_fields = ['created_at', 'salary', 'posted', 'applicants_count']
+    ordering_fields = ['created_at', 'salary', 'salary_min', 'salary_max', 'posted', 'applicants_count']
+    ordering_aliases = {'salary': 'salary_min'}
     ordering = ['-created_at']
 
     def get_queryset(self):
         return Job.objects.all()
 
+    def get_cache_key(self, request):
+        return listing_key('job-list', request)
+
     def get_serializer_context(self):
         context = super().get_serializer_context()
         context['request'] = self.request
         return context
 
 
+@extend_schema(
+    tags=["Jobs"],
+    summary="Facet counts for a job search",
+    description=(
+        "Counts per job_type, experience_level, remote_policy, location and urgent "
+        "for the jobs matching the same filters and search as the job list. "
+        "Each facet ignores its own filter."
+    ),
+    responses={200: OpenApiTypes.OBJECT}
+)
+class JobFacetsView(generics.GenericAPIView):
+    filter_backends = [DjangoFilterBackend, JobSearchFilter]
+    filterset_class = JobFilter
+    pagination_class = None
+
+    def get_queryset(self):
+        return Job.objects.all()
+
+    def get(self, request, *args, **kwargs):
+        queryset = self.get_queryset()
+        filterset = DjangoFilterBackend().get_filterset(request, queryset, self)
+        if not filterset.is_valid():
+            raise translate_validation(filterset.errors)
+
+        cache = get_cache()
+        query = request.query_params.get(JobSearchFilter.search_param, '')
+        key = facet_cache_key(filterset, query)
+        facets = cache.get(key)
+        if facets is None:
+            facets = facet_counts(queryset, request.query_params, self.filterset_class)
+            cache.set(key, facets, getattr(settings, 'JOB_FACETS_CACHE_TIMEOUT', 60))
+        return Response({'facets': facets})
+
+
+@extend_schema(
+    tags=["Jobs"],
+    summary="Response cache counters (staff)",
+    description=(
+        "Hits and misses of the job list/detail response cache since the last reset, as counted "
+        "in the job cache. With the default per-process cache these are the serving process's "
+        "own counters. DELETE zeroes them."
+    ),
+    responses={200: OpenApiTypes.OBJECT}
+)
+class JobCacheStatsView(generics.GenericAPIView):
+    permission_classes = [IsAdminUser]
+    pagination_class = None
+
+    def get(self, request, *args, **kwargs):
+        return Response(get_summary())
+
+    def delete(self, request, *args, **kwargs):
+        reset_stats()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
 @extend_schema(
     tags=["Jobs"],
     summary="Retrieve a job",
     description="Retrieve details of a specific job (public view).",
+    parameters=FIELDS_PARAMETERS,
     responses={200: JobSerializer}
 )
-class JobDetailView(generics.RetrieveAPIView):
+class JobDetailView(ConditionalGetMixin, ResponseCacheMixin, FastSerializationMixin, SparseFieldsMixin,
+                    generics.RetrieveAPIView):
     queryset = Job.objects.all()
     serializer_class = JobSerializer
     permission_classes = [IsAuthenticated]
+    last_modified_fields = ('updated_at', 'company__updated_at')
+
+    def get_cache_key(self, request):
+        if self.get_field_names() is not None:
+            # Field selections are cached like listings, by generation
+            return listing_key('job-detail', request)
+        return detail_key(self.kwargs['pk'])
 
 # ====================================
 #           COMPANY JOBS
@@ -56,15 +158,18 @@ class JobDetailView(generics.RetrieveAPIView):
     tags=["Company Jobs"],
     summary="List all jobs for current company",
     description="Returns only jobs created by the authenticated company.",
+    parameters=FIELDS_PARAMETERS,
     responses={200: JobSerializer}
 )
-class CompanyJobListView(generics.ListAPIView):
+class CompanyJobListView(ConditionalGetMixin, FastSerializationMixin, SparseFieldsMixin, generics.ListAPIView):
     serializer_class = JobSerializer
+    default_fieldset = 'card'
     permission_classes = [IsCompanyUser]
     pagination_class = JobPagination
+    last_modified_fields = ('updated_at', 'company__updated_at')
 
     def get_queryset(self):
-        return Job.objects.filter(company=self.request.user.company_profile)
+        return Job.objects.filter(company=self.request.user.company_profile).order_by('-created_at')
 
 @extend_schema(
     tags=["Company Jobs"],
@@ -84,9 +189,10 @@ class CompanyJobCreateView(generics.CreateAPIView):
     tags=["Company Jobs"],
     summary="Retrieve a job for company",
     description="Get job details only if it belongs to the authenticated company.",
+    parameters=FIELDS_PARAMETERS,
     responses={200: JobSerializer}
 )
-class CompanyJobDetailView(generics.RetrieveAPIView):
+class CompanyJobDetailView(SparseFieldsMixin, generics.RetrieveAPIView):
     serializer_class = JobSerializer
     permission_classes = [IsCompanyUser, IsJobOwner]
 
@@ -100,7 +206,7 @@ class CompanyJobDetailView(generics.RetrieveAPIView):
     request=JobSerializer,
     responses={200: JobSerializer}
 )
-class CompanyJobUpdateView(generics.UpdateAPIView):
+class CompanyJobUpdateView(QueryShapeMixin, generics.UpdateAPIView):
     serializer_class = JobSerializer
     permission_classes = [IsCompanyUser, IsJobOwner]
 
@@ -120,6 +226,34 @@ class CompanyJobDeleteView(generics.DestroyAPIView):
     def get_queryset(self):
         return Job.objects.filter(company=self.request.user.company_profile)
 
+@extend_schema(
+    tags=["Company Jobs"],
+    summary="Search jobseekers by skill (company)",
+    description=(
+        "Jobseekers with all (`match=all`, default) or any (`match=any`) of the comma-separated "
+        "`skills`, most matched skills first."
+    ),
+    parameters=[
+        OpenApiParameter('skills', str, required=True, description='Comma-separated skills, e.g. python,django'),
+        OpenApiParameter('match', str, enum=['all', 'any'], description='Require all skills (default) or any'),
+    ],
+    responses={200: TalentSerializer}
+)
+class TalentSearchView(QueryShapeMixin, generics.ListAPIView):
+    serializer_class = TalentSerializer
+    permission_classes = [IsCompanyUser]
+    pagination_class = TalentPagination
+
+    def get_queryset(self):
+        names = normalize_skills(self.request.query_params.get('skills', '').split(','))
+        if not names:
+            raise ValidationError({'skills': ['Give at least one skill.']})
+        match = self.request.query_params.get('match', 'all')
+        if match not in ('all', 'any'):
+            raise ValidationError({'match': ["Use 'all' or 'any'."]})
+        return find_jobseekers(names, match_all=match == 'all')
+
+
 # ====================================
 #           APPLICATIONS
 # ====================================
@@ -139,19 +273,31 @@ class ApplicationCreateView(generics.CreateAPIView):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        job = serializer.validated_data['job']
-        if Application.objects.filter(job=job, jobseeker=request.user.jobseeker_profile).exists():
+        try:
+            self.perform_create(serializer)
+        except IntegrityError:
+            job = serializer.validated_data['job']
+            if not Application.objects.filter(job=job, jobseeker=request.user.jobseeker_profile).exists():
+                raise
             return Response(
                 {"error": "You have already applied for this job."},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        self.perform_create(serializer)
         headers = self.get_success_headers(serializer.data)
         return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
 
     def perform_create(self, serializer):
-        serializer.save(jobseeker=self.request.user.jobseeker_profile)
+        # The unique (job, jobseeker) constraint rejects duplicates, even from
+        # concurrent requests, and the counter is incremented in SQL. The
+        # insert runs first so the job row is locked only until the commit.
+        with transaction.atomic():
+            application = serializer.save(jobseeker=self.request.user.jobseeker_profile)
+            Job.objects.filter(pk=application.job_id).update(
+                applicants_count=F('applicants_count') + 1, updated_at=timezone.now()
+            )
+        # update() doesn't send post_save
+        invalidate_jobs([application.job_id])
 
 @extend_schema(
     tags=["Applications"],
@@ -159,18 +305,131 @@ class ApplicationCreateView(generics.CreateAPIView):
     description="Company users can view applications only for their jobs.",
     responses={200: ApplicationSerializer}
 )
-class ApplicationListView(generics.ListAPIView):
+class ApplicationListView(QueryShapeMixin, generics.ListAPIView):
     serializer_class = ApplicationSerializer
     pagination_class = ApplicationPagination
     permission_classes = [IsCompanyUser]
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['job', 'status']
-    ordering_fields = ['applied_at', 'status']
+    # ?ordering=-match_score lists the best-matching applicants first; being
+    # computed, it pages by number only (cursor mode answers 400)
+    ordering_fields = ['applied_at', 'status', 'match_score']
     ordering = ['-applied_at']
 
+    def get_queryset(self):
+        queryset = Application.objects.filter(job__company=self.request.user.company_profile)
+        ordering = filters.OrderingFilter().get_ordering(self.request, queryset, self) or []
+        if any(field.lstrip('-') == 'match_score' for field in ordering):
+            queryset = queryset.annotate(match_score=application_match_score())
+        return queryset
+
+
+@extend_schema(
+    tags=["Applications"],
+    summary="Search applicants by resume (company)",
+    description=(
+        "Company users search the resumes of everyone who applied to their jobs. Every "
+        "keyword must match (prefixes count). Results are best match first, each with an "
+        "HTML `snippet` of the resume in which the matches are wrapped in `<mark>`. Takes "
+        "the `job` and `status` filters of the application list."
+    ),
+    parameters=[
+        OpenApiParameter('search', str, required=True, description='Resume keywords, e.g. "django aws"'),
+    ],
+    responses={200: ApplicantSearchSerializer}
+)
+class ApplicantSearchView(QueryShapeMixin, generics.ListAPIView):
+    serializer_class = ApplicantSearchSerializer
+    permission_classes = [IsCompanyUser]
+    pagination_class = ApplicantSearchPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ['job', 'status']
+
+    def get_query(self):
+        query = self.request.query_params.get('search', '')
+        if not parse_terms(query):
+            raise ValidationError({'search': ['Give at least one keyword.']})
+        return query
+
+    def get_queryset(self):
+        queryset = Application.objects.filter(job__company=self.request.user.company_profile)
+        return get_resume_backend().search(queryset, self.get_query()).order_by('resume_rank', '-applied_at')
+
+    def paginate_queryset(self, queryset):
+        # Snippets for the page only, in one query
+        page = super().paginate_queryset(queryset)
+        snippets = get_resume_backend().snippets({row.jobseeker_id for row in page}, self.get_query())
+        for application in page:
+            application.resume_snippet = snippets.get(application.jobseeker_id, '')
+        return page
+
+
+@extend_schema(
+    tags=["Applications"],
+    summary="Export job applications (company)",
+    description=(
+        "Streams every application for the company's jobs as NDJSON (default) or CSV "
+        "(`?format=csv` or `Accept: text/csv`). Takes the same `job` and `status` filters "
+        "as the application list."
+    ),
+    responses={(200, 'application/x-ndjson'): OpenApiTypes.STR, (200, 'text/csv'): OpenApiTypes.STR},
+)
+class ApplicationExportView(generics.GenericAPIView):
+    permission_classes = [IsCompanyUser]
+    renderer_classes = [NDJSONRenderer, CSVRenderer]
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ['job', 'status']
+    pagination_class = None
+    # Same columns as ApplicationSerializer
+    export_fields = [
+        'id', 'job', 'jobseeker', 'cover_letter', 'applied_at', 'status',
+        'job_title', 'jobseeker_name', 'jobseeker_username', 'company_name',
+    ]
+    chunk_size = 2000
+
     def get_queryset(self):
         return Application.objects.filter(job__company=self.request.user.company_profile)
 
+    def get(self, request, *args, **kwargs):
+        # Filter up front: a bad filter must be a 400, not an error mid-stream
+        queryset = self.filter_queryset(self.get_queryset())
+        renderer = request.accepted_renderer
+        response = StreamingHttpResponse(
+            renderer.stream(self.export_rows(queryset), self.export_fields),
+            content_type=f'{renderer.media_type}; charset=utf-8',
+        )
+        response['Content-Disposition'] = f'attachment; filename="applications.{renderer.format}"'
+        return response
+
+    def export_rows(self, queryset):
+        """
+        Plain rows from a server-side cursor (``iterator()``), so memory
+        stays flat however many applications the company has.
+        """
+        rows = (
+            queryset.order_by('pk')
+            .values_list(
+                'id', 'job_id', 'jobseeker_id', 'cover_letter', 'applied_at', 'status', 'job__title',
+                'jobseeker__user__first_name', 'jobseeker__user__last_name', 'jobseeker__user__username',
+                'job__company__company_name',
+            )
+        )
+        for (pk, job, jobseeker, cover_letter, applied_at, app_status, job_title,
+             first_name, last_name, username, company_name) in rows.iterator(chunk_size=self.chunk_size):
+            yield {
+                'id': pk,
+                'job': job,
+                'jobseeker': jobseeker,
+                'cover_letter': cover_letter,
+                'applied_at': applied_at,
+                'status': app_status,
+                'job_title': job_title,
+                # As User.get_full_name()
+                'jobseeker_name': f'{first_name} {last_name}'.strip(),
+                'jobseeker_username': username,
+                'company_name': company_name,
+            }
+
 @extend_schema(
     tags=["Applications"],
     summary="Update application status",
@@ -178,7 +437,7 @@ class ApplicationListView(generics.ListAPIView):
     request=ApplicationStatusUpdateSerializer,
     responses={200: ApplicationSerializer}
 )
-class ApplicationUpdateView(generics.UpdateAPIView):
+class ApplicationUpdateView(QueryShapeMixin, generics.UpdateAPIView):
     queryset = Application.objects.all()
     serializer_class = ApplicationSerializer  # full serializer for response
     permission_classes = [IsCompanyUser, IsApplicationOwner]
@@ -203,16 +462,136 @@ class ApplicationUpdateView(generics.UpdateAPIView):
         full_serializer = self.get_serializer(instance)
         return Response(full_serializer.data, status=status.HTTP_200_OK)
     
+@extend_schema(
+    tags=["Applications"],
+    summary="Update many application statuses",
+    description=(
+        "Company users set one status on up to 1000 of their applications, chosen by `ids` "
+        "or by `filter` (`job`, `status`). Each id is reported as `updated`, `unchanged` "
+        "or `not_found`; other companies' applications count as not found."
+    ),
+    request=ApplicationBulkStatusSerializer,
+    responses={200: OpenApiTypes.OBJECT}
+)
+class ApplicationBulkStatusView(generics.GenericAPIView):
+    serializer_class = ApplicationBulkStatusSerializer
+    permission_classes = [IsCompanyUser]
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ['job', 'status']
+    pagination_class = None
+
+    def get_queryset(self):
+        return Application.objects.filter(job__company=self.request.user.company_profile)
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        new_status = serializer.validated_data['status']
+        requested = serializer.validated_data.get('ids')
+        if requested is None:
+            targets = self.filter_by(self.get_queryset(), serializer.validated_data['filter'])
+        else:
+            targets = self.get_queryset().filter(pk__in=requested)
+
+        limit = serializer.MAX_APPLICATIONS
+        with transaction.atomic():
+            # One query checks ownership for every id: other companies' rows don't match
+            current = dict(targets.order_by('pk').values_list('pk', 'status')[:limit + 1])
+            if len(current) > limit:
+                raise ValidationError({'filter': [f'Matches more than {limit} applications; narrow it down.']})
+            changed = [pk for pk, old_status in current.items() if old_status != new_status]
+            if changed:
+                # update() skips auto_now; updated_at drives the my-applications ETag
+                self.get_queryset().filter(pk__in=changed).update(status=new_status, updated_at=timezone.now())
+
+        changed = set(changed)
+        outcomes = []
+        for pk in (requested if requested is not None else current):
+            if pk in changed:
+                outcome = 'updated'
+            elif pk in current:
+                outcome = 'unchanged'
+            else:
+                outcome = 'not_found'
+            outcomes.append({'id': pk, 'outcome': outcome})
+        return Response({'status': new_status, 'updated': len(changed), 'results': outcomes})
+
+    def filter_by(self, queryset, filters):
+        unknown = set(filters) - set(self.filterset_fields)
+        if unknown:
+            raise ValidationError({'filter': [f"Unknown filter '{name}'." for name in sorted(unknown)]})
+        filterset_class = DjangoFilterBackend().get_filterset_class(self, queryset)
+        filterset = filterset_class(data=filters, queryset=queryset, request=self.request)
+        if not filterset.is_valid():
+            raise translate_validation(filterset.errors)
+        return filterset.qs
+
+
 @extend_schema(
     tags=["Applications"],
     summary="List my applications",
     description="Jobseekers can view all applications they submitted.",
     responses={200: ApplicationSerializer}
 )
-class MyApplicationsListView(generics.ListAPIView):
+class MyApplicationsListView(ConditionalGetMixin, QueryShapeMixin, generics.ListAPIView):
     serializer_class = ApplicationSerializer
     permission_classes = [IsJobSeekerUser]
     pagination_class = ApplicationPagination
+    last_modified_fields = ('updated_at', 'job__updated_at', 'job__company__updated_at')
+
+    def get_queryset(self):
+        return Application.objects.filter(jobseeker=self.request.user.jobseeker_profile).order_by('-applied_at')
+
+
+# ====================================
+#           RECOMMENDATIONS
+# ====================================
+
+@extend_schema(
+    tags=["Jobs"],
+    summary="Recommended jobs (jobseeker)",
+    description=(
+        "Open jobs that best match the jobseeker's skills, best first, leaving out jobs "
+        "they already applied to. `match_score` is the share of the job's skills they have."
+    ),
+    parameters=[
+        OpenApiParameter('limit', int, description='Number of jobs (default 20, at most 100)'),
+        *FIELDS_PARAMETERS,
+    ],
+    responses={200: JobMatchSerializer(many=True)}
+)
+class RecommendedJobsView(SparseFieldsMixin, generics.ListAPIView):
+    serializer_class = JobMatchSerializer
+    default_fieldset = 'card'
+    permission_classes = [IsJobSeekerUser]
+    pagination_class = None
+    filter_backends = []
+    default_limit = 20
+    max_limit = 100
 
     def get_queryset(self):
-        return Application.objects.filter(jobseeker=self.request.user.jobseeker_profile)
+        return Job.objects.all()
+
+    def list(self, request, *args, **kwargs):
+        jobseeker = request.user.jobseeker_profile
+        scores = dict(recommend_jobs(jobseeker, self.get_limit()))
+        jobs = self.filter_queryset(self.get_queryset()).in_bulk(list(scores))
+        matched = matched_skills(jobseeker, list(scores))
+
+        results = []
+        for job_id, score in scores.items():
+            job = jobs.get(job_id)
+            if job is None:
+                # Deleted since it was scored
+                continue
+            job.match_score = round(score, 4)
+            job.matched_skills = matched.get(job_id, [])
+            results.append(job)
+        return Response(self.get_serializer(results, many=True).data)
+
+    def get_limit(self):
+        try:
+            limit = int(self.request.query_params.get('limit', self.default_limit))
+        except ValueError:
+            raise ValidationError({'limit': ['A valid integer is required.']})
+        return max(1, min(limit, self.max_limit))